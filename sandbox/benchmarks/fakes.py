@@ -0,0 +1,107 @@
+"""
+Local stand-ins for the upstream services, so benchmarks run offline.
+
+FakeAskBillServer speaks the AskBill websocket protocol and answers every
+question with a configurable number of frames. FakePlaidServer serves the
+Plaid sandbox endpoints the tools call over real local HTTP, so the Plaid
+client's serialization and connection handling are part of the measurement.
+"""
+
+import asyncio
+import itertools
+import json
+
+import uvicorn
+import websockets
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+class FakeAskBillServer:
+    """Local websocket server answering questions in many small frames."""
+
+    def __init__(self, answer_frames: int = 50, sources: int = 10):
+        self.answer_frames = answer_frames
+        self.sources = [
+            {"url": f"https://plaid.com/docs/api/products/{i}/", "title": f"Product {i}"} for i in range(sources)
+        ]
+        self.server = None
+        self.uri = None
+
+    async def _handle(self, websocket):
+        async for message in websocket:
+            question = json.loads(message)
+            question_id = question["question_id"]
+            await websocket.send(json.dumps({"type": "sources", "sources": self.sources, "question_id": question_id}))
+            for i in range(self.answer_frames):
+                await websocket.send(json.dumps({"type": "answer", "ans": f"token{i} ", "question_id": question_id}))
+            await websocket.send(json.dumps({"type": "status", "status": "finished", "question_id": question_id}))
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.uri = f"ws://127.0.0.1:{port}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class FakePlaidServer:
+    """Local HTTP server implementing the Plaid sandbox endpoints used by the tools."""
+
+    def __init__(self):
+        self._counter = itertools.count(1)
+        self.host = None
+        self._uvicorn = None
+        self._task = None
+
+    async def _public_token_create(self, request: Request) -> JSONResponse:
+        return JSONResponse({"public_token": f"public-sandbox-{next(self._counter)}", "request_id": "req"})
+
+    async def _public_token_exchange(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        number = body["public_token"].rsplit("-", 1)[1]
+        return JSONResponse({"access_token": f"access-sandbox-{number}", "item_id": f"item-{number}", "request_id": "req"})
+
+    async def _auth_get(self, request: Request) -> JSONResponse:
+        accounts = [
+            {
+                "account_id": f"acc-{i}",
+                "balances": {"available": 100.0, "current": 110.0, "iso_currency_code": "USD"},
+                "mask": f"000{i}",
+                "name": f"Plaid Account {i}",
+                "official_name": f"Plaid Gold Standard {i}",
+                "subtype": "checking",
+                "type": "depository",
+            }
+            for i in range(8)
+        ]
+        numbers = {"ach": [{"account_id": "acc-0", "account": "1111222233330000", "routing": "011401533"}]}
+        return JSONResponse({"accounts": accounts, "numbers": numbers, "item": {"item_id": "item"}, "request_id": "req"})
+
+    async def _fire_webhook(self, request: Request) -> JSONResponse:
+        return JSONResponse({"webhook_fired": True, "request_id": "req"})
+
+    async def __aenter__(self):
+        app = Starlette(routes=[
+            Route("/sandbox/public_token/create", self._public_token_create, methods=["POST"]),
+            Route("/item/public_token/exchange", self._public_token_exchange, methods=["POST"]),
+            Route("/auth/get", self._auth_get, methods=["POST"]),
+            Route("/sandbox/item/fire_webhook", self._fire_webhook, methods=["POST"]),
+        ])
+        config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        self._uvicorn = uvicorn.Server(config)
+        self._task = asyncio.create_task(self._uvicorn.serve())
+        while not self._uvicorn.started:
+            await asyncio.sleep(0.01)
+        port = self._uvicorn.servers[0].sockets[0].getsockname()[1]
+        self.host = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._uvicorn.should_exit = True
+        await self._task
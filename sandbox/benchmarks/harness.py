@@ -0,0 +1,191 @@
+"""
+Timing and reporting helpers for the benchmark suite.
+
+Each benchmark is timed over several rounds, and its fastest, median and 95th
+percentile time per operation are recorded. Results are saved as JSON and
+compared against a stored baseline: a benchmark regresses when its fastest
+round is slower than the baseline's by more than the allowed threshold. The
+fastest round is used because scheduling noise only ever adds time, which
+makes it far steadier than the median for microsecond-scale benchmarks.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+RESULTS_VERSION = 1
+# Fraction by which the fastest round may exceed the baseline before it counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark, in seconds per operation."""
+
+    name: str
+    median: float
+    p95: float
+    rounds: int
+    ops_per_round: int
+    min: float
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1.0 / self.median if self.median else float("inf")
+
+
+def _summarize(name: str, samples: List[float], ops_per_round: int) -> BenchmarkResult:
+    per_op = sorted(sample / ops_per_round for sample in samples)
+    p95_index = min(len(per_op) - 1, round(0.95 * (len(per_op) - 1)))
+    return BenchmarkResult(
+        name, statistics.median(per_op), per_op[p95_index], len(per_op), ops_per_round, per_op[0]
+    )
+
+
+def measure(name: str, func: Callable[[], Any], rounds: int = 20, ops_per_round: int = 1) -> BenchmarkResult:
+    """
+    Time a synchronous function.
+
+    Args:
+        name: Benchmark name
+        func: Function performing ops_per_round operations per call
+        rounds: Number of timed calls, after one untimed warm-up call
+        ops_per_round: Number of operations one call performs
+
+    Returns:
+        The benchmark result
+    """
+    func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return _summarize(name, samples, ops_per_round)
+
+
+async def measure_async(
+        name: str, func: Callable[[], Awaitable[Any]], rounds: int = 20, ops_per_round: int = 1
+) -> BenchmarkResult:
+    """
+    Time a coroutine function.
+
+    Args:
+        name: Benchmark name
+        func: Coroutine function performing ops_per_round operations per call
+        rounds: Number of timed calls, after one untimed warm-up call
+        ops_per_round: Number of operations one call performs
+
+    Returns:
+        The benchmark result
+    """
+    await func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return _summarize(name, samples, ops_per_round)
+
+
+def save_results(
+        results: List[BenchmarkResult], path: Path, previous: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Save results as JSON, with enough context to tell machines apart.
+
+    Args:
+        results: The results to save
+        path: File to write
+        previous: Earlier results whose thresholds, and benchmarks missing
+            from results, are carried over; used when updating a baseline
+
+    Returns:
+        The saved data
+    """
+    benchmarks = dict(previous["benchmarks"]) if previous else {}
+    benchmarks.update({result.name: asdict(result) for result in results})
+    data = {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "thresholds": previous.get("thresholds", {}) if previous else {},
+        "benchmarks": benchmarks,
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+    return data
+
+
+def load_results(path: Path) -> Optional[Dict[str, Any]]:
+    """Load saved results, or None if the file is missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return data if data.get("version") == RESULTS_VERSION else None
+
+
+def compare(
+        results: List[BenchmarkResult], baseline: Dict[str, Any], default_threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    The baseline may carry per-benchmark thresholds in a "thresholds" mapping,
+    for benchmarks that are noisier than the rest.
+
+    Args:
+        results: The results to check
+        baseline: Results loaded with load_results
+        default_threshold: Allowed slowdown for benchmarks without their own threshold
+
+    Returns:
+        A description of every regression, empty if there are none
+    """
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+    for result in results:
+        previous = baseline["benchmarks"].get(result.name)
+        # Baselines saved before the fastest round was recorded only have the median
+        if previous is None or "min" not in previous:
+            continue
+        threshold = thresholds.get(result.name, default_threshold)
+        limit = previous["min"] * (1 + threshold)
+        if result.min > limit:
+            regressions.append(
+                f"{result.name}: fastest {format_duration(result.min)} vs baseline "
+                f"{format_duration(previous['min'])} (+{result.min / previous['min'] - 1:.0%}, "
+                f"allowed +{threshold:.0%})"
+            )
+    return regressions
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def format_table(results: List[BenchmarkResult], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Format results as a text table, with the change against the baseline if given."""
+    lines = [f"{'benchmark':<56} {'fastest':>10} {'median':>10} {'p95':>10} {'ops/s':>12} {'vs baseline':>12}"]
+    for result in results:
+        change = ""
+        previous = (baseline or {}).get("benchmarks", {}).get(result.name)
+        if previous and "min" in previous:
+            change = f"{result.min / previous['min'] - 1:+.0%}"
+        lines.append(
+            f"{result.name:<56} {format_duration(result.min):>10} {format_duration(result.median):>10} "
+            f"{format_duration(result.p95):>10} {result.ops_per_second:>12,.0f} {change:>12}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for the Plaid MCP server.
+
+This script measures server cold start, tool dispatch overhead, source
+formatting, AskBill frame handling and every tool handler. Upstream services
+are replaced by local stand-ins, so it runs offline. Results are saved as JSON
+and compared against a stored baseline; the script exits with status 1 when a
+benchmark regresses beyond its threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--filter NAME] [--update-baseline]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import click
+import mcp.types as types
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import get_default_environment, stdio_client
+
+from mcp_server_plaid.clients.bill import AskBillClient
+from mcp_server_plaid.clients.cache import TTLCache
+from mcp_server_plaid.clients.guides import GuideIndex, find_rules_dir
+from mcp_server_plaid.clients.plaid_http import PlaidHttpClient
+from mcp_server_plaid.server import serve
+from mcp_server_plaid.tools.pfm.tool_generate_mock_data import handle_generate_mock_data
+from mcp_server_plaid.tools.pfm.tool_get_mock_data_prompt import handle_get_mock_data_prompt
+from mcp_server_plaid.tools.pfm.tool_lookup_webhooks import handle_lookup_webhooks
+from mcp_server_plaid.tools.pfm.tool_simulate_webhook import handle_simulate_webhook
+from mcp_server_plaid.tools.registry import ToolError, registry
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import handle_get_sandbox_access_token
+from mcp_server_plaid.tools.tool_get_sandbox_access_token_batch import handle_get_sandbox_access_token_batch
+from mcp_server_plaid.tools.tool_search_documentation import _format_sources, handle_search_documentation
+from mcp_server_plaid.tools.tool_search_integration_guides import handle_search_integration_guides
+
+from fakes import FakeAskBillServer, FakePlaidServer
+from harness import (
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    compare,
+    format_table,
+    load_results,
+    measure,
+    measure_async,
+    save_results,
+)
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+
+def rejected(handler):
+    """Wrap a handler whose arguments it rejects, so the benchmark times the rejection."""
+
+    async def call(arguments: Dict[str, Any], **context) -> None:
+        try:
+            await handler(arguments, **context)
+        except ToolError:
+            return
+        raise AssertionError("The handler should have rejected the arguments")
+
+    return call
+
+
+async def bench_cold_start(cache_dir: str) -> List[BenchmarkResult]:
+    """Time from launching the server over stdio to the first tools/list response."""
+    env = {**get_default_environment(), "PLAID_MCP_CACHE_DIR": cache_dir}
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "mcp_server_plaid", "--client-id", "benchmark", "--secret", "benchmark"],
+        env=env,
+    )
+
+    async def start_and_list():
+        async with stdio_client(params) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                await session.list_tools()
+
+    # The warm-up run also writes the tool manifest, as a first run would
+    return [await measure_async("server.cold_start_to_list_tools", start_and_list, rounds=5)]
+
+
+async def bench_dispatch() -> List[BenchmarkResult]:
+    """Overhead of the MCP list_tools and call_tool handlers around a no-op tool."""
+
+    async def handle_noop(arguments: Dict[str, Any], **_) -> List[types.TextContent]:
+        return [types.TextContent(type="text", text="ok")]
+
+    registry.register(
+        types.Tool(name="benchmark_noop", description="No-op", inputSchema={"type": "object"}), handle_noop
+    )
+    server = await serve("benchmark", "benchmark", "")
+    list_tools = server.request_handlers[types.ListToolsRequest]
+    call_tool = server.request_handlers[types.CallToolRequest]
+    list_request = types.ListToolsRequest(method="tools/list")
+    call_request = types.CallToolRequest(
+        method="tools/call", params=types.CallToolRequestParams(name="benchmark_noop", arguments={})
+    )
+
+    async def list_many():
+        for _ in range(1000):
+            await list_tools(list_request)
+
+    async def call_many():
+        for _ in range(1000):
+            await call_tool(call_request)
+
+    # More rounds than the other benchmarks, since these are microseconds long
+    return [
+        await measure_async("dispatch.list_tools", list_many, rounds=50, ops_per_round=1000),
+        await measure_async("dispatch.call_tool", call_many, rounds=50, ops_per_round=1000),
+    ]
+
+
+async def bench_format_sources() -> List[BenchmarkResult]:
+    """Formatting a large AskBill source list with duplicates."""
+    sources = [
+        {"url": f"https://plaid.com/docs/{i % 800}/", "title": f"Docs [{i}]"} for i in range(1000)
+    ]
+    return [measure("format_sources.1000", lambda: _format_sources(sources), rounds=50)]
+
+
+async def bench_askbill() -> List[BenchmarkResult]:
+    """AskBill client throughput on a long streamed answer, per frame."""
+    frames = 2000
+    async with FakeAskBillServer(answer_frames=frames) as fake:
+        client = AskBillClient(fake.uri)
+        try:
+            result = await measure_async(
+                "askbill.answer_frame",
+                lambda: client.ask_question("How do I use /transactions/sync?"),
+                rounds=10,
+                ops_per_round=frames,
+            )
+        finally:
+            await client.close()
+    return [result]
+
+
+async def bench_tools() -> List[BenchmarkResult]:
+    """Every tool handler, against local stand-ins for Plaid and AskBill."""
+    results = []
+    async with FakePlaidServer() as fake_plaid, FakeAskBillServer() as fake_bill:
+        plaid_client = PlaidHttpClient("benchmark", "benchmark", host=fake_plaid.host)
+        bill_client = AskBillClient(fake_bill.uri)
+        answer_cache = TTLCache()
+        guide_index = GuideIndex.load_or_build(find_rules_dir())
+        try:
+            cases = [
+                ("tool.get_sandbox_access_token", handle_get_sandbox_access_token,
+                 {"initial_products": "transactions"}),
+                ("tool.get_sandbox_access_token.auth_transfer", handle_get_sandbox_access_token,
+                 {"initial_products": "auth,transfer"}),
+                ("tool.get_sandbox_access_token.auth_transfer.all_fields", handle_get_sandbox_access_token,
+                 {"initial_products": "auth,transfer",
+                  "account_fields": ["account_id", "name", "mask", "type", "subtype", "balances", "numbers"]}),
+                ("tool.get_sandbox_access_token_batch.20", handle_get_sandbox_access_token_batch,
+                 {"items": [{"initial_products": "transactions", "count": 20}]}),
+                ("tool.simulate_webhook", handle_simulate_webhook,
+                 {"access_token": "access-sandbox-1", "webhook_code": "DEFAULT_UPDATE",
+                  "webhook_type": "TRANSACTIONS"}),
+                ("tool.simulate_webhook.bulk_50", handle_simulate_webhook,
+                 {"access_token": "access-sandbox-1", "rate_per_second": 100000,
+                  "webhooks": [{"webhook_type": "TRANSACTIONS", "webhook_code": "DEFAULT_UPDATE"}] * 50}),
+                ("tool.simulate_webhook.invalid", rejected(handle_simulate_webhook),
+                 {"access_token": "access-sandbox-1", "webhook_code": "DEFAULT_UPDATE", "webhook_type": "ITEM"}),
+                ("tool.lookup_webhooks", handle_lookup_webhooks, {"query": "transactions"}),
+                ("tool.search_documentation", handle_search_documentation,
+                 {"question": "How do I use /transactions/sync?"}),
+                ("tool.search_integration_guides", handle_search_integration_guides,
+                 {"query": "transfer authorization decision rationale", "top_k": 3}),
+                ("tool.get_mock_data_prompt", handle_get_mock_data_prompt,
+                 {"num_of_transactions": "50"}),
+                ("tool.generate_mock_data.3x1000", handle_generate_mock_data,
+                 {"num_of_transactions": 1000, "seed": 1}),
+            ]
+            context = {"plaid_client": plaid_client, "bill_client": bill_client, "guide_index": guide_index}
+            for name, handler, arguments in cases:
+                results.append(await measure_async(name, lambda: handler(arguments, **context)))
+
+            results.append(await measure_async(
+                "tool.search_documentation.cached",
+                lambda: handle_search_documentation(
+                    {"question": "How do I use /transactions/sync?"}, bill_client=bill_client,
+                    answer_cache=answer_cache,
+                ),
+                rounds=200,
+            ))
+        finally:
+            await bill_client.close()
+            await plaid_client.aclose()
+    return results
+
+
+async def run_all(name_filter: str) -> List[BenchmarkResult]:
+    """Run the benchmarks whose name starts with the filter."""
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the manifest and guide index written by the benchmarks out of the user's cache
+        os.environ["PLAID_MCP_CACHE_DIR"] = cache_dir
+        groups = [
+            ("server.", lambda: bench_cold_start(cache_dir)),
+            ("dispatch.", bench_dispatch),
+            ("format_sources.", bench_format_sources),
+            ("askbill.", bench_askbill),
+            ("tool.", bench_tools),
+        ]
+        for prefix, group in groups:
+            if not (prefix.startswith(name_filter) or name_filter.startswith(prefix)):
+                continue
+            click.echo(f"Running {prefix.rstrip('.')} benchmarks...", err=True)
+            started = time.perf_counter()
+            results.extend(result for result in await group() if result.name.startswith(name_filter))
+            click.echo(f"  done in {time.perf_counter() - started:.1f}s", err=True)
+    return results
+
+
+@click.command()
+@click.option("--filter", "name_filter", default="",
+              help="Only run benchmarks whose name starts with this text, e.g. 'tool.'")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path),
+              default=BENCHMARKS_DIR / "results.json", show_default=True, help="Where to save the results")
+@click.option("--baseline", type=click.Path(dir_okay=False, path_type=Path),
+              default=BENCHMARKS_DIR / "baseline.json", show_default=True, help="Baseline results to compare against")
+@click.option("--threshold", type=float, default=DEFAULT_THRESHOLD, show_default=True,
+              help="Allowed slowdown against the baseline, for benchmarks without their own threshold")
+@click.option("--update-baseline", is_flag=True, help="Save the results as the new baseline")
+def main(name_filter: str, output: Path, baseline: Path, threshold: float, update_baseline: bool):
+    """Run the benchmarks and compare them against the baseline."""
+    results = asyncio.run(run_all(name_filter))
+    previous = load_results(baseline)
+
+    save_results(results, output)
+    click.echo(format_table(results, previous))
+    click.echo(f"\nResults saved to {output}")
+
+    if update_baseline:
+        # Keeps hand-tuned thresholds, and the entries of benchmarks that were filtered out
+        save_results(results, baseline, previous)
+        click.echo(f"Baseline updated at {baseline}")
+        return
+
+    if previous is None:
+        click.echo(f"No baseline at {baseline}; run with --update-baseline to create one")
+        return
+
+    regressions = compare(results, previous, threshold)
+    if regressions:
+        click.echo("\nRegressions:")
+        for regression in regressions:
+            click.echo(f"  {regression}")
+        sys.exit(1)
+    click.echo("No regressions")
+
+
+if __name__ == "__main__":
+    main()
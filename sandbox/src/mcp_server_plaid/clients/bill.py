@@ -1,34 +1,380 @@
 import asyncio
 import json
+import logging
+import math
+import random
+import time
 import uuid
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 import websockets
 
+from mcp_server_plaid.clients.cache import normalize_question
+from mcp_server_plaid.metrics import metrics
+
 # Response type constants
 TYPE_STATUS = "status"
 TYPE_SOURCES = "sources"
 TYPE_ANSWER = "answer"
 STATUS_FINISHED = "finished"
 
+logger = logging.getLogger("plaid-mcp-server.bill")
+
+# Called with (TYPE_ANSWER, answer text) or (TYPE_SOURCES, source list) as frames arrive
+ChunkCallback = Callable[[str, Any], Awaitable[None]]
+
+# Queued to a shared question's waiters once its answer is complete
+_DONE = object()
+
+# Recent times to the first answer frame used to pick the hedge delay
+HEDGE_WINDOW = 200
+# Questions observed before the hedge delay is trusted
+HEDGE_MIN_SAMPLES = 20
+
+
+class _AmbiguousFrames(Exception):
+    """Raised in questions whose response frames cannot be told apart."""
+
+
+class _SharedQuestion:
+    """An upstream question shared by every caller asking it while it runs."""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        # Chunks received so far, replayed to waiters that join late
+        self.chunks: List[Tuple[str, Any]] = []
+        self.queues: List[asyncio.Queue] = []
+
+    async def publish(self, response_type: str, payload: Any) -> None:
+        """Hand a chunk to every waiter streaming the answer."""
+        self.chunks.append((response_type, payload))
+        for queue in self.queues:
+            queue.put_nowait((response_type, payload))
+
+    def subscribe(self) -> asyncio.Queue:
+        """Get a queue of the answer's chunks, starting with those already received."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in self.chunks:
+            queue.put_nowait(chunk)
+        if self.task.done():
+            queue.put_nowait(_DONE)
+        self.queues.append(queue)
+        return queue
+
+    def finish(self, task: asyncio.Task) -> None:
+        """Wake every streaming waiter once the question is answered or failed."""
+        if not task.cancelled():
+            # Retrieved so nobody is warned about an exception all waiters gave up on
+            task.exception()
+        for queue in self.queues:
+            queue.put_nowait(_DONE)
+
+
+class _HedgeRace:
+    """
+    Attempts racing to answer one question.
+
+    The first attempt to stream an answer frame wins: only its chunks reach
+    the caller, and the other attempts are cancelled. Sources that arrive
+    before then are held back until the winner is known.
+    """
+
+    def __init__(self, on_chunk: Optional[ChunkCallback]):
+        self.on_chunk = on_chunk
+        self.winner: Optional[int] = None
+        self.answered = asyncio.Event()
+        self._sources: Dict[int, Any] = {}
+
+    def forwarder(self, attempt: int) -> ChunkCallback:
+        """Get the chunk callback for an attempt."""
+
+        async def forward(response_type: str, payload: Any) -> None:
+            if self.winner is None:
+                if response_type != TYPE_ANSWER:
+                    self._sources[attempt] = payload
+                    return
+                self.winner = attempt
+                self.answered.set()
+                if self.on_chunk is not None and attempt in self._sources:
+                    await self.on_chunk(TYPE_SOURCES, self._sources[attempt])
+            if self.winner == attempt and self.on_chunk is not None:
+                await self.on_chunk(response_type, payload)
+
+        return forward
+
+    async def wait(self, attempts: List[asyncio.Task], timeout: Optional[float] = None) -> bool:
+        """
+        Wait until an attempt wins, every attempt is done or the timeout expires.
+
+        Returns:
+            True if an attempt won or every attempt is done
+        """
+        answered = asyncio.ensure_future(self.answered.wait())
+        try:
+            await asyncio.wait(
+                [answered, *attempts], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            answered.cancel()
+        return self.answered.is_set() or all(task.done() for task in attempts)
+
+    async def result(self, attempts: List[asyncio.Task]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Wait for the winning attempt's answer.
+
+        An attempt that finishes without streaming an answer also wins, unless
+        it timed out or failed and another attempt is still running.
+
+        Returns:
+            The index of the winning attempt and its result
+        """
+        pending = set(attempts)
+        while self.winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if self.winner is not None:
+                break
+            for task in sorted(done, key=attempts.index):
+                if not task.exception() and not task.result().get("timed_out"):
+                    self.winner = attempts.index(task)
+                    break
+            if self.winner is None and not pending:
+                # Every attempt timed out or failed: report the first one
+                finished = [task for task in attempts if not task.exception()]
+                self.winner = attempts.index(finished[0] if finished else attempts[0])
+        for index, task in enumerate(attempts):
+            if index != self.winner:
+                task.cancel()
+        return self.winner, await attempts[self.winner]
+
 
 class AskBillClient:
-    """Client for interacting with the AskBill websocket service."""
+    """
+    Client for interacting with the AskBill websocket service.
+
+    The client keeps a single long-lived websocket connection that is opened
+    lazily on the first question and shared by every caller. Responses are
+    routed back to the waiting caller by ``question_id``, so several questions
+    can be in flight on the same connection at once. When the connection
+    drops, the next question reconnects with jittered exponential backoff.
+
+    If AskBill answers without echoing ``question_id``, frames can only be
+    attributed while a single question is in flight on a connection. The
+    questions caught sharing the connection are then asked again on dedicated
+    connections, and from then on a question only uses the shared connection
+    when it is idle.
+
+    Callers asking the same question (after normalization) while it is already
+    in flight share that upstream request instead of sending their own.
 
-    def __init__(self, uri):
+    With hedging enabled, a question that has not started answering within
+    the given percentile of recent times to the first answer frame is sent
+    again, and the first of the two to start answering is used. Hedges are
+    capped at a fraction of the questions asked.
+    """
+
+    def __init__(
+            self,
+            uri,
+            max_connect_attempts: int = 3,
+            reconnect_base_delay: float = 0.5,
+            reconnect_max_delay: float = 10.0,
+            hedge_percentile: float = 0.0,
+            hedge_budget: float = 0.1,
+    ):
         """
         Initialize the AskBill client.
 
         Args:
             uri: Websocket URI for the service
+            max_connect_attempts: Number of connection attempts before giving up
+            reconnect_base_delay: Base delay (seconds) for the reconnect backoff
+            reconnect_max_delay: Upper bound (seconds) for a single reconnect delay
+            hedge_percentile: Percentile (0-100) of the time to the first answer frame after
+                which a question is sent again (0 disables hedging)
+            hedge_budget: Maximum number of hedges as a fraction of the questions asked
         """
         self.uri = uri
         # Generate UUIDs once at initialization
         self.anonymous_id = str(uuid.uuid4())
         self.user_id = str(uuid.uuid4())
 
+        self.max_connect_attempts = max(1, max_connect_attempts)
+        self.reconnect_base_delay = reconnect_base_delay
+        self.reconnect_max_delay = reconnect_max_delay
+
+        self._websocket = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        # question_id -> (websocket the question was sent on, response queue)
+        self._pending: Dict[str, Tuple[Any, asyncio.Queue]] = {}
+        # Whether AskBill echoes question_id in its frames, None until a frame shows it
+        self._echoes_question_id: Optional[bool] = None
+        # normalized question -> the upstream request answering it
+        self._shared: Dict[str, _SharedQuestion] = {}
+
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        # Seconds from sending recent questions to their first answer frame
+        self._first_answer_times: Deque[float] = deque(maxlen=HEDGE_WINDOW)
+        self.questions = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the shared websocket connection is currently open."""
+        return self._reader_task is not None and not self._reader_task.done()
+
+    async def _connect(self):
+        """Open a new websocket connection, retrying with jittered backoff."""
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_connect_attempts):
+            if attempt:
+                # Full jitter keeps many clients from reconnecting in lockstep
+                delay = min(
+                    self.reconnect_max_delay,
+                    self.reconnect_base_delay * (2 ** (attempt - 1)),
+                )
+                await asyncio.sleep(random.uniform(0, delay))
+            try:
+                return await websockets.connect(
+                    self.uri, ping_interval=30, ping_timeout=15, close_timeout=10
+                )
+            except (OSError, websockets.WebSocketException) as e:
+                last_error = e
+                logger.warning(
+                    f"AskBill connection attempt {attempt + 1}/{self.max_connect_attempts} failed: {e}"
+                )
+        raise ConnectionError(
+            f"Unable to connect to AskBill after {self.max_connect_attempts} attempts"
+        ) from last_error
+
+    async def _ensure_connected(self):
+        """Return the shared websocket, connecting lazily if needed."""
+        if self.connected:
+            return self._websocket
+
+        async with self._connect_lock:
+            # Another caller may have connected while we waited for the lock
+            if self.connected:
+                return self._websocket
+
+            websocket = await self._connect()
+            self._websocket = websocket
+            self._reader_task = asyncio.create_task(self._read_loop(websocket))
+            logger.info("Opened AskBill websocket connection")
+            return websocket
+
+    def _route(self, websocket, parsed_response: Dict[str, Any]) -> Optional[asyncio.Queue]:
+        """
+        Find the queue waiting for a response frame.
+
+        Raises:
+            _AmbiguousFrames: If the frame has no question_id and several
+                questions are in flight on the connection; they are failed
+                so they can be asked again
+        """
+        question_id = parsed_response.get("question_id")
+        if question_id is not None:
+            self._echoes_question_id = True
+            entry = self._pending.get(question_id)
+            return entry[1] if entry else None
+
+        # Frames without a question_id can only be attributed when there is
+        # exactly one question in flight on this connection
+        candidates = [
+            queue for ws, queue in self._pending.values() if ws is websocket
+        ]
+        if len(candidates) == 1:
+            if self._echoes_question_id is None:
+                self._echoes_question_id = False
+            return candidates[0]
+        if len(candidates) > 1 and not self._echoes_question_id:
+            self._echoes_question_id = False
+            logger.warning(
+                f"AskBill does not echo question_id; asking {len(candidates)} questions again "
+                f"on dedicated connections"
+            )
+            for queue in candidates:
+                queue.put_nowait(_AmbiguousFrames())
+            # Stop handing the connection to new questions
+            if self._websocket is websocket:
+                self._websocket = None
+                self._reader_task = None
+            raise _AmbiguousFrames()
+        return None
+
+    async def _read_loop(self, websocket) -> None:
+        """Read frames from the websocket and dispatch them to waiting questions."""
+        error: Exception = ConnectionError("AskBill connection closed")
+        try:
+            async for message in websocket:
+                try:
+                    parsed_response = json.loads(message)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring malformed AskBill frame")
+                    continue
+
+                try:
+                    queue = self._route(websocket, parsed_response)
+                except _AmbiguousFrames:
+                    # Later frames on this connection cannot be attributed either
+                    await websocket.close()
+                    break
+                if queue is None:
+                    logger.warning(f"Dropping unroutable AskBill frame: {parsed_response.get('type')}")
+                    continue
+                queue.put_nowait(parsed_response)
+        except websockets.ConnectionClosed as e:
+            error = ConnectionError(f"AskBill connection closed: {e}")
+        except Exception as e:
+            error = e
+        finally:
+            if self._websocket is websocket:
+                self._websocket = None
+            # Fail every question that was waiting on this connection
+            for ws, queue in list(self._pending.values()):
+                if ws is websocket:
+                    queue.put_nowait(error)
+            logger.info("AskBill websocket connection closed")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the connection state.
+
+        Returns:
+            A dictionary with the connection status, the number of questions
+            awaiting an answer, the number of those shared by several callers,
+            and how many hedges were sent and won
+        """
+        return {
+            "connected": int(self.connected),
+            "pending_questions": len(self._pending),
+            "shared_questions": sum(1 for shared in self._shared.values() if len(shared.queues) > 1),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    async def close(self) -> None:
+        """Close the shared websocket connection, if open."""
+        websocket = self._websocket
+        reader_task = self._reader_task
+        self._websocket = None
+        self._reader_task = None
+        if websocket is not None:
+            await websocket.close()
+        if reader_task is not None:
+            try:
+                await reader_task
+            except asyncio.CancelledError:
+                pass
+
     async def ask_question(
-            self, question: str, timeout: float = 60.0
+            self,
+            question: str,
+            timeout: float = 60.0,
+            on_chunk: Optional[ChunkCallback] = None,
     ) -> Dict[str, Any]:
         """
         Send a question to the websocket service and return the complete response.
@@ -36,60 +382,200 @@ class AskBillClient:
         Args:
             question: The question to ask
             timeout: Maximum time to wait for a response (seconds)
+            on_chunk: Optional coroutine called with each piece of the answer
+                and with the sources as soon as they arrive
+
+        Concurrent calls with the same normalized question share one upstream
+        request, which runs with the timeout of the call that started it. Every
+        caller streaming chunks gets all of them, including those that arrived
+        before it joined. Cancelling a call does not cancel the shared request.
+
+        Returns:
+            Dictionary containing the answer and sources. If the timeout fires
+            before the answer finishes, ``timed_out`` is set to True and the
+            answer holds whatever arrived so far.
+        """
+        key = normalize_question(question)
+        shared = self._shared.get(key)
+        if shared is None:
+            shared = _SharedQuestion()
+            shared.task = asyncio.create_task(self._ask_tracked(question, timeout, shared.publish))
+            shared.task.add_done_callback(shared.finish)
+            shared.task.add_done_callback(lambda _: self._forget(key, shared))
+            self._shared[key] = shared
+        else:
+            metrics.inc("mcp_askbill_coalesced_total")
+
+        queue = shared.subscribe() if on_chunk is not None else None
+        try:
+            if queue is not None:
+                while (chunk := await queue.get()) is not _DONE:
+                    await on_chunk(*chunk)
+            # Shielded so a cancelled caller leaves the request running for the others
+            return await asyncio.shield(shared.task)
+        finally:
+            if queue is not None:
+                shared.queues.remove(queue)
+
+    def _forget(self, key: str, shared: _SharedQuestion) -> None:
+        """Stop sharing a finished question, so the next caller asks again."""
+        if self._shared.get(key) is shared:
+            del self._shared[key]
+
+    async def _ask_tracked(
+            self, question: str, timeout: float, on_chunk: Optional[ChunkCallback]
+    ) -> Dict[str, Any]:
+        """Ask a question upstream, recording its metrics."""
+        with metrics.track("mcp_upstream", service="askbill", endpoint="question"):
+            result = await self._ask_hedged(question, timeout, on_chunk)
+        if result.get("timed_out"):
+            metrics.inc("mcp_upstream_errors_total", service="askbill", endpoint="question", error="Timeout")
+        return result
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Get how long a question may go without an answer frame before it is hedged.
 
         Returns:
-            Dictionary containing the answer and sources
+            The delay in seconds, or None if hedging is disabled, not enough
+            questions were observed yet or the hedge budget is spent
         """
+        samples = len(self._first_answer_times)
+        if not self.hedge_percentile or samples < HEDGE_MIN_SAMPLES:
+            return None
+        if self.hedges + 1 > self.hedge_budget * self.questions:
+            return None
+        rank = math.ceil(self.hedge_percentile / 100 * samples)
+        return sorted(self._first_answer_times)[min(samples, max(1, rank)) - 1]
+
+    async def _ask_hedged(
+            self, question: str, timeout: float, on_chunk: Optional[ChunkCallback]
+    ) -> Dict[str, Any]:
+        """Ask a question, sending it again if it is slow to start answering."""
+        self.questions += 1
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._ask(question, timeout, on_chunk)
+
+        race = _HedgeRace(on_chunk)
+        started = time.perf_counter()
+        attempts = [asyncio.create_task(self._ask(question, timeout, race.forwarder(0)))]
+        try:
+            if not await race.wait(attempts, timeout=delay) and self.hedge_delay() is not None:
+                self.hedges += 1
+                metrics.inc("mcp_askbill_hedges_total")
+                remaining = max(0.0, timeout - (time.perf_counter() - started))
+                attempts.append(asyncio.create_task(self._ask(question, remaining, race.forwarder(1))))
+            winner, result = await race.result(attempts)
+        finally:
+            for task in attempts:
+                task.cancel()
+            # Let the cancelled attempts unregister from the connection
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+        if winner:
+            self.hedge_wins += 1
+            metrics.inc("mcp_askbill_hedge_wins_total")
+        return result
+
+    async def _ask(
+            self, question: str, timeout: float, on_chunk: Optional[ChunkCallback]
+    ) -> Dict[str, Any]:
+        """Send a question on the shared connection and collect the streamed answer."""
+        started = time.perf_counter()
+        websocket = await self._ensure_connected()
+        if self._echoes_question_id is False and any(ws is websocket for ws, _ in self._pending.values()):
+            return await self._ask_dedicated(question, timeout, on_chunk)
+        try:
+            return await self._ask_on(websocket, question, timeout, on_chunk)
+        except _AmbiguousFrames:
+            remaining = max(0.0, timeout - (time.perf_counter() - started))
+            return await self._ask_dedicated(question, remaining, on_chunk)
+
+    async def _ask_dedicated(
+            self, question: str, timeout: float, on_chunk: Optional[ChunkCallback]
+    ) -> Dict[str, Any]:
+        """Send a question on a connection of its own, closed once it is answered."""
+        metrics.inc("mcp_askbill_dedicated_connections_total")
+        websocket = await self._connect()
+        reader_task = asyncio.create_task(self._read_loop(websocket))
+        try:
+            return await self._ask_on(websocket, question, timeout, on_chunk)
+        finally:
+            await websocket.close()
+            await reader_task
+
+    async def _ask_on(
+            self, websocket, question: str, timeout: float, on_chunk: Optional[ChunkCallback]
+    ) -> Dict[str, Any]:
+        """Send a question on a connection and collect the streamed answer."""
         full_answer: List[str] = []
         sources: List[Dict[str, Any]] = []
 
+        # Prepare the question message
+        question_id = uuid.uuid4().hex[:12]
+        question_message = {
+            "type": "question",
+            "anonymous_id": self.anonymous_id,
+            "user_id": self.user_id,
+            "question": question,
+            "question_id": question_id,
+            "chat_history": [],
+        }
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self._pending[question_id] = (websocket, queue)
         try:
-            # Add timeout to connection
-            async with websockets.connect(
-                    self.uri, ping_interval=30, ping_timeout=15, close_timeout=10
-            ) as websocket:
-                # Prepare the question message
-                question_id = uuid.uuid4().hex[:12]
-                question_message = {
-                    "type": "question",
-                    "anonymous_id": self.anonymous_id,
-                    "user_id": self.user_id,
-                    "question": question,
-                    "question_id": question_id,
-                    "chat_history": [],
-                }
+            # Send the question
+            await websocket.send(json.dumps(question_message))
+            sent_at: Optional[float] = time.perf_counter()
+            asked_at = sent_at
+            answering = False
 
-                # Send the question
-                await websocket.send(json.dumps(question_message))
+            try:
+                async with asyncio.timeout(timeout):
+                    # Listen for responses routed to this question
+                    while True:
+                        parsed_response = await queue.get()
+                        if isinstance(parsed_response, Exception):
+                            raise parsed_response
+                        response_type = parsed_response.get("type")
+                        if sent_at is not None and response_type in (TYPE_SOURCES, TYPE_ANSWER):
+                            metrics.observe("mcp_askbill_first_chunk_seconds", time.perf_counter() - sent_at)
+                            sent_at = None
 
-                # Create a task with timeout
-                try:
-                    async with asyncio.timeout(timeout):
-                        # Listen for responses
-                        while True:
-                            response = await websocket.recv()
-                            parsed_response = json.loads(response)
-                            response_type = parsed_response.get("type")
-
-                            if (
-                                    response_type == TYPE_STATUS
-                                    and parsed_response.get("status") == STATUS_FINISHED
-                            ):
-                                return {
-                                    "answer": "".join(full_answer),
-                                    "sources": sources,
-                                }
-                            elif response_type == TYPE_SOURCES:
-                                sources = parsed_response.get("sources", [])
-                            elif response_type == TYPE_ANSWER:
-                                answer_part = parsed_response.get("ans", "")
-                                if answer_part.strip():
-                                    full_answer.append(answer_part)
-                except asyncio.TimeoutError:
-                    return {
-                        "answer": "".join(full_answer)
-                                  or f"Response timed out after {timeout} seconds.",
-                        "sources": sources,
-                    }
-        except Exception as e:
-            raise e
+                        if (
+                                response_type == TYPE_STATUS
+                                and parsed_response.get("status") == STATUS_FINISHED
+                        ):
+                            return {
+                                "answer": "".join(full_answer),
+                                "sources": sources,
+                            }
+                        elif response_type == TYPE_SOURCES:
+                            sources = parsed_response.get("sources", [])
+                            if on_chunk is not None and sources:
+                                await on_chunk(TYPE_SOURCES, sources)
+                        elif response_type == TYPE_ANSWER:
+                            if not answering:
+                                answering = True
+                                self._first_answer_times.append(time.perf_counter() - asked_at)
+                            answer_part = parsed_response.get("ans", "")
+                            if answer_part.strip():
+                                full_answer.append(answer_part)
+                                if on_chunk is not None:
+                                    await on_chunk(TYPE_ANSWER, answer_part)
+            except asyncio.CancelledError:
+                if not answering:
+                    # A cancelled hedge loser took at least this long to answer
+                    self._first_answer_times.append(time.perf_counter() - asked_at)
+                raise
+            except asyncio.TimeoutError:
+                return {
+                    "answer": "".join(full_answer)
+                              or f"Response timed out after {timeout} seconds.",
+                    "sources": sources,
+                    "timed_out": True,
+                }
+        finally:
+            self._pending.pop(question_id, None)
@@ -0,0 +1,127 @@
+"""
+In-process caching helpers for the Plaid MCP server.
+
+This module provides a small bounded LRU cache with per-entry expiry, used to
+avoid repeating slow upstream round trips for identical requests.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a natural language question for use as a cache key.
+
+    Case, punctuation and runs of whitespace are ignored, so
+    "What webhook_code for new transactions?" and
+    "what  webhook_code for new transactions" map to the same key.
+    Underscores are kept because they are significant in Plaid identifiers.
+
+    Args:
+        question: The question as asked
+
+    Returns:
+        The normalized question
+    """
+    text = _PUNCTUATION_RE.sub(" ", question.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class TTLCache:
+    """
+    Bounded least-recently-used cache whose entries expire after a fixed TTL.
+
+    The cache is not thread-safe; it is meant to be used from the server's
+    event loop only.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 256,
+            ttl: float = 3600.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the least recently used
+            ttl: Time in seconds after which an entry expires
+            clock: Monotonic clock used for expiry, overridable for testing
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry, counting the lookup as a hit or a miss.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None if the key is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters.
+
+        Returns:
+            A dictionary with hit, miss and eviction counts and the current size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
@@ -0,0 +1,197 @@
+"""
+Content-addressed store for customized account data.
+
+This module keeps mock datasets (the custom user JSON passed as
+``customized_account_data``) on disk, keyed by the SHA-256 of their minified
+JSON. A dataset is registered once and then referred to by a short handle, so
+agents don't re-send multi-kilobyte payloads with every item and the server
+parses and minifies each dataset only once.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from mcp_server_plaid.storage import get_cache_dir
+
+HANDLE_PREFIX = "ds_"
+# Hex digits of the SHA-256 kept in a handle
+HANDLE_DIGITS = 16
+_HANDLE_RE = re.compile(rf"^{HANDLE_PREFIX}[0-9a-f]{{{HANDLE_DIGITS}}}$")
+
+
+def is_dataset_handle(value: str) -> bool:
+    """Whether a customized_account_data value is a dataset handle rather than inline JSON."""
+    return bool(_HANDLE_RE.match(value.strip()))
+
+
+def minify_dataset(data: str) -> str:
+    """
+    Parse and minify a dataset.
+
+    Args:
+        data: The custom user JSON
+
+    Returns:
+        The JSON without insignificant whitespace
+
+    Raises:
+        ValueError: If the data is not a JSON object
+    """
+    try:
+        parsed = json.loads(data)
+    except ValueError as e:
+        raise ValueError(f"Dataset is not valid JSON: {e}") from None
+    if not isinstance(parsed, dict):
+        raise ValueError("Dataset must be a JSON object, e.g. {\"override_accounts\": [...]}")
+    return json.dumps(parsed, separators=(",", ":"), ensure_ascii=False)
+
+
+def dataset_handle(payload: str) -> str:
+    """
+    Get the handle of a minified dataset.
+
+    Args:
+        payload: The dataset, as returned by minify_dataset
+
+    Returns:
+        The content-addressed handle, e.g. "ds_3f2a9c0e1b7d4a65"
+    """
+    return HANDLE_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:HANDLE_DIGITS]
+
+
+def identify_dataset(customized_account_data: str) -> Optional[str]:
+    """
+    Get the handle identifying a customized_account_data value, without storing it.
+
+    Args:
+        customized_account_data: A dataset handle, inline JSON or empty
+
+    Returns:
+        The handle, or None for empty values and invalid JSON
+    """
+    if not customized_account_data:
+        return None
+    if is_dataset_handle(customized_account_data):
+        return customized_account_data.strip()
+    try:
+        return dataset_handle(minify_dataset(customized_account_data))
+    except ValueError:
+        return None
+
+
+class DatasetStore:
+    """Stores minified datasets on disk under the hash of their content."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Where datasets are kept, defaults to "datasets" in the cache directory
+        """
+        self.directory = directory or get_cache_dir() / "datasets"
+        # handle -> minified payload, for datasets used since the server started
+        self._payloads: Dict[str, str] = {}
+
+    def register(self, data: str) -> str:
+        """
+        Store a dataset.
+
+        Registering the same content again returns the same handle.
+
+        Args:
+            data: The custom user JSON, in any formatting
+
+        Returns:
+            The dataset's handle
+
+        Raises:
+            ValueError: If the data is not a JSON object
+        """
+        payload = minify_dataset(data)
+        handle = dataset_handle(payload)
+        if handle not in self._payloads:
+            path = self.directory / f"{handle}.json"
+            if not path.exists():
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(payload, encoding="utf-8")
+                tmp_path.replace(path)
+            self._payloads[handle] = payload
+        return handle
+
+    def register_file(self, path: Path) -> str:
+        """
+        Store a dataset read from a file, such as mock_data.json.
+
+        Args:
+            path: The JSON file
+
+        Returns:
+            The dataset's handle
+
+        Raises:
+            ValueError: If the file cannot be read or is not a JSON object
+        """
+        try:
+            data = path.expanduser().read_text(encoding="utf-8")
+        except OSError as e:
+            raise ValueError(f"Unable to read dataset file {path}: {e}") from None
+        return self.register(data)
+
+    def get(self, handle: str) -> str:
+        """
+        Get a dataset's minified JSON.
+
+        Args:
+            handle: The handle returned when the dataset was registered
+
+        Returns:
+            The minified JSON
+
+        Raises:
+            ValueError: If no dataset is stored under the handle
+        """
+        handle = handle.strip()
+        payload = self._payloads.get(handle)
+        if payload is None:
+            if not is_dataset_handle(handle):
+                raise ValueError(f"{handle!r} is not a dataset handle.")
+            try:
+                payload = (self.directory / f"{handle}.json").read_text(encoding="utf-8")
+            except OSError:
+                raise ValueError(
+                    f"Unknown dataset {handle}. Register the data with the register_dataset tool first."
+                ) from None
+            if dataset_handle(payload) != handle:
+                raise ValueError(f"Dataset {handle} is corrupted; register the data again.")
+            self._payloads[handle] = payload
+        return payload
+
+    def resolve(self, customized_account_data: str) -> str:
+        """
+        Resolve a customized_account_data value that may be a dataset handle.
+
+        Args:
+            customized_account_data: A dataset handle, inline JSON or empty
+
+        Returns:
+            The dataset's JSON for handles, otherwise the value unchanged
+
+        Raises:
+            ValueError: If the value is a handle of an unknown dataset
+        """
+        if customized_account_data and is_dataset_handle(customized_account_data):
+            return self.get(customized_account_data)
+        return customized_account_data
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number and size of the datasets loaded since the server started."""
+        return {
+            "loaded": len(self._payloads),
+            "bytes": sum(len(payload) for payload in self._payloads.values()),
+        }
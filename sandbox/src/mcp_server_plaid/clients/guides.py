@@ -0,0 +1,280 @@
+"""
+Offline full-text search over the bundled Plaid integration guides.
+
+This module splits the markdown guides in the repository's rules/ directory
+into sections by heading and builds a BM25 inverted index over them. The index
+is persisted in the cache directory and rebuilt only when the guides change,
+so searches work without network access and return in milliseconds.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mcp_server_plaid.storage import get_cache_dir
+
+logger = logging.getLogger("plaid-mcp-server.guides")
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "guide_index.json"
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how i in is it of on or should the this to "
+    "what when where which with you your".split()
+)
+
+
+def find_rules_dir() -> Optional[Path]:
+    """
+    Locate the directory containing the integration guides.
+
+    The PLAID_RULES_DIR environment variable takes precedence. Otherwise the
+    rules/ directory at the root of the repository checkout is used.
+
+    Returns:
+        Path to the rules directory, or None if it cannot be found
+    """
+    override = os.environ.get("PLAID_RULES_DIR")
+    candidates = [Path(override)] if override else []
+    # clients -> mcp_server_plaid -> src -> sandbox -> repository root
+    candidates.append(Path(__file__).resolve().parents[4] / "rules")
+
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search terms.
+
+    Identifiers such as ``webhook_code`` are kept whole and also split into
+    their parts, so both forms match.
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        The list of terms, excluding stopwords
+    """
+    terms = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        terms.append(token)
+        if "_" in token:
+            terms.extend(part for part in token.split("_") if part)
+    return terms
+
+
+def split_sections(text: str, source: str) -> List[Dict[str, Any]]:
+    """
+    Split a markdown document into sections at each heading.
+
+    Headings inside fenced code blocks are ignored.
+
+    Args:
+        text: The markdown text
+        source: Name of the file the text came from
+
+    Returns:
+        A list of sections with source, title, heading path and body text
+    """
+    sections: List[Dict[str, Any]] = []
+    heading_stack: List[str] = []
+    title = ""
+    lines: List[str] = []
+    in_fence = False
+
+    def flush():
+        body = "\n".join(lines).strip()
+        if body or title:
+            sections.append({
+                "source": source,
+                "title": title,
+                "path": " > ".join(heading_stack),
+                "text": body,
+            })
+
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            title = match.group(2)
+            heading_stack = heading_stack[:level - 1] + [title]
+            lines = []
+        else:
+            lines.append(line)
+    flush()
+    return sections
+
+
+def _fingerprint(guide_files: List[Path]) -> str:
+    """Fingerprint the guide files by name, size and modification time."""
+    digest = hashlib.sha256()
+    for path in guide_files:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class GuideIndex:
+    """BM25 inverted index over integration guide sections."""
+
+    def __init__(
+            self,
+            sections: List[Dict[str, Any]],
+            postings: Dict[str, List[List[int]]],
+            doc_lengths: List[int],
+            fingerprint: str = "",
+    ):
+        """
+        Initialize the index from its persisted parts.
+
+        Args:
+            sections: The indexed sections, in document id order
+            postings: Mapping of term to a list of [document id, term frequency] pairs
+            doc_lengths: Number of terms in each section
+            fingerprint: Fingerprint of the guide files the index was built from
+        """
+        self.sections = sections
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.fingerprint = fingerprint
+        self.avg_doc_length = (
+            sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    @classmethod
+    def build(cls, guide_files: List[Path], fingerprint: str = "") -> "GuideIndex":
+        """
+        Build an index from markdown files.
+
+        Args:
+            guide_files: The markdown files to index
+            fingerprint: Fingerprint to record on the index
+
+        Returns:
+            The built index
+        """
+        sections: List[Dict[str, Any]] = []
+        postings: Dict[str, List[List[int]]] = {}
+        doc_lengths: List[int] = []
+
+        for path in guide_files:
+            for section in split_sections(path.read_text(encoding="utf-8"), path.name):
+                doc_id = len(sections)
+                # Count heading terms twice so that section titles weigh more
+                terms = tokenize(section["path"]) * 2 + tokenize(section["text"])
+                for term, frequency in Counter(terms).items():
+                    postings.setdefault(term, []).append([doc_id, frequency])
+                sections.append(section)
+                doc_lengths.append(len(terms))
+
+        return cls(sections, postings, doc_lengths, fingerprint)
+
+    @classmethod
+    def load_or_build(
+            cls, rules_dir: Optional[Path], index_path: Optional[Path] = None
+    ) -> "GuideIndex":
+        """
+        Load the persisted index, rebuilding and saving it if the guides changed.
+
+        Args:
+            rules_dir: Directory containing the markdown guides
+            index_path: Where the index is persisted, defaults to the cache directory
+
+        Returns:
+            The index, which is empty if no guides could be found
+        """
+        if rules_dir is None:
+            logger.warning("Integration guides directory not found, local search is disabled")
+            return cls([], {}, [])
+
+        guide_files = sorted(rules_dir.glob("*.md"))
+        fingerprint = _fingerprint(guide_files)
+        index_path = index_path or get_cache_dir() / INDEX_FILENAME
+
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION and data.get("fingerprint") == fingerprint:
+                logger.info(f"Loaded guide index from {index_path}")
+                return cls(data["sections"], data["postings"], data["doc_lengths"], fingerprint)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        index = cls.build(guide_files, fingerprint)
+        try:
+            index.save(index_path)
+        except OSError as e:
+            logger.warning(f"Unable to persist guide index to {index_path}: {e}")
+        logger.info(f"Indexed {len(index)} guide sections from {rules_dir}")
+        return index
+
+    def save(self, index_path: Path) -> None:
+        """
+        Persist the index as JSON.
+
+        Args:
+            index_path: File to write the index to
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "sections": self.sections,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+        }
+        tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(index_path)
+
+    def search(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Rank guide sections against a query with BM25.
+
+        Args:
+            query: The search query in natural language
+            top_k: Maximum number of sections to return
+
+        Returns:
+            The best matching sections, each with an added ``score``
+        """
+        num_docs = len(self.sections)
+        if not num_docs:
+            return []
+
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            doc_freq = len(term_postings)
+            idf = math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+            for doc_id, frequency in term_postings:
+                length_norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / self.avg_doc_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                        frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [{**self.sections[doc_id], "score": score} for doc_id, score in ranked]
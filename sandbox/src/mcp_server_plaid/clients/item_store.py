@@ -0,0 +1,160 @@
+"""
+Persistent registry of the sandbox items created by the server.
+
+This module records every sandbox item handed out by the tools in a local
+SQLite database, so agents in later sessions can look up and reuse an item
+with the products and dataset they need instead of creating a new one.
+
+Items are scoped to the Plaid client ID that created them, since access tokens
+only work with the client that minted them. The database is opened in WAL
+mode, so several server processes can share it.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from mcp_server_plaid.clients.sandbox import products_key, project_accounts
+from mcp_server_plaid.storage import get_cache_dir
+
+logger = logging.getLogger("plaid-mcp-server.item_store")
+
+DATABASE_FILENAME = "sandbox_items.sqlite3"
+# Account fields kept for each recorded item; balances and numbers go stale
+RECORDED_ACCOUNT_FIELDS = ("account_id", "name", "mask", "type", "subtype")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    access_token TEXT PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    products TEXT NOT NULL,
+    webhook TEXT NOT NULL DEFAULT '',
+    dataset TEXT,
+    created_at REAL NOT NULL,
+    accounts TEXT
+);
+CREATE INDEX IF NOT EXISTS items_by_products ON items (client_id, products, created_at);
+CREATE INDEX IF NOT EXISTS items_by_dataset ON items (client_id, dataset, created_at);
+"""
+
+
+class ItemStore:
+    """SQLite-backed record of created sandbox items."""
+
+    def __init__(self, client_id: str, path: Optional[Path] = None):
+        """
+        Open the store, creating the database if needed.
+
+        Args:
+            client_id: Plaid client ID the recorded items belong to
+            path: Database file, defaults to a file in the cache directory
+        """
+        self.client_id = client_id
+        self.path = path or get_cache_dir() / DATABASE_FILENAME
+        self._db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def record(
+            self,
+            item: Dict[str, Any],
+            products: List[str],
+            webhook: str = "",
+            dataset: Optional[str] = None,
+    ) -> None:
+        """
+        Record a created item.
+
+        Failures to write are logged, not raised, so they never fail the
+        call that created the item.
+
+        Args:
+            item: The item, as returned by create_sandbox_item
+            products: Products the item was created with
+            webhook: The item's webhook URL, if any
+            dataset: Handle of the item's customized account data, if any
+        """
+        accounts = None
+        if item.get("accounts") is not None:
+            accounts = json.dumps(
+                project_accounts(item["accounts"], fields=RECORDED_ACCOUNT_FIELDS), separators=(",", ":")
+            )
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO items "
+                "(access_token, item_id, client_id, products, webhook, dataset, created_at, accounts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    item["access_token"],
+                    item["item_id"],
+                    self.client_id,
+                    products_key(products),
+                    webhook or "",
+                    dataset,
+                    time.time(),
+                    accounts,
+                ),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Unable to record sandbox item {item['item_id']}: {e}")
+
+    def find(
+            self,
+            products: Optional[List[str]] = None,
+            dataset: Optional[str] = None,
+            webhook: Optional[str] = None,
+            limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find recorded items, newest first.
+
+        Args:
+            products: Only items created with exactly these products, in any order
+            dataset: Only items created with this dataset handle, or "" for items without one
+            webhook: Only items with this webhook URL, or "" for items without one
+            limit: Maximum number of items returned
+
+        Returns:
+            The items, with their accounts decoded
+        """
+        clauses = ["client_id = ?"]
+        parameters: List[Any] = [self.client_id]
+        if products:
+            clauses.append("products = ?")
+            parameters.append(products_key(products))
+        if dataset is not None:
+            clauses.append("dataset IS NULL" if dataset == "" else "dataset = ?")
+            if dataset:
+                parameters.append(dataset)
+        if webhook is not None:
+            clauses.append("webhook = ?")
+            parameters.append(webhook)
+        parameters.append(limit)
+
+        rows = self._db.execute(
+            f"SELECT * FROM items WHERE {' AND '.join(clauses)} ORDER BY created_at DESC, rowid DESC LIMIT ?",
+            parameters,
+        ).fetchall()
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["accounts"] = json.loads(item["accounts"]) if item["accounts"] else None
+            items.append(item)
+        return items
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of items recorded for the client ID."""
+        (count,) = self._db.execute(
+            "SELECT COUNT(*) FROM items WHERE client_id = ?", (self.client_id,)
+        ).fetchone()
+        return {"items": count}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
@@ -0,0 +1,108 @@
+"""
+Async access to the synchronous Plaid SDK.
+
+The generated plaid-python client performs blocking HTTPS requests. This module
+runs those calls on a bounded thread pool so that tool handlers can await them
+without freezing the server's event loop.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Protocol
+
+from mcp_server_plaid.metrics import metrics
+
+if TYPE_CHECKING:
+    from plaid.api import plaid_api
+
+DEFAULT_MAX_WORKERS = 8
+
+# Endpoint paths of the PlaidApi methods used by the tools, for metrics labels
+ENDPOINT_PATHS = {
+    "sandbox_public_token_create": "/sandbox/public_token/create",
+    "item_public_token_exchange": "/item/public_token/exchange",
+    "auth_get": "/auth/get",
+    "sandbox_item_fire_webhook": "/sandbox/item/fire_webhook",
+}
+
+
+class PlaidClient(Protocol):
+    """Protocol for the async Plaid clients injected into tool handlers."""
+
+    async def sandbox_public_token_create(self, request: Any) -> Any:
+        ...
+
+    async def item_public_token_exchange(self, request: Any) -> Any:
+        ...
+
+    async def auth_get(self, request: Any) -> Any:
+        ...
+
+    async def sandbox_item_fire_webhook(self, request: Any) -> Any:
+        ...
+
+
+class AsyncPlaidApi:
+    """
+    Awaitable wrapper around ``plaid_api.PlaidApi``.
+
+    Each call is submitted to a dedicated thread pool. The pool size bounds the
+    number of concurrent Plaid requests and should match the size of the
+    underlying urllib3 connection pool (``Configuration.connection_pool_maxsize``).
+    """
+
+    def __init__(self, api: "plaid_api.PlaidApi", max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize the wrapper.
+
+        Args:
+            api: The synchronous Plaid API client
+            max_workers: Maximum number of Plaid calls running at once
+        """
+        self.api = api
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="plaid-api"
+        )
+
+    async def call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run any ``PlaidApi`` method on the thread pool.
+
+        Args:
+            method_name: Name of the PlaidApi method, e.g. "auth_get"
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's response
+        """
+        method = getattr(self.api, method_name)
+        loop = asyncio.get_running_loop()
+        endpoint = ENDPOINT_PATHS.get(method_name, method_name)
+        with metrics.track("mcp_upstream", service="plaid", endpoint=endpoint):
+            return await loop.run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+    async def sandbox_public_token_create(self, request: Any) -> Any:
+        """Create a sandbox public token."""
+        return await self.call("sandbox_public_token_create", request)
+
+    async def item_public_token_exchange(self, request: Any) -> Any:
+        """Exchange a public token for an access token."""
+        return await self.call("item_public_token_exchange", request)
+
+    async def auth_get(self, request: Any) -> Any:
+        """Get auth data for an item's accounts."""
+        return await self.call("auth_get", request)
+
+    async def sandbox_item_fire_webhook(self, request: Any) -> Any:
+        """Fire a sandbox webhook for an item."""
+        return await self.call("sandbox_item_fire_webhook", request)
+
+    def shutdown(self) -> None:
+        """Stop the thread pool, waiting for running calls to finish."""
+        self._executor.shutdown(wait=True)
+
@@ -0,0 +1,124 @@
+"""
+Native async Plaid client built on httpx.
+
+This module talks to the Plaid sandbox endpoints used by the MCP tools over a
+single shared ``httpx.AsyncClient``. Connections are kept alive and reused,
+and HTTP/2 is negotiated when the optional ``h2`` package is installed, so
+concurrent tool calls share a few warm connections without any threads.
+
+Requests and responses reuse the plaid-python models for serialization, so
+handlers can pass the same request objects they would pass to ``PlaidApi``.
+Responses are returned as plain dictionaries.
+"""
+
+import importlib.util
+import json
+from typing import Any, Dict, Optional
+
+import httpx
+import plaid
+
+from mcp_server_plaid.metrics import metrics
+
+PLAID_API_VERSION = "2020-09-14"
+DEFAULT_TIMEOUT = 30.0
+KEEPALIVE_EXPIRY = 60.0
+
+
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class PlaidHttpClient:
+    """Async client for the Plaid API endpoints used by the MCP tools."""
+
+    def __init__(
+            self,
+            client_id: str,
+            secret: str,
+            host: str = plaid.Environment.Sandbox,
+            max_connections: int = 8,
+            timeout: float = DEFAULT_TIMEOUT,
+            http2: Optional[bool] = None,
+            transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            client_id: Plaid client ID
+            secret: Plaid secret
+            host: Base URL of the Plaid environment
+            max_connections: Maximum number of open connections to Plaid
+            timeout: Request timeout in seconds
+            http2: Whether to use HTTP/2, defaults to True when ``h2`` is installed
+            transport: Custom httpx transport, mainly for testing
+        """
+        self.host = host
+        self._client = httpx.AsyncClient(
+            base_url=host,
+            http2=http2_available() if http2 is None else http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
+            headers={
+                "PLAID-CLIENT-ID": client_id,
+                "PLAID-SECRET": secret,
+                "Plaid-Version": PLAID_API_VERSION,
+                "Content-Type": "application/json",
+                "User-Agent": f"mcp-server-plaid (httpx/{httpx.__version__})",
+            },
+            transport=transport,
+        )
+
+    async def post(self, path: str, request: Any) -> Dict[str, Any]:
+        """
+        POST a request to a Plaid endpoint.
+
+        Args:
+            path: Endpoint path, e.g. "/auth/get"
+            request: A plaid-python request model or a plain dictionary
+
+        Returns:
+            The decoded JSON response
+
+        Raises:
+            plaid.ApiException: If Plaid responds with an error status
+        """
+        body = plaid.ApiClient.sanitize_for_serialization(request)
+        with metrics.track("mcp_upstream", service="plaid", endpoint=path):
+            response = await self._client.post(
+                path, content=json.dumps(body, separators=(",", ":"))
+            )
+            if response.is_error:
+                error = plaid.ApiException(
+                    status=response.status_code, reason=response.reason_phrase
+                )
+                error.body = response.text
+                error.headers = response.headers
+                raise error
+            return response.json()
+
+    async def sandbox_public_token_create(self, request: Any) -> Dict[str, Any]:
+        """Create a sandbox public token."""
+        return await self.post("/sandbox/public_token/create", request)
+
+    async def item_public_token_exchange(self, request: Any) -> Dict[str, Any]:
+        """Exchange a public token for an access token."""
+        return await self.post("/item/public_token/exchange", request)
+
+    async def auth_get(self, request: Any) -> Dict[str, Any]:
+        """Get auth data for an item's accounts."""
+        return await self.post("/auth/get", request)
+
+    async def sandbox_item_fire_webhook(self, request: Any) -> Dict[str, Any]:
+        """Fire a sandbox webhook for an item."""
+        return await self.post("/sandbox/item/fire_webhook", request)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
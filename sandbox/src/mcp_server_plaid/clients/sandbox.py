@@ -0,0 +1,186 @@
+"""
+Helpers for creating Plaid sandbox items.
+
+This module holds the public token create / exchange flow shared by the tools
+that hand out sandbox access tokens.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from mcp_server_plaid.clients.plaid_async import PlaidClient
+
+# Institution used for every sandbox item created by the server
+SANDBOX_INSTITUTION_ID = "ins_109508"
+
+# Account fields that can be projected from an item's accounts
+ACCOUNT_FIELDS = ("account_id", "name", "mask", "type", "subtype", "balances", "numbers")
+DEFAULT_ACCOUNT_FIELDS = ("account_id", "mask", "subtype")
+
+
+def parse_products(products: str) -> List[str]:
+    """
+    Split a comma-separated product list.
+
+    Args:
+        products: Plaid products separated by commas, e.g. "auth, transfer"
+
+    Returns:
+        The product names, stripped of whitespace, with empty entries removed
+    """
+    return [product.strip() for product in products.split(",") if product.strip()]
+
+
+def products_pattern() -> str:
+    """
+    Build a regular expression matching a comma-separated list of Plaid products.
+
+    The product names come from the installed plaid-python models, so tool
+    schemas using the pattern accept exactly the products the SDK accepts.
+
+    Returns:
+        The pattern, for the ``pattern`` keyword of a JSON schema
+    """
+    from plaid.model.products import Products
+
+    names = "|".join(sorted(Products.allowed_values[("value",)].values()))
+    return rf"^\s*(?:{names})\s*(?:,+\s*(?:{names})\s*)*,*\s*$"
+
+
+def products_key(products: List[str]) -> str:
+    """
+    Build an order-insensitive key for a product list.
+
+    Args:
+        products: Plaid product names
+
+    Returns:
+        The sorted, de-duplicated, lowercase products joined by commas
+    """
+    return ",".join(sorted({product.strip().lower() for product in products if product.strip()}))
+
+
+async def create_sandbox_item(
+        plaid_client: PlaidClient,
+        products: List[str],
+        webhook: str = "",
+        customized_account_data: str = "",
+) -> Dict[str, Any]:
+    """
+    Create a sandbox item and exchange its public token for an access token.
+
+    For items with the transfer product, the item's accounts are fetched as
+    well, since transfers need an account_id.
+
+    Args:
+        plaid_client: The async Plaid client
+        products: Plaid products to initialize the item with
+        webhook: Optional webhook URL for the item
+        customized_account_data: Optional stringified custom user configuration
+
+    Returns:
+        Dictionary with access_token, item_id, accounts and numbers (None
+        unless the transfer product was requested)
+
+    Raises:
+        plaid.ApiException: If a Plaid request fails
+    """
+    # Imported here to keep the generated plaid models out of server startup
+    from plaid.model.auth_get_request import AuthGetRequest
+    from plaid.model.item_public_token_exchange_request import ItemPublicTokenExchangeRequest
+    from plaid.model.products import Products
+    from plaid.model.sandbox_public_token_create_request import SandboxPublicTokenCreateRequest
+    from plaid.model.sandbox_public_token_create_request_options import (
+        SandboxPublicTokenCreateRequestOptions,
+    )
+
+    # Create options with conditional assignments
+    options_kwargs = {}
+
+    # Only add webhook if it was provided and not empty
+    if webhook:
+        options_kwargs["webhook"] = webhook
+
+    # Add username/password override only if customized data is provided
+    if customized_account_data:
+        options_kwargs["override_username"] = "user_custom"
+        options_kwargs["override_password"] = customized_account_data
+
+    pt_request = SandboxPublicTokenCreateRequest(
+        institution_id=SANDBOX_INSTITUTION_ID,
+        initial_products=[Products(product) for product in products],
+        options=SandboxPublicTokenCreateRequestOptions(**options_kwargs),
+    )
+
+    # Get public token
+    pt_response = await plaid_client.sandbox_public_token_create(pt_request)
+
+    # Exchange for access token
+    exchange_request = ItemPublicTokenExchangeRequest(
+        public_token=pt_response["public_token"]
+    )
+    exchange_response = await plaid_client.item_public_token_exchange(exchange_request)
+
+    item = {
+        "access_token": exchange_response["access_token"],
+        "item_id": exchange_response["item_id"],
+        "accounts": None,
+        "numbers": None,
+    }
+
+    if "transfer" in products:
+        # Call auth_get_request to get the accounts
+        auth_request = AuthGetRequest(access_token=item["access_token"])
+        auth_response = await plaid_client.auth_get(auth_request)
+        item["accounts"] = auth_response["accounts"]
+        item["numbers"] = auth_response.get("numbers")
+
+    return item
+
+
+def _plain(value: Any) -> Any:
+    """Convert a plaid-python model value to plain JSON data."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    import plaid
+
+    return plaid.ApiClient.sanitize_for_serialization(value)
+
+
+def project_accounts(
+        accounts: Iterable[Any],
+        numbers: Optional[Any] = None,
+        fields: Iterable[str] = DEFAULT_ACCOUNT_FIELDS,
+) -> List[Dict[str, Any]]:
+    """
+    Project an item's accounts onto a few fields, as plain JSON data.
+
+    Only the selected fields are converted, so the plaid-python models of the
+    other fields are never serialized.
+
+    Args:
+        accounts: Accounts from /auth/get, as plaid-python models or dictionaries
+        numbers: The ``numbers`` of the /auth/get response, used for the "numbers" field
+        fields: Fields to keep, from ACCOUNT_FIELDS
+
+    Returns:
+        One dictionary per account with the selected fields that are present
+    """
+    fields = [field for field in fields if field in ACCOUNT_FIELDS]
+    by_account: Dict[str, Dict[str, Any]] = {}
+    if "numbers" in fields and numbers is not None:
+        # Group the per-network account numbers by account_id
+        for network, entries in _plain(numbers).items():
+            for entry in entries or []:
+                entry = dict(entry)
+                by_account.setdefault(entry.pop("account_id", None), {})[network] = entry
+
+    projected = []
+    for account in accounts:
+        row = {}
+        for field in fields:
+            if field == "numbers":
+                row["numbers"] = by_account.get(account["account_id"], {})
+            elif field in account:
+                row[field] = _plain(account[field])
+        projected.append(row)
+    return projected
@@ -0,0 +1,160 @@
+"""
+Pre-warmed pool of Plaid sandbox items.
+
+Creating a sandbox item takes two or three sequential Plaid round trips. This
+module keeps a few ready-made items for configured product profiles and
+refills them in the background, so matching requests are served instantly.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from mcp_server_plaid.clients.plaid_async import PlaidClient
+from mcp_server_plaid.clients.sandbox import create_sandbox_item, parse_products, products_key
+
+logger = logging.getLogger("plaid-mcp-server.token_pool")
+
+# Consecutive failures after which a profile stops refilling until its next use
+MAX_REFILL_FAILURES = 3
+REFILL_RETRY_DELAY = 2.0
+
+
+def parse_profiles(profiles: str) -> List[str]:
+    """
+    Parse a pool profile specification.
+
+    Args:
+        profiles: Product lists separated by semicolons, e.g. "transactions;auth,transfer"
+
+    Returns:
+        The normalized product keys of each profile
+    """
+    keys = []
+    for profile in profiles.split(";"):
+        key = products_key(parse_products(profile))
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+class SandboxItemPool:
+    """
+    Pool of ready-made sandbox items per product profile.
+
+    Only plain items are pooled: requests with a webhook or customized account
+    data always create a new item. Each pooled item is handed out once.
+    """
+
+    def __init__(self, plaid_client: PlaidClient, profiles: List[str], size: int = 2):
+        """
+        Initialize the pool.
+
+        Args:
+            plaid_client: The async Plaid client used to create items
+            profiles: Product keys to keep items for, see parse_profiles
+            size: Number of ready items to keep per profile
+        """
+        self.plaid_client = plaid_client
+        self.size = size
+        self._items: Dict[str, Deque[Dict[str, Any]]] = {
+            products_key(profile.split(",")): deque() for profile in profiles
+        }
+        self._refill_tasks: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def profiles(self) -> List[str]:
+        """The product keys this pool keeps items for."""
+        return list(self._items)
+
+    def available(self, products: List[str]) -> int:
+        """
+        Count the ready items for a product list.
+
+        Args:
+            products: Plaid product names
+
+        Returns:
+            The number of pooled items, 0 if the products are not a pooled profile
+        """
+        items = self._items.get(products_key(products))
+        return len(items) if items is not None else 0
+
+    def start(self) -> None:
+        """Start filling every profile in the background."""
+        for key in self._items:
+            self._ensure_refill(key)
+
+    def take(self, products: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Take a ready item for a product list, if one is pooled.
+
+        Taking an item schedules a background refill of its profile.
+
+        Args:
+            products: Plaid product names
+
+        Returns:
+            The item (access_token, item_id, accounts), or None if none is ready
+        """
+        key = products_key(products)
+        items = self._items.get(key)
+        if items is None:
+            return None
+
+        self._ensure_refill(key)
+        if not items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return items.popleft()
+
+    def _ensure_refill(self, key: str) -> None:
+        """Start a refill task for a profile unless one is already running."""
+        task = self._refill_tasks.get(key)
+        if task is None or task.done():
+            self._refill_tasks[key] = asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: str) -> None:
+        """Create items for a profile until it holds the target number."""
+        items = self._items[key]
+        failures = 0
+        while len(items) < self.size:
+            try:
+                item = await create_sandbox_item(self.plaid_client, key.split(","))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Failed to pre-create sandbox item for {key}: {e}")
+                if failures >= MAX_REFILL_FAILURES:
+                    return
+                await asyncio.sleep(REFILL_RETRY_DELAY * failures)
+                continue
+            failures = 0
+            items.append(item)
+            logger.info(f"Pre-created sandbox item for {key} ({len(items)}/{self.size} ready)")
+
+    async def close(self) -> None:
+        """Cancel any running refills."""
+        tasks = [task for task in self._refill_tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refill_tasks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the pool counters.
+
+        Returns:
+            A dictionary with hit and miss counts and the ready items per profile
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "ready": {key: len(items) for key, items in self._items.items()},
+        }
@@ -0,0 +1,265 @@
+"""
+HTTP transport for the Plaid MCP server.
+
+This module serves many MCP sessions from one process over HTTP, using the
+MCP HTTP+SSE transport: each client opens a server-sent events stream at
+``/sse`` and posts its JSON-RPC messages to the endpoint announced on that
+stream. Every session runs against the same MCP server instance, so the tool
+registry, caches and upstream clients are shared rather than rebuilt per
+agent. Metrics are served in the Prometheus text format at ``/metrics``.
+
+The endpoints are not authenticated: anyone who can reach them can call the
+tools with the server's Plaid credentials. Keep the server on a loopback
+interface, or behind a proxy that authenticates clients.
+"""
+
+import contextlib
+import ipaddress
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from urllib.parse import quote
+from uuid import UUID, uuid4
+
+import anyio
+import mcp.types as types
+import uvicorn
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from mcp.server import Server
+from mcp.server.models import InitializationOptions
+from pydantic import ValidationError
+from sse_starlette import EventSourceResponse
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Mount, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mcp_server_plaid.metrics import metrics
+
+logger = logging.getLogger("plaid-mcp-server.http")
+
+SSE_PATH = "/sse"
+MESSAGES_PATH = "/messages/"
+
+
+def is_loopback_host(host: str) -> bool:
+    """Whether a listen address only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def warn_if_exposed(host: str) -> None:
+    """Warn when the unauthenticated endpoints listen beyond loopback."""
+    if not is_loopback_host(host):
+        logger.warning(
+            f"Listening on {host}: the MCP endpoints are not authenticated, so anyone who can reach them can "
+            f"call the tools with this server's Plaid credentials. Use a loopback address or an authenticating proxy."
+        )
+
+
+class SessionTransport:
+    """
+    The MCP HTTP+SSE transport, keeping its own table of open sessions.
+
+    It speaks the same protocol as mcp's SseServerTransport, but a session is
+    forgotten as soon as its stream ends, so messages posted to a closed
+    session get a 404 and the table does not grow with every session served.
+    """
+
+    def __init__(self, endpoint: str):
+        """
+        Initialize the transport.
+
+        Args:
+            endpoint: Path clients are told to post their messages to
+        """
+        self.endpoint = endpoint
+        # session id -> stream the session's posted messages are delivered to
+        self.sessions: Dict[UUID, MemoryObjectSendStream] = {}
+
+    @contextlib.asynccontextmanager
+    async def connect_sse(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> AsyncIterator[Tuple[MemoryObjectReceiveStream, MemoryObjectSendStream]]:
+        """Open a session's event stream and yield its read and write streams."""
+        read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+        write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[Dict[str, Any]](0)
+
+        session_id = uuid4()
+        session_uri = f"{quote(self.endpoint)}?session_id={session_id.hex}"
+
+        async def sse_writer() -> None:
+            async with sse_stream_writer, write_stream_reader:
+                # The first event announces the session's message endpoint
+                await sse_stream_writer.send({"event": "endpoint", "data": session_uri})
+                async for message in write_stream_reader:
+                    await sse_stream_writer.send(
+                        {"event": "message", "data": message.model_dump_json(by_alias=True, exclude_none=True)}
+                    )
+
+        self.sessions[session_id] = read_stream_writer
+        try:
+            async with anyio.create_task_group() as tg:
+                response = EventSourceResponse(content=sse_stream_reader, data_sender_callable=sse_writer)
+                tg.start_soon(response, scope, receive, send)
+                yield read_stream, write_stream
+        finally:
+            del self.sessions[session_id]
+
+    async def handle_post_message(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Deliver a posted JSON-RPC message to its session."""
+        request = Request(scope, receive)
+        try:
+            session_id = UUID(hex=request.query_params.get("session_id", ""))
+        except ValueError:
+            response = Response("Invalid session ID", status_code=400)
+            await response(scope, receive, send)
+            return
+
+        writer = self.sessions.get(session_id)
+        if writer is None:
+            response = Response("Could not find session", status_code=404)
+            await response(scope, receive, send)
+            return
+
+        try:
+            message = types.JSONRPCMessage.model_validate_json(await request.body())
+        except ValidationError as e:
+            logger.warning(f"Could not parse message for session {session_id.hex}: {e}")
+            response = Response("Could not parse message", status_code=400)
+            await response(scope, receive, send)
+            await writer.send(e)
+            return
+
+        response = Response("Accepted", status_code=202)
+        await response(scope, receive, send)
+        await writer.send(message)
+
+
+class SseEndpoint:
+    """ASGI endpoint that runs one MCP session per SSE connection."""
+
+    def __init__(
+            self,
+            server: Server,
+            initialization_options: InitializationOptions,
+            transport: SessionTransport,
+            max_sessions: int = 0,
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            server: The MCP server shared by all sessions
+            initialization_options: Options sent to clients during initialization
+            transport: The SSE transport that receives the sessions' posted messages
+            max_sessions: Maximum number of concurrent sessions (0 means unlimited)
+        """
+        self.server = server
+        self.initialization_options = initialization_options
+        self.transport = transport
+        self.max_sessions = max_sessions
+        self.active_sessions = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.max_sessions and self.active_sessions >= self.max_sessions:
+            logger.warning(f"Rejecting MCP session: {self.active_sessions} sessions already open")
+            response = Response(
+                "Too many MCP sessions, please retry shortly", status_code=503, headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        # The server keeps running a session after its client goes away, so
+        # watch for the disconnect and stop the session ourselves
+        with anyio.CancelScope() as cancel_scope:
+            async def watch_receive() -> Message:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    cancel_scope.cancel()
+                return message
+
+            self.active_sessions += 1
+            logger.info(f"MCP session opened ({self.active_sessions} active)")
+            try:
+                async with self.transport.connect_sse(scope, watch_receive, send) as streams:
+                    await self.server.run(streams[0], streams[1], self.initialization_options)
+            finally:
+                self.active_sessions -= 1
+                logger.info(f"MCP session closed ({self.active_sessions} active)")
+
+
+def create_app(
+        server: Server,
+        initialization_options: InitializationOptions,
+        max_sessions: int = 0,
+        messages_path: str = MESSAGES_PATH,
+        message_router: Optional[Callable[[ASGIApp], ASGIApp]] = None,
+) -> Starlette:
+    """
+    Create the ASGI application serving MCP sessions over HTTP.
+
+    Args:
+        server: The MCP server shared by all sessions
+        initialization_options: Options sent to clients during initialization
+        max_sessions: Maximum number of concurrent sessions (0 means unlimited)
+        messages_path: Path clients post their messages to, under MESSAGES_PATH
+        message_router: Optional wrapper around the app handling posted
+            messages, e.g. to forward messages of sessions served elsewhere
+
+    Returns:
+        A Starlette application with the SSE, message, health and metrics endpoints
+    """
+    transport = SessionTransport(messages_path)
+    sse_endpoint = SseEndpoint(server, initialization_options, transport, max_sessions)
+    messages_app: ASGIApp = transport.handle_post_message
+    if message_router is not None:
+        messages_app = message_router(messages_app)
+
+    async def health(request: Request) -> Response:
+        return JSONResponse({"status": "ok", "sessions": sse_endpoint.active_sessions})
+
+    async def prometheus_metrics(request: Request) -> Response:
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+    metrics.register_collector("http", lambda: {"sessions": sse_endpoint.active_sessions})
+
+    app = Starlette(
+        routes=[
+            Route(SSE_PATH, endpoint=sse_endpoint),
+            Mount(MESSAGES_PATH, app=messages_app),
+            Route("/healthz", endpoint=health),
+            Route("/metrics", endpoint=prometheus_metrics),
+        ]
+    )
+    app.state.sse_endpoint = sse_endpoint
+    return app
+
+
+async def run_http(
+        server: Server,
+        initialization_options: InitializationOptions,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_sessions: int = 0,
+) -> None:
+    """
+    Serve MCP sessions over HTTP until interrupted.
+
+    Args:
+        server: The MCP server shared by all sessions
+        initialization_options: Options sent to clients during initialization
+        host: Interface to listen on, normally a loopback address
+        port: Port to listen on
+        max_sessions: Maximum number of concurrent sessions (0 means unlimited)
+    """
+    warn_if_exposed(host)
+    app = create_app(server, initialization_options, max_sessions)
+    config = uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off")
+    logger.info(f"Serving MCP over HTTP at http://{host}:{port}{SSE_PATH}")
+    await uvicorn.Server(config).serve()
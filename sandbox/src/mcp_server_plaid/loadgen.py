@@ -0,0 +1,467 @@
+"""
+Load generator for the Plaid MCP server.
+
+This module pushes concurrent tools/call traffic through a running server the
+way agents do, over stdio or HTTP, and reports latency percentiles, error
+rates and throughput per tool. Traffic is either a synthetic weighted mix of
+tools with representative arguments, or a replay of recorded calls.
+
+Recorded calls are JSON lines of the form
+``{"tool": "simulate_webhook", "arguments": {...}}``. The string
+``$access_token`` anywhere in the arguments is replaced with an access token
+created for the session before the run starts.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import shlex
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import click
+import mcp.types as types
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
+from mcp.client.stdio import get_default_environment, stdio_client
+
+logger = logging.getLogger("plaid-mcp-server.loadgen")
+
+ACCESS_TOKEN_PLACEHOLDER = "$access_token"
+
+# Representative arguments for the synthetic mix
+SYNTHETIC_ARGUMENTS: Dict[str, Dict[str, Any]] = {
+    "search_documentation": {"question": "How do I use /transactions/sync to fetch transaction updates?"},
+    "get_sandbox_access_token": {"initial_products": "transactions"},
+    "simulate_webhook": {
+        "access_token": ACCESS_TOKEN_PLACEHOLDER,
+        "webhook_type": "TRANSACTIONS",
+        "webhook_code": "SYNC_UPDATES_AVAILABLE",
+    },
+    "get_mock_data_prompt": {"num_of_transactions": "20"},
+    "search_integration_guides": {"query": "transfer authorization", "top_k": 3},
+    "generate_mock_data": {"num_of_transactions": 100},
+}
+
+DEFAULT_MIX = "search_documentation=1,get_sandbox_access_token=2,simulate_webhook=4,get_mock_data_prompt=3"
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class CallSpec:
+    """A single tools/call to send."""
+
+    tool: str
+    arguments: Dict[str, Any]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Parse a tool mix such as "search_documentation=1,simulate_webhook=3".
+
+    Tools without a weight get weight 1.
+
+    Raises:
+        ValueError: If a weight is not a positive number or a tool has no synthetic arguments
+    """
+    weights: Dict[str, float] = {}
+    for entry in mix.split(","):
+        if not entry.strip():
+            continue
+        tool, _, weight = entry.partition("=")
+        tool = tool.strip()
+        if tool not in SYNTHETIC_ARGUMENTS:
+            raise ValueError(f"No synthetic arguments for tool {tool}; use a replay file instead")
+        try:
+            weights[tool] = float(weight) if weight.strip() else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for {tool}: {weight}") from None
+        if weights[tool] <= 0:
+            raise ValueError(f"Weight for {tool} must be positive")
+    if not weights:
+        raise ValueError("The tool mix is empty")
+    return weights
+
+
+def load_replay(path: Path) -> List[CallSpec]:
+    """
+    Load recorded calls from a JSON lines file.
+
+    Raises:
+        ValueError: If a line is not a valid recorded call
+    """
+    calls = []
+    for number, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            calls.append(CallSpec(record["tool"], record.get("arguments") or {}))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"{path}:{number}: invalid recorded call: {e}") from None
+    if not calls:
+        raise ValueError(f"{path} contains no calls")
+    return calls
+
+
+def _substitute(value: Any, access_token: str) -> Any:
+    """Replace the access token placeholder in call arguments."""
+    if isinstance(value, str):
+        return value.replace(ACCESS_TOKEN_PLACEHOLDER, access_token)
+    if isinstance(value, dict):
+        return {key: _substitute(item, access_token) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_substitute(item, access_token) for item in value]
+    return value
+
+
+class Workload:
+    """Produces the sequence of calls to send."""
+
+    def __init__(
+            self,
+            weights: Optional[Dict[str, float]] = None,
+            replay: Optional[Sequence[CallSpec]] = None,
+            seed: Optional[int] = None,
+    ):
+        """
+        Initialize the workload.
+
+        Args:
+            weights: Relative weights of tools in a synthetic mix
+            replay: Recorded calls, replayed in order and repeated as needed
+            seed: Seed for the synthetic mix
+        """
+        if (weights is None) == (replay is None):
+            raise ValueError("Pass either weights or replay")
+        self._weights = weights
+        self._replay = list(replay or [])
+        self._position = 0
+        self._rng = random.Random(seed)
+
+    @property
+    def tools(self) -> List[str]:
+        """Tools the workload calls."""
+        if self._weights is not None:
+            return list(self._weights)
+        return sorted({call.tool for call in self._replay})
+
+    @property
+    def needs_access_token(self) -> bool:
+        """Whether any call uses the access token placeholder."""
+        calls = self._replay or [CallSpec(tool, SYNTHETIC_ARGUMENTS[tool]) for tool in self._weights]
+        return any(ACCESS_TOKEN_PLACEHOLDER in json.dumps(call.arguments) for call in calls)
+
+    def next_call(self, access_token: str = "") -> CallSpec:
+        """Get the next call, with the access token filled in."""
+        if self._weights is not None:
+            tool = self._rng.choices(list(self._weights), weights=list(self._weights.values()))[0]
+            call = CallSpec(tool, SYNTHETIC_ARGUMENTS[tool])
+        else:
+            call = self._replay[self._position % len(self._replay)]
+            self._position += 1
+        return CallSpec(call.tool, _substitute(call.arguments, access_token))
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+@dataclass
+class ToolStats:
+    """Outcomes of the calls to one tool."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    error_samples: List[str] = field(default_factory=list)
+
+    def record(self, latency: float, error: Optional[str] = None) -> None:
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors += 1
+            if len(self.error_samples) < 3:
+                self.error_samples.append(error[:200])
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        calls = len(latencies)
+        return {
+            "calls": calls,
+            "errors": self.errors,
+            "error_rate": self.errors / calls if calls else 0.0,
+            "throughput": calls / elapsed if elapsed else 0.0,
+            **{f"p{q}": percentile(latencies, q) for q in PERCENTILES},
+            "max": latencies[-1] if latencies else 0.0,
+            "error_samples": self.error_samples,
+        }
+
+
+def _error_text(result: types.CallToolResult) -> Optional[str]:
+    """Describe a failed call, or return None if it succeeded."""
+    if not result.isError:
+        return None
+    # Failed calls are the ones the server counts in mcp_tool_errors_total
+    text = " ".join(item.text for item in result.content if isinstance(item, types.TextContent))
+    return text or "error"
+
+
+async def run_load(
+        sessions: Sequence[Any],
+        workload: Workload,
+        concurrency: int = 4,
+        rate: Optional[float] = None,
+        duration: Optional[float] = 30.0,
+        requests: Optional[int] = None,
+        access_tokens: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Send calls through the sessions and measure them.
+
+    Without a rate, ``concurrency`` workers send calls back to back (closed
+    loop). With a rate, calls are scheduled at that many per second (open
+    loop), with at most ``concurrency`` in flight. A call that finds every
+    slot taken waits for one and is counted as delayed, and its latency is
+    measured from its scheduled start, so the time it spent waiting shows in
+    the percentiles. Calls scheduled during the wait are sent as soon as
+    slots free up, to catch up with the schedule. Calls are spread
+    round-robin over the sessions.
+
+    Args:
+        sessions: Initialized MCP client sessions
+        workload: The calls to send
+        concurrency: Maximum number of calls in flight
+        rate: Target calls per second, or None for closed-loop load
+        duration: Seconds to generate load for, or None to stop after requests calls
+        requests: Number of calls to send, or None to stop after duration
+        access_tokens: Access token per session, for the access token placeholder
+
+    Returns:
+        The report, with per-tool and overall statistics, and the number of
+        calls delayed by the concurrency cap
+    """
+    stats: Dict[str, ToolStats] = {}
+    total = ToolStats()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + duration if duration else None
+    issued = 0
+    delayed = 0
+    in_flight = asyncio.Semaphore(max(1, concurrency))
+
+    def more() -> bool:
+        if requests is not None and issued >= requests:
+            return False
+        return deadline is None or loop.time() < deadline
+
+    async def send(number: int, scheduled: Optional[float] = None) -> None:
+        session_index = number % len(sessions)
+        token = access_tokens[session_index] if access_tokens else ""
+        call = workload.next_call(token)
+        call_started = time.perf_counter() if scheduled is None else scheduled
+        error: Optional[str] = None
+        try:
+            result = await sessions[session_index].call_tool(call.tool, call.arguments)
+            error = _error_text(result)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        latency = time.perf_counter() - call_started
+        stats.setdefault(call.tool, ToolStats()).record(latency, error)
+        total.record(latency, error)
+
+    async def worker() -> None:
+        nonlocal issued
+        while more():
+            number = issued
+            issued += 1
+            await send(number)
+
+    async def paced() -> None:
+        nonlocal issued, delayed
+        tasks = set()
+        scheduled = time.perf_counter()
+        while more():
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            if in_flight.locked():
+                delayed += 1
+            await in_flight.acquire()
+            number = issued
+            issued += 1
+            task = asyncio.create_task(send(number, scheduled))
+            task.add_done_callback(lambda _: in_flight.release())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            scheduled += 1.0 / rate
+        await asyncio.gather(*tasks)
+
+    if rate:
+        await paced()
+    else:
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    elapsed = loop.time() - started
+    return {
+        "elapsed": elapsed,
+        "tools": {tool: tool_stats.summary(elapsed) for tool, tool_stats in sorted(stats.items())},
+        "total": total.summary(elapsed),
+        "delayed": delayed,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Format a load report as a text table, latencies in milliseconds."""
+    header = f"{'tool':<28} {'calls':>7} {'errors':>7} {'err %':>6} {'calls/s':>8}"
+    header += "".join(f" {f'p{q}':>8}" for q in PERCENTILES) + f" {'max':>8}"
+    lines = [header]
+    rows = list(report["tools"].items()) + [("TOTAL", report["total"])]
+    for tool, summary in rows:
+        line = (
+            f"{tool:<28} {summary['calls']:>7} {summary['errors']:>7} "
+            f"{summary['error_rate'] * 100:>6.1f} {summary['throughput']:>8.1f}"
+        )
+        line += "".join(f" {summary[f'p{q}'] * 1e3:>8.1f}" for q in PERCENTILES)
+        line += f" {summary['max'] * 1e3:>8.1f}"
+        lines.append(line)
+    lines.append(f"\nElapsed: {report['elapsed']:.1f}s")
+    if report.get("delayed"):
+        lines.append(
+            f"Delayed by --concurrency: {report['delayed']} calls (their latency includes the wait)"
+        )
+    for tool, summary in report["tools"].items():
+        for sample in summary["error_samples"]:
+            lines.append(f"{tool} error: {sample}")
+    return "\n".join(lines)
+
+
+async def _create_access_token(session: ClientSession) -> str:
+    """Create a sandbox item through the server and return its access token."""
+    result = await session.call_tool("get_sandbox_access_token", {"initial_products": "transactions"})
+    text = " ".join(item.text for item in result.content if isinstance(item, types.TextContent))
+    for line in text.splitlines():
+        if line.startswith("Access Token:"):
+            return line.split(":", 1)[1].strip()
+    raise RuntimeError(f"Could not create a sandbox access token: {text}")
+
+
+async def _run(
+        transport: str,
+        url: str,
+        server_command: Sequence[str],
+        server_env: Dict[str, str],
+        num_sessions: int,
+        workload: Workload,
+        **load_options: Any,
+) -> Dict[str, Any]:
+    async with contextlib.AsyncExitStack() as stack:
+        sessions = []
+        for _ in range(num_sessions):
+            if transport == "sse":
+                streams = await stack.enter_async_context(sse_client(url))
+            else:
+                params = StdioServerParameters(
+                    command=server_command[0], args=list(server_command[1:]), env=server_env
+                )
+                streams = await stack.enter_async_context(stdio_client(params))
+            session = await stack.enter_async_context(ClientSession(*streams))
+            await session.initialize()
+            sessions.append(session)
+
+        available = {tool.name for tool in (await sessions[0].list_tools()).tools}
+        missing = [tool for tool in workload.tools if tool not in available]
+        if missing:
+            raise click.ClickException(f"The server does not offer: {', '.join(missing)}")
+
+        access_tokens = None
+        if workload.needs_access_token:
+            click.echo("Creating a sandbox item per session...", err=True)
+            access_tokens = await asyncio.gather(*(_create_access_token(session) for session in sessions))
+
+        click.echo(f"Generating load over {num_sessions} session(s)...", err=True)
+        return await run_load(sessions, workload, access_tokens=access_tokens, **load_options)
+
+
+@click.command()
+@click.option("--transport", type=click.Choice(["stdio", "sse"]), default="stdio", show_default=True,
+              help="Launch servers over stdio, or connect to a running server over HTTP")
+@click.option("--url", default="http://127.0.0.1:8000/sse", show_default=True,
+              help="SSE endpoint of a running server, with the sse transport")
+@click.option("--server-command", default=shlex.join([sys.executable, "-m", "mcp_server_plaid"]),
+              show_default=True, help="Command launching the server, with the stdio transport; quote arguments "
+                                      "containing spaces as in a shell")
+@click.option("--client-id", envvar="PLAID_CLIENT_ID", help="Plaid client ID passed to launched servers")
+@click.option("--secret", envvar="PLAID_SECRET", help="Plaid secret passed to launched servers")
+@click.option("--sessions", "num_sessions", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Number of MCP sessions (server processes with stdio)")
+@click.option("--mix", default=DEFAULT_MIX, show_default=True,
+              help="Synthetic tool mix as tool=weight pairs")
+@click.option("--replay", type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help="JSON lines file of recorded calls to replay instead of the synthetic mix")
+@click.option("--concurrency", type=click.IntRange(min=1), default=4, show_default=True,
+              help="Maximum number of calls in flight")
+@click.option("--rate", type=click.FloatRange(min=0, min_open=True),
+              help="Target calls per second; without it calls are sent back to back")
+@click.option("--duration", type=click.FloatRange(min=0, min_open=True), default=30.0, show_default=True,
+              help="Seconds to generate load for")
+@click.option("--requests", type=click.IntRange(min=1), help="Stop after this many calls instead of after --duration")
+@click.option("--seed", type=int, help="Seed for the synthetic mix")
+@click.option("--json-output", type=click.Path(dir_okay=False, path_type=Path), help="Also write the report as JSON")
+def main(
+        transport: str,
+        url: str,
+        server_command: str,
+        client_id: Optional[str],
+        secret: Optional[str],
+        num_sessions: int,
+        mix: str,
+        replay: Optional[Path],
+        concurrency: int,
+        rate: Optional[float],
+        duration: float,
+        requests: Optional[int],
+        seed: Optional[int],
+        json_output: Optional[Path],
+):
+    """Generate MCP tools/call load against mcp-server-plaid and report latencies."""
+    # Per-request client logging would drown the report
+    for name in ("httpx", "mcp"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    try:
+        workload = Workload(replay=load_replay(replay), seed=seed) if replay else Workload(parse_mix(mix), seed=seed)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    server_env = get_default_environment()
+    if client_id and secret:
+        server_env.update({"PLAID_CLIENT_ID": client_id, "PLAID_SECRET": secret})
+    elif transport == "stdio":
+        raise click.UsageError("--client-id and --secret (or PLAID_CLIENT_ID and PLAID_SECRET) are required with stdio")
+
+    report = asyncio.run(_run(
+        transport,
+        url,
+        shlex.split(server_command),
+        server_env,
+        num_sessions,
+        workload,
+        concurrency=concurrency,
+        rate=rate,
+        duration=None if requests else duration,
+        requests=requests,
+    ))
+    click.echo(format_report(report))
+    if json_output:
+        json_output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Runtime metrics for the Plaid MCP server.
+
+This module keeps in-process counters, gauges and latency histograms for tool
+calls and upstream requests, plus point-in-time statistics gathered from
+registered collectors such as the answer cache and the sandbox item pool.
+Metrics can be read as a JSON-friendly snapshot or rendered in the Prometheus
+text exposition format.
+
+Metrics are per process: with several HTTP workers, each worker reports its
+own calls.
+"""
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("plaid-mcp-server.metrics")
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Seconds between writes of the metrics file
+DUMP_INTERVAL = 15.0
+
+HELP = {
+    "mcp_tool_calls_total": "Tool calls received",
+    "mcp_tool_errors_total": "Tool calls that failed, returned to the client as error results",
+    "mcp_tool_in_flight": "Tool calls currently running or waiting for a slot",
+    "mcp_tool_duration_seconds": "Tool call latency, including time waiting for a slot",
+    "mcp_upstream_calls_total": "Requests sent to Plaid and AskBill",
+    "mcp_upstream_errors_total": "Requests to Plaid and AskBill that failed or timed out",
+    "mcp_upstream_in_flight": "Requests to Plaid and AskBill currently running",
+    "mcp_upstream_duration_seconds": "Latency of requests to Plaid and AskBill",
+    "mcp_askbill_coalesced_total": "AskBill questions answered by joining an identical question in flight",
+    "mcp_askbill_first_chunk_seconds": "Time from sending an AskBill question to its first streamed chunk",
+    "mcp_askbill_hedges_total": "AskBill questions sent a second time because the first was slow to answer",
+    "mcp_askbill_hedge_wins_total": "Hedged AskBill questions answered first by the second request",
+    "mcp_askbill_dedicated_connections_total": "AskBill questions asked on a connection of their own because "
+                                               "answers could not be told apart on the shared one",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Dict[str, Any]]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets
+        """
+        self.buckets = buckets
+        # Per-bucket (not cumulative) counts, the last one for values above every bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Args:
+            q: The quantile, between 0 and 1
+
+        Returns:
+            The estimated value, or 0 if nothing was observed
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / count)
+            seen += count
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Get the count and mean, p50, p95, p99 and maximum, in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """
+    Registry of the server's metrics.
+
+    This class implements the Singleton pattern, like the tool registry, so
+    clients and tools record into the same metrics without passing them around.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Ensure only one instance of Metrics exists."""
+        if cls._instance is None:
+            cls._instance = super(Metrics, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the metrics if not already initialized."""
+        if not getattr(self, "_initialized", False):
+            self._collectors: Dict[str, Collector] = {}
+            self._dump_task: Optional[asyncio.Task] = None
+            self.reset()
+            self._initialized = True
+
+    def reset(self) -> None:
+        """
+        Clear all recorded metrics, keeping the collectors.
+
+        This is primarily useful for testing.
+        """
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.started_at = time.monotonic()
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Increase a counter."""
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def add(self, name: str, value: float, **labels: Any) -> None:
+        """Increase or decrease a gauge."""
+        series = self.gauges.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a value in a histogram."""
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    @contextlib.contextmanager
+    def track(self, prefix: str, **labels: Any) -> Iterator[None]:
+        """
+        Record a call's count, in-flight gauge, latency and errors.
+
+        The metrics are named ``<prefix>_calls_total``, ``<prefix>_in_flight``,
+        ``<prefix>_duration_seconds`` and ``<prefix>_errors_total``, the last
+        labelled with the exception type.
+
+        Args:
+            prefix: Metric name prefix, e.g. "mcp_tool"
+            **labels: Labels identifying the call, e.g. tool="search_documentation"
+        """
+        self.inc(f"{prefix}_calls_total", **labels)
+        self.add(f"{prefix}_in_flight", 1, **labels)
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self.inc(f"{prefix}_errors_total", **labels, error=type(e).__name__)
+            raise
+        finally:
+            self.add(f"{prefix}_in_flight", -1, **labels)
+            self.observe(f"{prefix}_duration_seconds", time.perf_counter() - started, **labels)
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """
+        Register a source of point-in-time statistics, replacing any of the same name.
+
+        Args:
+            name: Name of the statistics, e.g. "docs_cache"
+            collector: Returns numbers, or mappings of a key to a number
+        """
+        self._collectors[name] = collector
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Gather the statistics of all collectors, skipping any that fail."""
+        stats = {}
+        for name, collector in self._collectors.items():
+            try:
+                stats[name] = collector()
+            except Exception as e:
+                logger.debug(f"Metrics collector {name} failed: {e}")
+        return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current metrics in a JSON-friendly form.
+
+        Returns:
+            Uptime, then per-tool and per-upstream call statistics, then the collectors' statistics
+        """
+
+        def calls(prefix: str) -> Dict[str, Dict[str, Any]]:
+            result = {}
+            for key, histogram in self.histograms.get(f"{prefix}_duration_seconds", {}).items():
+                labels = dict(key)
+                errors = sum(
+                    value for error_key, value in self.counters.get(f"{prefix}_errors_total", {}).items()
+                    if all(item in error_key for item in key)
+                )
+                result[" ".join(labels.values())] = {
+                    "calls": int(self.counters.get(f"{prefix}_calls_total", {}).get(key, 0)),
+                    "errors": int(errors),
+                    "in_flight": int(self.gauges.get(f"{prefix}_in_flight", {}).get(key, 0)),
+                    **{name: round(value, 6) for name, value in histogram.summary().items() if name != "count"},
+                }
+            return dict(sorted(result.items()))
+
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "tools": calls("mcp_tool"),
+            "upstream": calls("mcp_upstream"),
+            "askbill_first_chunk": {
+                " ".join(dict(key).values()) or "all": {k: round(v, 6) for k, v in histogram.summary().items()}
+                for key, histogram in self.histograms.get("mcp_askbill_first_chunk_seconds", {}).items()
+            },
+            **self.collect(),
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(self.counters.items()):
+            header(name, "counter")
+            lines.extend(f"{name}{_format_labels(key)} {_format_value(value)}" for key, value in series.items())
+        for name, series in sorted(self.gauges.items()):
+            header(name, "gauge")
+            lines.extend(f"{name}{_format_labels(key)} {_format_value(value)}" for key, value in series.items())
+        for name, series in sorted(self.histograms.items()):
+            header(name, "histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (math.inf,), histogram.counts):
+                    cumulative += count
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{name}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+
+        # Collector statistics become gauges, with mapping keys as a "key" label
+        for collector, stats in self.collect().items():
+            for stat, value in stats.items():
+                name = f"mcp_{collector}_{stat}"
+                if isinstance(value, dict):
+                    numeric = {k: v for k, v in value.items() if isinstance(v, (int, float))}
+                    if not numeric:
+                        continue
+                    header(name, "gauge")
+                    lines.extend(
+                        f"{name}{_format_labels((('key', str(k)),))} {_format_value(v)}" for k, v in numeric.items()
+                    )
+                elif isinstance(value, (int, float)):
+                    header(name, "gauge")
+                    lines.append(f"{name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """
+        Write the metrics to a file in the Prometheus text format, atomically.
+
+        Args:
+            path: Path of the file, e.g. for the node exporter's textfile collector
+        """
+        try:
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(self.render_prometheus(), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Unable to write metrics file {path}: {e}")
+
+    def start_dump(self, path: Path, interval: float = DUMP_INTERVAL) -> None:
+        """
+        Write the metrics file periodically from the running event loop.
+
+        Args:
+            path: Path of the file
+            interval: Seconds between writes
+        """
+        if self._dump_task is not None and not self._dump_task.done():
+            self._dump_task.cancel()
+
+        async def dump() -> None:
+            while True:
+                self.write_prometheus(path)
+                await asyncio.sleep(interval)
+
+        self._dump_task = asyncio.get_running_loop().create_task(dump())
+
+
+# Function to get the singleton metrics instance
+def get_metrics() -> Metrics:
+    """
+    Get the singleton metrics instance.
+
+    Returns:
+        The singleton Metrics instance
+    """
+    return Metrics()
+
+
+# Export the metrics instance for use by clients and tools
+metrics = get_metrics()
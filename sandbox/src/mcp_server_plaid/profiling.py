@@ -0,0 +1,94 @@
+"""
+Opt-in CPU profiling of tool calls.
+
+This module profiles selected tool calls with cProfile and writes one profile
+per call, named after the tool and the call's duration, so slow calls can be
+opened with ``python -m pstats`` or snakeviz. Only one call is profiled at a
+time; calls selected while another profile is running are not profiled.
+
+cProfile records everything running on the event loop thread while enabled,
+including other calls interleaved with the profiled one. Work done on other
+threads, such as plaid-python calls with the ``sdk`` HTTP client, is not
+recorded.
+"""
+
+import contextlib
+import cProfile
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+logger = logging.getLogger("plaid-mcp-server.profiling")
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class CallProfiler:
+    """Selects tool calls to profile and writes their profiles."""
+
+    def __init__(self, directory: Path, every: int = 0, tools: Iterable[str] = ()):
+        """
+        Initialize the profiler.
+
+        Args:
+            directory: Directory the profiles are written to, created if needed
+            every: Profile every Nth tool call (0 to only profile the named tools)
+            tools: Names of tools whose calls are all profiled
+        """
+        self.directory = directory
+        self.tools = frozenset(tools)
+        # Without a selection, profile every call
+        self.every = every if every or self.tools else 1
+        self._calls = 0
+        self._written = 0
+        self._active = False
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def should_profile(self, name: str) -> bool:
+        """
+        Count a call and decide whether to profile it.
+
+        Args:
+            name: The tool being called
+
+        Returns:
+            True if the call should be profiled
+        """
+        self._calls += 1
+        if self._active:
+            return False
+        return name in self.tools or bool(self.every and self._calls % self.every == 0)
+
+    @contextlib.contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """
+        Profile the enclosed call and write the profile when it ends.
+
+        Args:
+            name: The tool being called
+        """
+        profile = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._active = False
+            self._write(profile, name, time.perf_counter() - started)
+
+    def _write(self, profile: cProfile.Profile, name: str, duration: float) -> None:
+        """Write a profile to the directory."""
+        self._written += 1
+        filename = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{_UNSAFE_FILENAME.sub('_', name)}-"
+            f"{duration * 1000:.0f}ms-{os.getpid()}-{self._written}.prof"
+        )
+        try:
+            profile.dump_stats(self.directory / filename)
+        except OSError as e:
+            logger.warning(f"Unable to write profile {filename}: {e}")
@@ -6,9 +6,15 @@ It allows AI assistants to interact with Plaid's financial data APIs through the
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
+import os
+import sqlite3
 import sys
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import click
 import mcp.server.stdio
@@ -17,10 +23,20 @@ import plaid
 from mcp.server import NotificationOptions
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
-from plaid.api import plaid_api
 
 from mcp_server_plaid.clients.bill import AskBillClient
+from mcp_server_plaid.clients.cache import TTLCache
+from mcp_server_plaid.clients.datasets import DatasetStore
+from mcp_server_plaid.clients.guides import GuideIndex, find_rules_dir
+from mcp_server_plaid.clients.item_store import ItemStore
+from mcp_server_plaid.clients.plaid_async import DEFAULT_MAX_WORKERS, AsyncPlaidApi
+from mcp_server_plaid.clients.plaid_http import PlaidHttpClient
+from mcp_server_plaid.clients.token_pool import SandboxItemPool, parse_profiles
+from mcp_server_plaid.metrics import metrics
+from mcp_server_plaid.profiling import CallProfiler
 from mcp_server_plaid.tools import register_all_tools
+from mcp_server_plaid.tools.limits import ConcurrencyLimiter, SessionLimiters
+from mcp_server_plaid.tools.progress import ProgressReporter
 
 # Set up logging
 logging.basicConfig(
@@ -33,22 +49,185 @@ __version__ = "0.1.0"
 REQUEST_TIMEOUT = 30.0
 
 
-async def serve(client_id: str, secret: str, enabled_categories: str) -> Server:
-    """Initialize and configure the MCP server with Plaid tools."""
-    server = Server("plaid")
+@dataclass
+class ServerOptions:
+    """Tunable settings for the MCP server, with defaults matching the CLI."""
+
+    # Maximum number of search_documentation answers kept in memory (0 disables caching)
+    docs_cache_size: int = 256
+    # Seconds before a cached search_documentation answer expires
+    docs_cache_ttl: float = 3600.0
+    # Directory containing the markdown integration guides for local search
+    rules_dir: Optional[str] = None
+    # Maximum number of concurrent Plaid API calls (thread pool and connection pool size)
+    plaid_max_workers: int = DEFAULT_MAX_WORKERS
+    # Plaid HTTP client: "httpx" (native async) or "sdk" (plaid-python on a thread pool)
+    plaid_http_client: str = "httpx"
+    # Maximum number of calls waiting for a slot on a tool that is at its concurrency limit
+    tool_queue_size: int = 16
+    # Maximum seconds a call waits for a slot before it is rejected as busy
+    tool_queue_timeout: float = 5.0
+    # Product profiles to keep pre-created sandbox items for, e.g. "transactions;auth,transfer"
+    token_pool: str = ""
+    # Number of ready sandbox items kept per pool profile
+    token_pool_size: int = 2
+    # Maximum number of tool calls one MCP session may run at once (0 disables the limit)
+    session_max_calls: int = 8
+    # File the metrics are periodically written to in the Prometheus text format
+    metrics_file: Optional[str] = None
+    # Directory per-call CPU profiles are written to (profiling is disabled without it)
+    profile_dir: Optional[str] = None
+    # Profile every Nth tool call (0 to only profile profile_tools)
+    profile_every: int = 0
+    # Comma-separated tools whose calls are all profiled
+    profile_tools: str = ""
+    # Percentile of AskBill's time to first answer after which a question is sent again (0 disables)
+    askbill_hedge_percentile: float = 0.0
+    # Maximum AskBill hedges as a fraction of the questions asked
+    askbill_hedge_budget: float = 0.1
+    # Directory generate_mock_data writes files to (defaults to mock_data in the cache directory)
+    output_dir: Optional[str] = None
+
+
+async def serve(
+        client_id: str,
+        secret: str,
+        enabled_categories: str,
+        options: Optional[ServerOptions] = None,
+        resources: Optional[contextlib.AsyncExitStack] = None,
+) -> Server:
+    """
+    Initialize and configure the MCP server with Plaid tools.
 
-    ask_bill_client = AskBillClient("wss://hello-finn.herokuapp.com/")
+    Args:
+        client_id: Plaid client ID
+        secret: Plaid secret
+        enabled_categories: Comma-separated tool categories to enable, empty for all
+        options: Tunable settings
+        resources: Stack the upstream clients' cleanup is pushed to, so they
+            are closed when the caller closes it after the server stops
 
-    configuration = plaid.Configuration(
-        host=plaid.Environment.Sandbox,
-        api_key={
-            "clientId": client_id,
-            "secret": secret,
-        },
+    Returns:
+        The configured server
+    """
+    options = options or ServerOptions()
+    server = Server("plaid")
+
+    ask_bill_client = AskBillClient(
+        "wss://hello-finn.herokuapp.com/",
+        hedge_percentile=options.askbill_hedge_percentile,
+        hedge_budget=options.askbill_hedge_budget,
+    )
+    answer_cache = TTLCache(
+        max_entries=options.docs_cache_size, ttl=options.docs_cache_ttl
+    )
+    guide_index = GuideIndex.load_or_build(
+        Path(options.rules_dir) if options.rules_dir else find_rules_dir()
     )
-    plaid_client = plaid_api.PlaidApi(plaid.ApiClient(configuration))
+    dataset_store = DatasetStore()
+    output_dir = Path(options.output_dir).expanduser() if options.output_dir else None
+    try:
+        item_store = ItemStore(client_id)
+    except sqlite3.Error as e:
+        item_store = None
+        logger.warning(f"Sandbox items will not be recorded: {e}")
+
+    if options.plaid_http_client == "sdk":
+        # Imported here because the generated API module is slow to import
+        from plaid.api import plaid_api
+
+        configuration = plaid.Configuration(
+            host=plaid.Environment.Sandbox,
+            api_key={
+                "clientId": client_id,
+                "secret": secret,
+            },
+        )
+        # One pooled connection per worker thread, so no call waits on a connection
+        configuration.connection_pool_maxsize = options.plaid_max_workers
+        plaid_client = AsyncPlaidApi(
+            plaid_api.PlaidApi(plaid.ApiClient(configuration)),
+            max_workers=options.plaid_max_workers,
+        )
+    else:
+        plaid_client = PlaidHttpClient(
+            client_id,
+            secret,
+            host=plaid.Environment.Sandbox,
+            max_connections=options.plaid_max_workers,
+            timeout=REQUEST_TIMEOUT,
+        )
+    if resources is not None:
+        # Callbacks run last to first, so the Plaid client outlives the item pool
+        if isinstance(plaid_client, AsyncPlaidApi):
+            resources.push_async_callback(asyncio.to_thread, plaid_client.shutdown)
+        else:
+            resources.push_async_callback(plaid_client.aclose)
+        resources.push_async_callback(ask_bill_client.close)
+
+    token_pool = None
+    pool_profiles = parse_profiles(options.token_pool or "")
+    if pool_profiles and options.token_pool_size > 0:
+        token_pool = SandboxItemPool(plaid_client, pool_profiles, size=options.token_pool_size)
+        token_pool.start()
+        if resources is not None:
+            resources.push_async_callback(token_pool.close)
+        logger.info(f"Pre-warming sandbox items for: {'; '.join(pool_profiles)}")
 
     tool_registry = register_all_tools(enabled_categories)
+    limiters: Dict[str, ConcurrencyLimiter] = {}
+    # Over HTTP many sessions share the tool limits, so no single agent may hog them
+    session_limiters = SessionLimiters(
+        options.session_max_calls,
+        max_queue=options.tool_queue_size,
+        max_wait=options.tool_queue_timeout,
+    )
+
+    def get_limiter(name: str) -> Optional[ConcurrencyLimiter]:
+        """Get the limiter for a tool with a declared concurrency limit."""
+        if name not in limiters:
+            max_concurrency = tool_registry.get_concurrency_limit(name)
+            if not isinstance(max_concurrency, int):
+                return None
+            limiters[name] = ConcurrencyLimiter(
+                name,
+                max_concurrency,
+                max_queue=options.tool_queue_size,
+                max_wait=options.tool_queue_timeout,
+            )
+        return limiters[name]
+
+    metrics.register_collector("docs_cache", answer_cache.stats)
+    metrics.register_collector("askbill", ask_bill_client.stats)
+    metrics.register_collector("datasets", dataset_store.stats)
+    if item_store is not None:
+        metrics.register_collector("sandbox_items", item_store.stats)
+    metrics.register_collector("tool_limits", lambda: {
+        "in_flight": {name: limiter.in_flight for name, limiter in limiters.items()},
+        "waiting": {name: limiter.waiting for name, limiter in limiters.items()},
+    })
+    metrics.register_collector("session_limits", lambda: {"sessions": len(session_limiters)})
+    if token_pool is not None:
+        metrics.register_collector("token_pool", token_pool.stats)
+    if options.metrics_file:
+        metrics.start_dump(Path(options.metrics_file))
+
+    profiler = None
+    if options.profile_dir:
+        profiler = CallProfiler(
+            Path(options.profile_dir),
+            every=options.profile_every,
+            tools=[tool.strip() for tool in options.profile_tools.split(",") if tool.strip()],
+        )
+        logger.info(f"Profiling tool calls to {options.profile_dir}")
+
+    def get_session_limiter() -> Optional[ConcurrencyLimiter]:
+        """Get the limiter for the session making the current request."""
+        try:
+            session = server.request_context.session
+        except LookupError:
+            return None
+        return session_limiters.get(session)
 
     @server.list_tools()
     async def handle_list_tools() -> List[types.Tool]:
@@ -69,13 +248,35 @@ async def serve(client_id: str, secret: str, enabled_categories: str) -> Server:
         if handler is None:
             raise ValueError(f"No handler registered for tool: {name}")
 
-        # Call the handler with the arguments and context
-        return await handler(
-            arguments or {},  # Ensure arguments is not None
+        # Bind the handler to the arguments and context
+        arguments = arguments or {}  # Ensure arguments is not None
+        call = functools.partial(
+            handler,
+            arguments,
             bill_client=ask_bill_client,
             plaid_client=plaid_client,
+            answer_cache=answer_cache,
+            guide_index=guide_index,
+            token_pool=token_pool,
+            dataset_store=dataset_store,
+            item_store=item_store,
+            output_dir=output_dir,
+            progress=ProgressReporter.from_request_context(server),
         )
 
+        # Calls wait for a slot in their session and, for tools with a
+        # concurrency limit, in the tool, or fail fast as busy
+        with metrics.track("mcp_tool", tool=name):
+            # Invalid calls fail here, before taking a slot or reaching Plaid
+            tool_registry.validate_arguments(name, arguments)
+            async with contextlib.AsyncExitStack() as stack:
+                for limiter in (get_session_limiter(), get_limiter(name)):
+                    if limiter is not None:
+                        await stack.enter_async_context(limiter)
+                if profiler is not None and profiler.should_profile(name):
+                    stack.enter_context(profiler.profile(name))
+                return await call()
+
     return server
 
 
@@ -84,7 +285,83 @@ async def serve(client_id: str, secret: str, enabled_categories: str) -> Server:
 @click.option("--secret", type=str, help="Plaid secret", envvar="PLAID_SECRET", required=True)
 @click.option("--enabled-categories", type=str, help="Comma-separated list of enabled categories",
               envvar="TOOLS_TO_ENABLE")
-def main(client_id: str, secret: str, enabled_categories: str):
+@click.option("--docs-cache-size", type=int, default=ServerOptions.docs_cache_size, show_default=True,
+              help="Maximum number of cached search_documentation answers (0 disables caching)",
+              envvar="DOCS_CACHE_SIZE")
+@click.option("--docs-cache-ttl", type=float, default=ServerOptions.docs_cache_ttl, show_default=True,
+              help="Seconds before a cached search_documentation answer expires", envvar="DOCS_CACHE_TTL")
+@click.option("--rules-dir", type=click.Path(exists=True, file_okay=False),
+              help="Directory of markdown integration guides for local search", envvar="PLAID_RULES_DIR")
+@click.option("--plaid-max-workers", type=click.IntRange(min=1), default=ServerOptions.plaid_max_workers,
+              show_default=True, help="Maximum number of concurrent Plaid API calls", envvar="PLAID_MAX_WORKERS")
+@click.option("--plaid-http-client", type=click.Choice(["httpx", "sdk"]), default=ServerOptions.plaid_http_client,
+              show_default=True, help="HTTP client for Plaid API calls: native async httpx, or plaid-python on threads",
+              envvar="PLAID_HTTP_CLIENT")
+@click.option("--tool-queue-size", type=click.IntRange(min=0), default=ServerOptions.tool_queue_size,
+              show_default=True, help="Maximum number of calls waiting on a tool at its concurrency limit",
+              envvar="TOOL_QUEUE_SIZE")
+@click.option("--tool-queue-timeout", type=float, default=ServerOptions.tool_queue_timeout, show_default=True,
+              help="Seconds a call waits for a busy tool before it is rejected", envvar="TOOL_QUEUE_TIMEOUT")
+@click.option("--token-pool", type=str, default=ServerOptions.token_pool,
+              help="Semicolon-separated product profiles to pre-create sandbox items for, "
+                   "e.g. 'transactions;auth,transfer'", envvar="SANDBOX_TOKEN_POOL")
+@click.option("--token-pool-size", type=click.IntRange(min=0), default=ServerOptions.token_pool_size,
+              show_default=True, help="Number of ready sandbox items kept per pool profile",
+              envvar="SANDBOX_TOKEN_POOL_SIZE")
+@click.option("--session-max-calls", type=click.IntRange(min=0), default=ServerOptions.session_max_calls,
+              show_default=True, help="Maximum number of tool calls one MCP session may run at once (0 for no limit)",
+              envvar="MCP_SESSION_MAX_CALLS")
+@click.option("--metrics-file", type=click.Path(dir_okay=False),
+              help="File to periodically write metrics to in the Prometheus text format", envvar="MCP_METRICS_FILE")
+@click.option("--profile-dir", type=click.Path(file_okay=False),
+              help="Directory to write per-call CPU profiles to; enables profiling", envvar="MCP_PROFILE_DIR")
+@click.option("--profile-every", type=click.IntRange(min=0), default=ServerOptions.profile_every, show_default=True,
+              help="Profile every Nth tool call (0 to only profile --profile-tools, or every call if both are unset)",
+              envvar="MCP_PROFILE_EVERY")
+@click.option("--profile-tools", type=str, default=ServerOptions.profile_tools,
+              help="Comma-separated tools whose calls are all profiled", envvar="MCP_PROFILE_TOOLS")
+@click.option("--askbill-hedge-percentile", type=click.FloatRange(min=0, max=100),
+              default=ServerOptions.askbill_hedge_percentile, show_default=True,
+              help="Send an AskBill question again when it has not started answering within this percentile "
+                   "of recent answer times (0 disables hedging)", envvar="ASKBILL_HEDGE_PERCENTILE")
+@click.option("--askbill-hedge-budget", type=click.FloatRange(min=0, max=1),
+              default=ServerOptions.askbill_hedge_budget, show_default=True,
+              help="Maximum AskBill hedges as a fraction of the questions asked", envvar="ASKBILL_HEDGE_BUDGET")
+@click.option("--output-dir", type=click.Path(file_okay=False),
+              help="Directory generate_mock_data writes files to (defaults to mock_data in the cache directory)",
+              envvar="PLAID_MCP_OUTPUT_DIR")
+@click.option("--transport", type=click.Choice(["stdio", "sse"]), default="stdio", show_default=True,
+              help="Serve one client over stdio, or many clients over HTTP with server-sent events",
+              envvar="MCP_TRANSPORT")
+@click.option("--host", type=str, default="127.0.0.1", show_default=True,
+              help="Interface to listen on with the sse transport; the endpoints are not authenticated, "
+                   "so keep it on loopback", envvar="MCP_HOST")
+@click.option("--port", type=click.IntRange(min=0, max=65535), default=8000, show_default=True,
+              help="Port to listen on with the sse transport", envvar="MCP_PORT")
+@click.option("--max-sessions", type=click.IntRange(min=0), default=64, show_default=True,
+              help="Maximum number of concurrent MCP sessions with the sse transport (0 for no limit)",
+              envvar="MCP_MAX_SESSIONS")
+@click.option("--workers", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Number of worker processes serving the sse transport", envvar="MCP_WORKERS")
+@click.option("--worker-max-calls", type=click.IntRange(min=0), default=0, show_default=True,
+              help="Tool calls after which a worker process is replaced (0 to never replace workers)",
+              envvar="MCP_WORKER_MAX_CALLS")
+@click.option("--worker-drain-timeout", type=click.FloatRange(min=0), default=300.0, show_default=True,
+              help="Seconds a replaced worker waits for its open sessions to close before cutting them off "
+                   "(0 to wait as long as they stay open)", envvar="MCP_WORKER_DRAIN_TIMEOUT")
+def main(
+        client_id: str,
+        secret: str,
+        enabled_categories: str,
+        transport: str = "stdio",
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_sessions: int = 64,
+        workers: int = 1,
+        worker_max_calls: int = 0,
+        worker_drain_timeout: float = 300.0,
+        **options: Any,
+):
     """Entry point for the MCP server."""
     # Validate required environment variables
     if not client_id or not secret:
@@ -93,21 +370,53 @@ def main(client_id: str, secret: str, enabled_categories: str):
         )
         sys.exit(1)
 
+    pooled = transport == "sse" and (workers > 1 or worker_max_calls)
+
+    async def _make_server(resources: contextlib.AsyncExitStack):
+        server_options = ServerOptions(**options)
+        if pooled and server_options.metrics_file:
+            # Runs in each worker process, so every worker gets its own file
+            server_options.metrics_file = f"{server_options.metrics_file}.{os.getpid()}"
+        server = await serve(client_id, secret, enabled_categories, server_options, resources)
+        initialization_options = InitializationOptions(
+            server_name="plaid",
+            server_version=__version__,
+            capabilities=server.get_capabilities(
+                notification_options=NotificationOptions(),
+                experimental_capabilities={},
+            ),
+        )
+        return server, initialization_options
+
+    if pooled:
+        from mcp_server_plaid.workers import WorkerPool
+
+        # Each worker process builds its own server, clients and event loop
+        WorkerPool(
+            _make_server,
+            workers=workers,
+            host=host,
+            port=port,
+            max_sessions=max_sessions,
+            max_calls=worker_max_calls,
+            drain_timeout=worker_drain_timeout,
+        ).run()
+        return
+
     async def _run():
-        logger.info("Setting up stdio communication channels")
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            server = await serve(client_id, secret, enabled_categories)
-            await server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="plaid",
-                    server_version=__version__,
-                    capabilities=server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
-                ),
-            )
+        # Closes the upstream clients once the server stops
+        async with contextlib.AsyncExitStack() as resources:
+            server, initialization_options = await _make_server(resources)
+
+            if transport == "sse":
+                # Imported here so stdio servers don't pay for the HTTP stack
+                from mcp_server_plaid.http_server import run_http
+
+                await run_http(server, initialization_options, host=host, port=port, max_sessions=max_sessions)
+                return
+
+            logger.info("Setting up stdio communication channels")
+            async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                await server.run(read_stream, write_stream, initialization_options)
 
     asyncio.run(_run())
@@ -0,0 +1,30 @@
+"""
+Local storage locations for the Plaid MCP server.
+
+This module resolves the directory used to persist caches and indexes between
+server runs.
+"""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory used for persisted caches, creating it if needed.
+
+    The location can be overridden with the PLAID_MCP_CACHE_DIR environment
+    variable. Otherwise it follows XDG_CACHE_HOME, defaulting to ~/.cache.
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.environ.get("PLAID_MCP_CACHE_DIR")
+    if override:
+        cache_dir = Path(override)
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base) / "mcp-server-plaid"
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
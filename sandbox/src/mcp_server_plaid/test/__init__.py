@@ -2,4 +2,17 @@
 Test package for the MCP Server Plaid.
 
 This package contains tests for the MCP Server Plaid functionality.
-""" 
\ No newline at end of file
+
+Tests never touch the user's cache: the package points PLAID_MCP_CACHE_DIR at
+a temporary directory, so manifests, indexes and databases written by one run
+don't leak into the next. Tests that need a cache of their own override the
+variable again.
+"""
+
+import atexit
+import os
+import tempfile
+
+_cache_dir = tempfile.TemporaryDirectory(prefix="mcp-server-plaid-test-")
+atexit.register(_cache_dir.cleanup)
+os.environ["PLAID_MCP_CACHE_DIR"] = _cache_dir.name
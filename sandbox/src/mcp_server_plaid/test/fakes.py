@@ -0,0 +1,63 @@
+"""
+Stand-ins shared by the tests.
+
+This module contains a fake async Plaid client for tests of the tools and
+clients that create sandbox items.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Callable, Dict, List, Optional
+
+
+class FakePlaidClient:
+    """
+    Async Plaid client stand-in that hands out numbered sandbox items.
+
+    Every public token request is recorded in ``created``, and the most items
+    created at the same time in ``max_in_flight``.
+    """
+
+    def __init__(
+            self,
+            delay: float = 0.0,
+            accounts: Optional[List[Dict[str, Any]]] = None,
+            error: Optional[Callable[[Any], Optional[Exception]]] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            delay: Seconds each public token request takes
+            accounts: Accounts returned by auth_get, defaults to one account named after the item
+            error: Returns the exception a public token request fails with, or None to let it succeed
+        """
+        self.delay = delay
+        self.accounts = accounts
+        self.error = error
+        self.created: List[Any] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._counter = itertools.count(1)
+
+    async def sandbox_public_token_create(self, request):
+        self.created.append(request)
+        error = self.error(request) if self.error else None
+        if error is not None:
+            raise error
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return {"public_token": f"public-{next(self._counter)}"}
+
+    async def item_public_token_exchange(self, request):
+        number = request.public_token.split("-")[1]
+        return {"access_token": f"access-{number}", "item_id": f"item-{number}"}
+
+    async def auth_get(self, request):
+        if self.accounts is not None:
+            return {"accounts": self.accounts}
+        return {"accounts": [{"account_id": f"acc-for-{request.access_token}"}]}
@@ -0,0 +1,239 @@
+"""
+Tests for the AskBill websocket client.
+
+This module runs the client against a local websocket stand-in so that the
+connection sharing and response routing can be tested without network access.
+"""
+
+import asyncio
+import json
+import unittest
+
+import websockets
+
+from mcp_server_plaid.clients.bill import AskBillClient
+
+
+class FakeAskBillServer:
+    """A local websocket server that answers questions in interleaved frames."""
+
+    def __init__(self, echo_question_id: bool = True):
+        self.echo_question_id = echo_question_id
+        self.connections = 0
+        self.questions = 0
+        # Seconds the next questions wait before their first frame
+        self.stalls = []
+        self.server = None
+        self.uri = None
+
+    async def _handle(self, websocket):
+        self.connections += 1
+        async for message in websocket:
+            question = json.loads(message)
+            self.questions += 1
+            asyncio.create_task(self._answer(websocket, question))
+
+    async def _answer(self, websocket, question):
+        question_id = question["question_id"]
+        text = question["question"]
+        await asyncio.sleep(self.stalls.pop(0) if self.stalls else 0)
+        # Yield between frames so that concurrent answers interleave
+        for frame in (
+                {"type": "sources", "sources": [{"url": f"https://plaid.com/{text}"}]},
+                {"type": "answer", "ans": "answer to "},
+                {"type": "answer", "ans": text},
+                {"type": "status", "status": "finished"},
+        ):
+            await asyncio.sleep(0.01)
+            try:
+                if self.echo_question_id:
+                    frame = {**frame, "question_id": question_id}
+                await websocket.send(json.dumps(frame))
+            except websockets.ConnectionClosed:
+                return
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.uri = f"ws://127.0.0.1:{port}/"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class TestAskBillClient(unittest.TestCase):
+    """Test cases for the AskBillClient class."""
+
+    async def async_test_concurrent_questions_share_connection(self):
+        async with FakeAskBillServer() as fake_server:
+            client = AskBillClient(fake_server.uri)
+            try:
+                responses = await asyncio.gather(
+                    *(client.ask_question(f"q{i}", timeout=5) for i in range(5))
+                )
+            finally:
+                await client.close()
+
+        self.assertEqual(fake_server.connections, 1, "Questions should share one connection")
+        for i, response in enumerate(responses):
+            self.assertEqual(response["answer"], f"answer to q{i}")
+            self.assertEqual(response["sources"], [{"url": f"https://plaid.com/q{i}"}])
+
+    def test_concurrent_questions_share_connection(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_concurrent_questions_share_connection())
+
+    async def async_test_questions_without_echoed_id_use_dedicated_connections(self):
+        async with FakeAskBillServer(echo_question_id=False) as fake_server:
+            client = AskBillClient(fake_server.uri)
+            try:
+                responses = await asyncio.gather(
+                    *(client.ask_question(f"q{i}", timeout=5) for i in range(3))
+                )
+                # Once known, concurrent questions never share a connection
+                later = await asyncio.gather(
+                    *(client.ask_question(f"later{i}", timeout=5) for i in range(3))
+                )
+            finally:
+                await client.close()
+
+        for i, response in enumerate(responses):
+            self.assertEqual(response["answer"], f"answer to q{i}")
+        for i, response in enumerate(later):
+            self.assertEqual(response["answer"], f"answer to later{i}")
+        self.assertEqual(fake_server.questions, 9, "The first questions should be asked again")
+
+    def test_questions_without_echoed_id_use_dedicated_connections(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_questions_without_echoed_id_use_dedicated_connections())
+
+    async def async_test_reconnects_after_close(self):
+        async with FakeAskBillServer() as fake_server:
+            client = AskBillClient(fake_server.uri)
+            try:
+                await client.ask_question("first", timeout=5)
+                await client.close()
+                self.assertFalse(client.connected)
+                response = await client.ask_question("second", timeout=5)
+            finally:
+                await client.close()
+
+        self.assertEqual(response["answer"], "answer to second")
+        self.assertEqual(fake_server.connections, 2)
+
+    def test_reconnects_after_close(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_reconnects_after_close())
+
+    async def async_test_chunks_are_forwarded(self):
+        chunks = []
+
+        async def on_chunk(response_type, payload):
+            chunks.append((response_type, payload))
+
+        async with FakeAskBillServer() as fake_server:
+            client = AskBillClient(fake_server.uri)
+            try:
+                response = await client.ask_question("q", timeout=5, on_chunk=on_chunk)
+            finally:
+                await client.close()
+
+        self.assertEqual(
+            chunks,
+            [("sources", [{"url": "https://plaid.com/q"}]), ("answer", "answer to "), ("answer", "q")],
+        )
+        self.assertEqual(response["answer"], "answer to q")
+
+    def test_chunks_are_forwarded(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_chunks_are_forwarded())
+
+    async def async_test_identical_questions_are_coalesced(self):
+        async with FakeAskBillServer() as fake_server:
+            client = AskBillClient(fake_server.uri)
+            chunks = []
+
+            async def on_chunk(response_type, payload):
+                chunks.append(response_type)
+
+            async def join_late():
+                await asyncio.sleep(0.025)
+                return await client.ask_question("How do webhooks work", timeout=5, on_chunk=on_chunk)
+
+            try:
+                first = asyncio.create_task(client.ask_question("How do webhooks work?", timeout=5))
+                cancelled = asyncio.create_task(client.ask_question("how do WEBHOOKS work", timeout=5))
+                late = asyncio.create_task(join_late())
+                await asyncio.sleep(0.015)
+                cancelled.cancel()
+                responses = await asyncio.gather(first, late)
+            finally:
+                await client.close()
+
+        self.assertEqual(fake_server.questions, 1, "Identical questions should share one request")
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(responses[0]["answer"], "answer to How do webhooks work?")
+        # The late caller also gets the chunks that arrived before it joined
+        self.assertEqual(chunks, ["sources", "answer", "answer"])
+
+    def test_identical_questions_are_coalesced(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_identical_questions_are_coalesced())
+
+    async def async_test_slow_questions_are_hedged(self):
+        chunks = []
+
+        async def on_chunk(response_type, payload):
+            chunks.append((response_type, payload))
+
+        async with FakeAskBillServer() as fake_server:
+            client = AskBillClient(fake_server.uri, hedge_percentile=90, hedge_budget=0.05)
+            try:
+                self.assertIsNone(client.hedge_delay())
+                # Observe enough answers to trust the hedge delay
+                await asyncio.gather(*(client.ask_question(f"warm-up {i}", timeout=5) for i in range(20)))
+                self.assertIsNotNone(client.hedge_delay())
+
+                fake_server.stalls = [2.0]
+                started = asyncio.get_running_loop().time()
+                response = await client.ask_question("slow", timeout=5, on_chunk=on_chunk)
+                elapsed = asyncio.get_running_loop().time() - started
+
+                # The budget of one hedge per twenty questions is spent
+                self.assertIsNone(client.hedge_delay())
+                # The stalled request was cancelled
+                self.assertEqual(client.stats()["pending_questions"], 0)
+            finally:
+                await client.close()
+
+        self.assertLess(elapsed, 1.0, "The hedge should answer before the stalled request")
+        self.assertEqual(fake_server.questions, 22)
+        self.assertEqual(response["answer"], "answer to slow")
+        self.assertEqual(
+            chunks,
+            [("sources", [{"url": "https://plaid.com/slow"}]), ("answer", "answer to "), ("answer", "slow")],
+        )
+        self.assertEqual(client.stats()["hedges"], 1)
+        self.assertEqual(client.stats()["hedge_wins"], 1)
+
+    def test_slow_questions_are_hedged(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_slow_questions_are_hedged())
+
+    async def async_test_connect_failure(self):
+        client = AskBillClient(
+            "ws://127.0.0.1:1/", max_connect_attempts=2, reconnect_base_delay=0.01
+        )
+        with self.assertRaises(ConnectionError):
+            await client.ask_question("anyone there?", timeout=1)
+
+    def test_connect_failure(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_connect_failure())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests for the in-process cache helpers.
+
+This module contains tests for TTLCache, normalize_question and the answer
+cache used by the search_documentation tool.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from mcp_server_plaid.clients.cache import TTLCache, normalize_question
+from mcp_server_plaid.tools.tool_search_documentation import handle_search_documentation
+
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestNormalizeQuestion(unittest.TestCase):
+    """Test cases for normalize_question."""
+
+    def test_ignores_case_whitespace_and_punctuation(self):
+        """Equivalent questions should normalize to the same key."""
+        self.assertEqual(
+            normalize_question("What webhook_code for new transactions?"),
+            normalize_question("  what   WEBHOOK_CODE for new transactions "),
+        )
+
+    def test_keeps_underscores(self):
+        """Underscores in Plaid identifiers should be preserved."""
+        self.assertEqual(normalize_question("DEFAULT_UPDATE?"), "default_update")
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTLCache class."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_entries=2, ttl=10, clock=self.clock)
+
+    def test_hit_and_miss_counts(self):
+        """Lookups should be counted as hits or misses."""
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "evictions": 0, "size": 1})
+
+    def test_entries_expire(self):
+        """Entries older than the TTL should be treated as misses."""
+        self.cache.set("a", 1)
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        """The least recently used entry should be evicted when the cache is full."""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.evictions, 1)
+
+
+class TestSearchDocumentationCache(unittest.TestCase):
+    """Test cases for the answer cache in handle_search_documentation."""
+
+    async def async_test_repeat_question_is_cached(self):
+        bill_client = AsyncMock()
+        bill_client.ask_question.return_value = {
+            "answer": "Use DEFAULT_UPDATE.",
+            "sources": [{"url": "https://plaid.com/docs", "title": "Docs"}],
+        }
+        cache = TTLCache()
+
+        first = await handle_search_documentation(
+            {"question": "What webhook_code for new transactions?"},
+            bill_client=bill_client, answer_cache=cache,
+        )
+        second = await handle_search_documentation(
+            {"question": "what webhook_code for new transactions"},
+            bill_client=bill_client, answer_cache=cache,
+        )
+
+        self.assertEqual(bill_client.ask_question.await_count, 1)
+        self.assertEqual(first[0].text, second[0].text)
+        self.assertIn("## Sources", second[0].text)
+        self.assertEqual(cache.hits, 1)
+
+    def test_repeat_question_is_cached(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_repeat_question_is_cached())
+
+    async def async_test_timed_out_answer_is_not_cached(self):
+        bill_client = AsyncMock()
+        bill_client.ask_question.return_value = {
+            "answer": "Response timed out after 60.0 seconds.",
+            "sources": [],
+            "timed_out": True,
+        }
+        cache = TTLCache()
+
+        await handle_search_documentation(
+            {"question": "slow question"}, bill_client=bill_client, answer_cache=cache
+        )
+
+        self.assertEqual(len(cache), 0)
+
+    def test_timed_out_answer_is_not_cached(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_timed_out_answer_is_not_cached())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the dataset store.
+
+This module contains tests for DatasetStore, the register_dataset tool and
+dataset handles passed as customized_account_data.
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcp_server_plaid.clients.datasets import DatasetStore, is_dataset_handle
+from mcp_server_plaid.test.fakes import FakePlaidClient
+from mcp_server_plaid.tools.registry import ToolError
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import handle_get_sandbox_access_token
+from mcp_server_plaid.tools.tool_get_sandbox_access_token_batch import handle_get_sandbox_access_token_batch
+from mcp_server_plaid.tools.tool_register_dataset import handle_register_dataset
+
+DATASET = {"override_accounts": [{"type": "depository", "subtype": "checking", "transactions": []}]}
+
+
+class TestDatasetStore(unittest.TestCase):
+    """Test cases for the DatasetStore class."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.store = DatasetStore(self.directory)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_content_gets_same_handle(self):
+        handle = self.store.register(json.dumps(DATASET, indent=2))
+
+        self.assertTrue(is_dataset_handle(handle))
+        self.assertEqual(self.store.register(json.dumps(DATASET)), handle)
+        self.assertEqual(self.store.get(handle), json.dumps(DATASET, separators=(",", ":")))
+        self.assertEqual(self.store.resolve(handle), self.store.get(handle))
+        self.assertEqual(self.store.resolve('{"inline": true}'), '{"inline": true}')
+
+    def test_datasets_persist_across_stores(self):
+        handle = self.store.register(json.dumps(DATASET))
+
+        self.assertEqual(json.loads(DatasetStore(self.directory).get(handle)), DATASET)
+
+        (self.directory / f"{handle}.json").write_text('{"tampered": true}')
+        with self.assertRaisesRegex(ValueError, "corrupted"):
+            DatasetStore(self.directory).get(handle)
+
+    def test_rejects_invalid_data_and_unknown_handles(self):
+        with self.assertRaisesRegex(ValueError, "not valid JSON"):
+            self.store.register("{")
+        with self.assertRaisesRegex(ValueError, "JSON object"):
+            self.store.register("[1, 2]")
+        with self.assertRaisesRegex(ValueError, "Unknown dataset"):
+            self.store.resolve("ds_0000000000000000")
+
+
+class TestDatasetTools(unittest.TestCase):
+    """Test cases for the tools using datasets."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DatasetStore(Path(self.tmp.name) / "datasets")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def async_test_register_and_use_handle(self):
+        path = Path(self.tmp.name) / "mock_data.json"
+        path.write_text(json.dumps(DATASET, indent=2))
+        result = await handle_register_dataset({"path": str(path)}, dataset_store=self.store)
+        handle = result[0].text.split()[2]
+        self.assertTrue(is_dataset_handle(handle), result[0].text)
+
+        client = FakePlaidClient()
+        single = await handle_get_sandbox_access_token(
+            {"initial_products": "transactions", "customized_account_data": handle},
+            plaid_client=client, dataset_store=self.store,
+        )
+        batch = await handle_get_sandbox_access_token_batch(
+            {"items": [{"initial_products": "transactions", "customized_account_data": handle, "count": 2}]},
+            plaid_client=client, dataset_store=self.store,
+        )
+
+        self.assertIn("Access Token: access-1", single[0].text)
+        self.assertTrue(batch[0].text.startswith("Created 2 of 2 sandbox items."))
+        passwords = [request.options.get("override_password") for request in client.created]
+        self.assertEqual(passwords, [json.dumps(DATASET, separators=(",", ":"))] * 3)
+
+        with self.assertRaisesRegex(ToolError, "Unknown dataset ds_0000000000000000"):
+            await handle_get_sandbox_access_token(
+                {"initial_products": "transactions", "customized_account_data": "ds_0000000000000000"},
+                plaid_client=client, dataset_store=self.store,
+            )
+        self.assertEqual(len(client.created), 3)
+
+    def test_register_and_use_handle(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_register_and_use_handle())
+
+
+if __name__ == "__main__":
+    unittest.main()
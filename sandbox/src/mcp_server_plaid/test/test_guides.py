@@ -0,0 +1,96 @@
+"""
+Tests for the offline integration guide index.
+
+This module contains tests for the section splitter, the BM25 index and its
+persistence.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcp_server_plaid.clients.guides import GuideIndex, find_rules_dir, split_sections, tokenize
+
+SAMPLE_GUIDE = """# Sample Guide
+
+## Overview
+This guide covers webhooks.
+
+## Step 1: Fire a webhook
+Call `/sandbox/item/fire_webhook` with webhook_code DEFAULT_UPDATE.
+
+```python
+# not a heading
+```
+
+### 1.1 Notes
+Webhooks are retried.
+"""
+
+
+class TestSplitSections(unittest.TestCase):
+    """Test cases for split_sections and tokenize."""
+
+    def test_split_by_heading(self):
+        """Each heading should start a new section with its full heading path."""
+        sections = split_sections(SAMPLE_GUIDE, "sample.md")
+        paths = [section["path"] for section in sections]
+        self.assertEqual(paths, [
+            "Sample Guide",
+            "Sample Guide > Overview",
+            "Sample Guide > Step 1: Fire a webhook",
+            "Sample Guide > Step 1: Fire a webhook > 1.1 Notes",
+        ])
+        self.assertIn("# not a heading", sections[2]["text"])
+
+    def test_tokenize_splits_identifiers(self):
+        """Identifiers should match both whole and by their parts."""
+        self.assertEqual(tokenize("The webhook_code"), ["webhook_code", "webhook", "code"])
+
+
+class TestGuideIndex(unittest.TestCase):
+    """Test cases for the GuideIndex class."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.rules_dir = Path(self.tmp_dir.name) / "rules"
+        self.rules_dir.mkdir()
+        (self.rules_dir / "sample.md").write_text(SAMPLE_GUIDE)
+        self.index_path = Path(self.tmp_dir.name) / "index.json"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_search_ranks_matching_section_first(self):
+        """The section mentioning the query terms should rank first."""
+        index = GuideIndex.load_or_build(self.rules_dir, self.index_path)
+        results = index.search("which webhook_code for fire_webhook?")
+        self.assertEqual(results[0]["title"], "Step 1: Fire a webhook")
+
+    def test_index_is_persisted_and_reused(self):
+        """A persisted index should be loaded when the guides are unchanged."""
+        built = GuideIndex.load_or_build(self.rules_dir, self.index_path)
+        self.assertTrue(self.index_path.exists())
+
+        loaded = GuideIndex.load_or_build(self.rules_dir, self.index_path)
+        self.assertEqual(loaded.fingerprint, built.fingerprint)
+        self.assertEqual(loaded.search("retried"), built.search("retried"))
+
+    def test_missing_rules_dir(self):
+        """Without guides the index should be empty."""
+        index = GuideIndex.load_or_build(None, self.index_path)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.search("anything"), [])
+
+    def test_repository_guides(self):
+        """The repository's own guides should be searchable."""
+        rules_dir = find_rules_dir()
+        if rules_dir is None:
+            self.skipTest("rules directory not available")
+        index = GuideIndex.load_or_build(rules_dir, self.index_path)
+        results = index.search("transactions sync cursor")
+        self.assertEqual(results[0]["source"], "transactions_guide.md")
+
+
+if __name__ == "__main__":
+    unittest.main()
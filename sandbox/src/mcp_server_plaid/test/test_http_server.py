@@ -0,0 +1,141 @@
+"""
+Tests for the HTTP transport.
+
+This module runs the HTTP app on a local port and connects to it with the MCP
+SSE client, so that serving several sessions from one server can be tested
+end to end.
+"""
+
+import asyncio
+import unittest
+import uuid
+
+import httpx
+import mcp.types as types
+import uvicorn
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.server import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from sse_starlette.sse import AppStatus
+
+from mcp_server_plaid.http_server import create_app, is_loopback_host, warn_if_exposed
+
+
+def make_server() -> Server:
+    """Create an MCP server with a single echo tool."""
+    server = Server("test")
+
+    @server.list_tools()
+    async def list_tools():
+        return [types.Tool(name="echo", description="Echo", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        await asyncio.sleep(0.05)
+        return [types.TextContent(type="text", text=arguments["text"])]
+
+    return server
+
+
+class LocalHttpServer:
+    """Runs the HTTP app with uvicorn on a free local port."""
+
+    def __init__(self, max_sessions=0):
+        server = make_server()
+        options = InitializationOptions(
+            server_name="test",
+            server_version="0",
+            capabilities=server.get_capabilities(NotificationOptions(), {}),
+        )
+        self.app = create_app(server, options, max_sessions=max_sessions)
+        self.uvicorn = None
+        self.task = None
+        self.url = None
+
+    async def __aenter__(self):
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        self.uvicorn = uvicorn.Server(config)
+        self.task = asyncio.create_task(self.uvicorn.serve())
+        while not self.uvicorn.started:
+            await asyncio.sleep(0.01)
+        port = self.uvicorn.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.uvicorn.should_exit = True
+        await self.task
+
+
+async def echo(url: str, text: str) -> str:
+    """Open a session, call the echo tool once and return its text."""
+    async with sse_client(f"{url}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            result = await session.call_tool("echo", {"text": text})
+            return result.content[0].text
+
+
+class TestHttpServer(unittest.TestCase):
+    """Test cases for the HTTP transport."""
+
+    def setUp(self):
+        # sse-starlette keeps a process-wide event bound to the first event loop
+        AppStatus.should_exit_event = None
+
+    async def async_test_concurrent_sessions(self):
+        async with LocalHttpServer() as local:
+            results = await asyncio.gather(*(echo(local.url, f"agent {i}") for i in range(5)))
+            # Sessions close once the server sees the client disconnect
+            async with httpx.AsyncClient() as client:
+                for _ in range(50):
+                    health = (await client.get(f"{local.url}/healthz")).json()
+                    if health["sessions"] == 0:
+                        break
+                    await asyncio.sleep(0.02)
+                sessions = dict(local.app.state.sse_endpoint.transport.sessions)
+                stale = await client.post(
+                    f"{local.url}/messages/", params={"session_id": uuid.uuid4().hex}, json={}
+                )
+
+        self.assertEqual(results, [f"agent {i}" for i in range(5)])
+        self.assertEqual(health, {"status": "ok", "sessions": 0})
+        self.assertEqual(sessions, {}, "Closed sessions should be forgotten")
+        self.assertEqual(stale.status_code, 404)
+
+    def test_concurrent_sessions(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_concurrent_sessions())
+
+    async def async_test_session_limit(self):
+        async with LocalHttpServer(max_sessions=1) as local:
+            async with sse_client(f"{local.url}/sse") as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    async with httpx.AsyncClient() as client:
+                        response = await client.get(f"{local.url}/sse")
+
+        self.assertEqual(response.status_code, 503)
+
+    def test_session_limit(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_session_limit())
+
+
+    def test_warns_when_listening_beyond_loopback(self):
+        self.assertTrue(is_loopback_host("127.0.0.1"))
+        self.assertTrue(is_loopback_host("::1"))
+        self.assertTrue(is_loopback_host("localhost"))
+        self.assertFalse(is_loopback_host("0.0.0.0"))
+        self.assertFalse(is_loopback_host("example.com"))
+
+        with self.assertLogs("plaid-mcp-server.http", level="WARNING") as logs:
+            warn_if_exposed("0.0.0.0")
+        self.assertIn("not authenticated", logs.output[0])
+        with self.assertNoLogs("plaid-mcp-server.http", level="WARNING"):
+            warn_if_exposed("127.0.0.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
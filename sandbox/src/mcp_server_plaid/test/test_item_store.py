@@ -0,0 +1,114 @@
+"""
+Tests for the sandbox item registry.
+
+This module contains tests for ItemStore and the list_sandbox_items tool.
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcp_server_plaid.clients.datasets import DatasetStore
+from mcp_server_plaid.clients.item_store import ItemStore
+from mcp_server_plaid.test.fakes import FakePlaidClient
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import handle_get_sandbox_access_token
+from mcp_server_plaid.tools.tool_get_sandbox_access_token_batch import handle_get_sandbox_access_token_batch
+from mcp_server_plaid.tools.tool_list_sandbox_items import handle_list_sandbox_items
+
+
+class TestItemStore(unittest.TestCase):
+    """Test cases for the ItemStore class."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "items.sqlite3"
+        self.store = ItemStore("client-a", self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_find_filters_and_orders(self):
+        self.store.record({"access_token": "access-1", "item_id": "item-1", "accounts": None}, ["transactions"])
+        self.store.record(
+            {"access_token": "access-2", "item_id": "item-2", "accounts": [{"account_id": "acc-1", "mask": "0000"}]},
+            ["transfer", "auth"],
+            dataset="ds_0123456789abcdef",
+        )
+        self.store.record(
+            {"access_token": "access-3", "item_id": "item-3", "accounts": None},
+            ["transactions"],
+            webhook="https://example.com/hook",
+        )
+
+        self.assertEqual([item["item_id"] for item in self.store.find()], ["item-3", "item-2", "item-1"])
+        self.assertEqual([item["item_id"] for item in self.store.find(products=["transactions"])], ["item-3", "item-1"])
+        self.assertEqual([item["item_id"] for item in self.store.find(products=["transactions"], webhook="")], ["item-1"])
+        [transfer] = self.store.find(products=["auth", "transfer"])
+        self.assertEqual(transfer["dataset"], "ds_0123456789abcdef")
+        self.assertEqual(transfer["accounts"], [{"account_id": "acc-1", "mask": "0000"}])
+        self.assertEqual(len(self.store.find(dataset="")), 2)
+        self.assertEqual(len(self.store.find(limit=1)), 1)
+        self.assertEqual(self.store.stats(), {"items": 3})
+
+    def test_items_persist_per_client(self):
+        self.store.record({"access_token": "access-1", "item_id": "item-1", "accounts": None}, ["auth"])
+
+        reopened = ItemStore("client-a", self.path)
+        other_client = ItemStore("client-b", self.path)
+        try:
+            self.assertEqual([item["access_token"] for item in reopened.find()], ["access-1"])
+            self.assertEqual(other_client.find(), [])
+        finally:
+            reopened.close()
+            other_client.close()
+
+
+class TestListSandboxItems(unittest.TestCase):
+    """Test cases for recording items in the tools and listing them."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ItemStore("client-a", Path(self.tmp.name) / "items.sqlite3")
+        self.datasets = DatasetStore(Path(self.tmp.name) / "datasets")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    async def async_test_created_items_are_listed(self):
+        client = FakePlaidClient(accounts=[{"account_id": "acc-1", "mask": "0000", "balances": {"current": 1}}])
+        handle = self.datasets.register(json.dumps({"override_accounts": []}))
+        context = {"plaid_client": client, "item_store": self.store, "dataset_store": self.datasets}
+
+        await handle_get_sandbox_access_token({"initial_products": "auth, transfer"}, **context)
+        await handle_get_sandbox_access_token_batch(
+            {"items": [
+                {"initial_products": "transactions", "customized_account_data": handle, "count": 2},
+                # Inline data is recorded under the handle it would get
+                {"initial_products": "transactions", "customized_account_data": '{"override_accounts": [ ]}'},
+            ]},
+            **context,
+        )
+
+        listed = await handle_list_sandbox_items({"products": "transfer,auth"}, item_store=self.store)
+        lines = listed[0].text.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("| auth,transfer | access-1 | item-1 |  |  | acc-1 |", lines[2])
+
+        by_dataset = await handle_list_sandbox_items({"dataset": handle}, item_store=self.store)
+        self.assertEqual(len(by_dataset[0].text.splitlines()), 5)
+        without_dataset = await handle_list_sandbox_items({"dataset": "none"}, item_store=self.store)
+        self.assertIn("access-1", without_dataset[0].text)
+        none = await handle_list_sandbox_items({"products": "signal"}, item_store=self.store)
+        self.assertIn("No recorded sandbox items match", none[0].text)
+
+    def test_created_items_are_listed(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_created_items_are_listed())
+
+
+if __name__ == "__main__":
+    unittest.main()
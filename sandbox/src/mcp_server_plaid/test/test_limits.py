@@ -0,0 +1,123 @@
+"""
+Tests for tool concurrency limits.
+
+This module contains tests for the ConcurrencyLimiter and RateLimiter classes.
+"""
+
+import asyncio
+import time
+import unittest
+
+from mcp_server_plaid.tools.limits import ConcurrencyLimiter, RateLimiter, SessionLimiters, ToolBusyError
+
+
+class FakeSession:
+    """Stand-in for an MCP session."""
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+    """Test cases for the ConcurrencyLimiter class."""
+
+    async def async_test_waiting_call_is_admitted(self):
+        limiter = ConcurrencyLimiter("tool", max_concurrency=1, max_queue=1, max_wait=1)
+        order = []
+
+        async def call(label, delay):
+            async with limiter:
+                order.append(f"start {label}")
+                await asyncio.sleep(delay)
+                order.append(f"end {label}")
+
+        await asyncio.gather(call("a", 0.05), call("b", 0))
+
+        self.assertEqual(order, ["start a", "end a", "start b", "end b"])
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_waiting_call_is_admitted(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_waiting_call_is_admitted())
+
+    async def async_test_full_queue_is_rejected(self):
+        limiter = ConcurrencyLimiter("tool", max_concurrency=1, max_queue=1, max_wait=1)
+        release = asyncio.Event()
+
+        async def slow_call():
+            async with limiter:
+                await release.wait()
+
+        running = asyncio.create_task(slow_call())
+        queued = asyncio.create_task(slow_call())
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ToolBusyError) as cm:
+            await limiter.acquire()
+        self.assertIn("wait queue is full", str(cm.exception))
+
+        release.set()
+        await asyncio.gather(running, queued)
+
+    def test_full_queue_is_rejected(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_full_queue_is_rejected())
+
+    async def async_test_wait_timeout_is_rejected(self):
+        limiter = ConcurrencyLimiter("tool", max_concurrency=1, max_queue=4, max_wait=0.05)
+        await limiter.acquire()
+
+        with self.assertRaises(ToolBusyError) as cm:
+            await limiter.acquire()
+        self.assertIn("no slot within 0.05s", str(cm.exception))
+        self.assertEqual(limiter.waiting, 0)
+
+        limiter.release()
+        await limiter.acquire()
+        self.assertEqual(limiter.in_flight, 1)
+
+    def test_wait_timeout_is_rejected(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_wait_timeout_is_rejected())
+
+
+class TestSessionLimiters(unittest.TestCase):
+    """Test cases for the SessionLimiters class."""
+
+    async def async_test_sessions_are_limited_separately(self):
+        limiters = SessionLimiters(max_concurrency=1, max_queue=0, max_wait=1)
+        first, second = FakeSession(), FakeSession()
+
+        await limiters.get(first).acquire()
+        await limiters.get(second).acquire()
+        with self.assertRaises(ToolBusyError) as cm:
+            await limiters.get(first).acquire()
+        self.assertTrue(str(cm.exception).startswith("This session is busy"))
+        self.assertIsNone(SessionLimiters(max_concurrency=0).get(first))
+
+        del first
+        self.assertEqual(len(limiters), 1, "Limiters should be dropped with their session")
+
+    def test_sessions_are_limited_separately(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_sessions_are_limited_separately())
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the RateLimiter class."""
+
+    async def async_test_rate_is_enforced(self):
+        limiter = RateLimiter(rate=100, burst=2)
+        start = time.perf_counter()
+        for _ in range(6):
+            await limiter.acquire()
+        elapsed = time.perf_counter() - start
+
+        # Two calls use the burst, the other four wait 10ms each
+        self.assertGreaterEqual(elapsed, 0.035)
+        self.assertLess(elapsed, 0.5)
+
+    def test_rate_is_enforced(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_rate_is_enforced())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Tests for the load generator.
+
+This module contains tests for tool mixes, recorded call replay and the
+load loop, using session stand-ins instead of a running server.
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import mcp.types as types
+from click.testing import CliRunner
+
+from mcp_server_plaid.loadgen import (
+    ToolStats, Workload, format_report, load_replay, main, parse_mix, percentile, run_load,
+)
+
+
+class FakeSession:
+    """MCP client session stand-in recording calls and failing one tool."""
+
+    def __init__(self, delay=0.001):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if name == "simulate_webhook":
+            return types.CallToolResult(
+                content=[types.TextContent(type="text", text="Error 400: bad code")], isError=True
+            )
+        return types.CallToolResult(content=[types.TextContent(type="text", text="ok")])
+
+
+class TestLoadgen(unittest.TestCase):
+    """Test cases for the load generator."""
+
+    def test_parse_mix(self):
+        self.assertEqual(
+            parse_mix("search_documentation=2, simulate_webhook"),
+            {"search_documentation": 2.0, "simulate_webhook": 1.0},
+        )
+        with self.assertRaises(ValueError):
+            parse_mix("unknown_tool=1")
+        with self.assertRaises(ValueError):
+            parse_mix("simulate_webhook=0")
+
+    def test_replay_substitutes_access_token(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "calls.jsonl"
+            path.write_text("\n".join([
+                json.dumps({"tool": "simulate_webhook", "arguments": {"access_token": "$access_token"}}),
+                "",
+                json.dumps({"tool": "get_mock_data_prompt"}),
+            ]))
+            workload = Workload(replay=load_replay(path))
+
+        self.assertTrue(workload.needs_access_token)
+        self.assertEqual(workload.tools, ["get_mock_data_prompt", "simulate_webhook"])
+        first = workload.next_call("access-sandbox-1")
+        self.assertEqual(first.arguments, {"access_token": "access-sandbox-1"})
+        self.assertEqual(workload.next_call("access-sandbox-1").tool, "get_mock_data_prompt")
+        # Replay wraps around
+        self.assertEqual(workload.next_call("access-sandbox-1").tool, "simulate_webhook")
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    async def async_test_closed_loop(self):
+        sessions = [FakeSession(), FakeSession()]
+        workload = Workload({"get_mock_data_prompt": 1, "simulate_webhook": 1}, seed=1)
+
+        report = await run_load(
+            sessions, workload, concurrency=4, duration=None, requests=40, access_tokens=["a", "b"]
+        )
+
+        self.assertEqual(report["total"]["calls"], 40)
+        self.assertEqual(sum(len(session.calls) for session in sessions), 40)
+        webhook = report["tools"]["simulate_webhook"]
+        self.assertEqual(webhook["errors"], webhook["calls"])
+        self.assertEqual(report["tools"]["get_mock_data_prompt"]["errors"], 0)
+        # Each session used its own access token
+        self.assertTrue(all(
+            arguments["access_token"] == "a" for name, arguments in sessions[0].calls if name == "simulate_webhook"
+        ))
+        self.assertIn("TOTAL", format_report(report))
+
+    def test_closed_loop(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_closed_loop())
+
+    async def async_test_rate_limited(self):
+        session = FakeSession(delay=0.05)
+        workload = Workload({"get_mock_data_prompt": 1})
+
+        report = await run_load([session], workload, concurrency=2, rate=200, duration=None, requests=10)
+
+        self.assertEqual(report["total"]["calls"], 10)
+        self.assertLessEqual(session.max_in_flight, 2)
+        # Calls held back by the cap count their wait from the scheduled start
+        self.assertGreater(report["delayed"], 0)
+        self.assertGreater(report["total"]["max"], 0.15)
+        self.assertIn("Delayed by --concurrency", format_report(report))
+
+    def test_rate_limited(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_rate_limited())
+
+
+    @patch("mcp_server_plaid.loadgen.asyncio.run")
+    @patch("mcp_server_plaid.loadgen._run", new_callable=MagicMock)
+    def test_server_command_is_split_like_a_shell(self, mock_run, mock_asyncio_run):
+        """Test that a quoted server command path containing spaces stays one argument."""
+        mock_asyncio_run.return_value = {"elapsed": 1.0, "tools": {}, "total": ToolStats().summary(1.0)}
+
+        result = CliRunner().invoke(main, [
+            "--client-id", "id", "--secret", "secret", "--requests", "1",
+            "--server-command", "'/opt/my python/bin/python' -m mcp_server_plaid",
+        ])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(mock_run.call_args.args[2], ["/opt/my python/bin/python", "-m", "mcp_server_plaid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
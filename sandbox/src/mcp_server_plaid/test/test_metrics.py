@@ -0,0 +1,129 @@
+"""
+Tests for runtime metrics.
+
+This module contains tests for the Metrics registry, its Prometheus rendering,
+and the metrics recorded by tool dispatch and the Plaid client.
+"""
+
+import asyncio
+import json
+import unittest
+
+import httpx
+import mcp.types as types
+
+from mcp_server_plaid.clients.plaid_http import PlaidHttpClient
+from mcp_server_plaid.metrics import Histogram, metrics
+from mcp_server_plaid.server import serve
+from mcp_server_plaid.tools.registry import ToolError, registry
+from mcp_server_plaid.tools.tool_server_stats import SERVER_STATS_TOOL, handle_server_stats
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the Metrics registry."""
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_histogram_quantiles(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in [0.05] * 90 + [0.5] * 10:
+            histogram.observe(value)
+
+        self.assertLessEqual(histogram.quantile(0.5), 0.1)
+        self.assertGreater(histogram.quantile(0.95), 0.1)
+        self.assertLessEqual(histogram.quantile(0.99), 0.5)
+        self.assertEqual(Histogram().quantile(0.5), 0.0)
+
+    def test_track_counts_errors(self):
+        with metrics.track("mcp_tool", tool="ok_tool"):
+            pass
+        with self.assertRaises(ValueError):
+            with metrics.track("mcp_tool", tool="bad_tool"):
+                raise ValueError("boom")
+
+        tools = metrics.snapshot()["tools"]
+        self.assertEqual(tools["ok_tool"]["calls"], 1)
+        self.assertEqual(tools["ok_tool"]["errors"], 0)
+        self.assertEqual(tools["bad_tool"]["errors"], 1)
+        self.assertEqual(tools["bad_tool"]["in_flight"], 0)
+
+    def test_render_prometheus(self):
+        metrics.register_collector("test_pool", lambda: {"ready": {"auth,transfer": 2}, "hits": 3})
+        with metrics.track("mcp_upstream", service="plaid", endpoint="/auth/get"):
+            pass
+
+        text = metrics.render_prometheus()
+        self.assertIn("# TYPE mcp_upstream_duration_seconds histogram", text)
+        self.assertIn('mcp_upstream_calls_total{endpoint="/auth/get",service="plaid"} 1', text)
+        self.assertIn('mcp_upstream_duration_seconds_bucket{endpoint="/auth/get",service="plaid",le="+Inf"} 1', text)
+        self.assertIn('mcp_test_pool_ready{key="auth,transfer"} 2', text)
+        self.assertIn("mcp_test_pool_hits 3", text)
+
+    async def async_test_plaid_client_records_endpoint_errors(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(400, json={"error_code": "INVALID_FIELD"}))
+        client = PlaidHttpClient("id", "secret", host="https://sandbox.plaid.test", transport=transport)
+        try:
+            with self.assertRaises(Exception):
+                await client.auth_get({"access_token": "access-sandbox-1"})
+        finally:
+            await client.aclose()
+
+        upstream = metrics.snapshot()["upstream"]
+        self.assertEqual(upstream["/auth/get plaid"]["calls"], 1)
+        self.assertEqual(upstream["/auth/get plaid"]["errors"], 1)
+
+    def test_plaid_client_records_endpoint_errors(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_plaid_client_records_endpoint_errors())
+
+    async def async_test_dispatch_feeds_server_stats(self):
+        async def handle_echo(arguments, **_):
+            return [types.TextContent(type="text", text="ok")]
+
+        registry.register(types.Tool(name="metrics_echo", description="Echo", inputSchema={"type": "object"}),
+                          handle_echo)
+        registry.register(SERVER_STATS_TOOL, handle_server_stats)
+        server = await serve("test_client_id", "test_secret", "")
+        call_tool = server.request_handlers[types.CallToolRequest]
+        for _ in range(3):
+            await call_tool(types.CallToolRequest(
+                method="tools/call", params=types.CallToolRequestParams(name="metrics_echo", arguments={})
+            ))
+
+        result = await call_tool(types.CallToolRequest(
+            method="tools/call", params=types.CallToolRequestParams(name="server_stats", arguments={})
+        ))
+        stats = json.loads(result.root.content[0].text)
+        self.assertEqual(stats["tools"]["metrics_echo"]["calls"], 3)
+        self.assertEqual(stats["tools"]["metrics_echo"]["errors"], 0)
+        self.assertIn("docs_cache", stats)
+        self.assertIn("askbill", stats)
+
+    def test_dispatch_feeds_server_stats(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_dispatch_feeds_server_stats())
+
+    async def async_test_failed_calls_count_as_errors(self):
+        async def handle_fail(arguments, **_):
+            raise ToolError("Error 400: bad code")
+
+        registry.register(types.Tool(name="metrics_fail", description="Fail", inputSchema={"type": "object"}),
+                          handle_fail)
+        server = await serve("test_client_id", "test_secret", "")
+        result = await server.request_handlers[types.CallToolRequest](types.CallToolRequest(
+            method="tools/call", params=types.CallToolRequestParams(name="metrics_fail", arguments={})
+        ))
+
+        # The client sees an error result, and the server counts the same call as an error
+        self.assertTrue(result.root.isError)
+        self.assertEqual(result.root.content[0].text, "Error 400: bad code")
+        self.assertEqual(metrics.snapshot()["tools"]["metrics_fail"]["errors"], 1)
+
+    def test_failed_calls_count_as_errors(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_failed_calls_count_as_errors())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Tests for the mock data generator.
+
+This module contains tests for generate_override_accounts and the generate_mock_data tool.
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+
+from mcp_server_plaid.tools.pfm.mock_data import ACCOUNT_TYPES, generate_override_accounts
+from mcp_server_plaid.tools.pfm.tool_generate_mock_data import handle_generate_mock_data
+from mcp_server_plaid.tools.registry import ToolError
+
+END = date(2025, 6, 30)
+
+
+class TestGenerateOverrideAccounts(unittest.TestCase):
+    """Test cases for generate_override_accounts."""
+
+    def test_same_seed_is_reproducible(self):
+        first = generate_override_accounts(seed=7, end=END)
+        second = generate_override_accounts(seed=7, end=END)
+        other = generate_override_accounts(seed=8, end=END)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_transactions_follow_template_rules(self):
+        data = generate_override_accounts(
+            subtypes=["checking", "credit card"], num_transactions=2000, seed=1, end=END
+        )
+        checking, credit = data["override_accounts"]
+
+        self.assertEqual((checking["type"], credit["type"]), ("depository", "credit"))
+        self.assertEqual(checking["identity"], credit["identity"])
+        for account in data["override_accounts"]:
+            transactions = account["transactions"]
+            self.assertEqual(len(transactions), 2000)
+            posted = [txn["date_posted"] for txn in transactions]
+            self.assertEqual(posted, sorted(posted, reverse=True))
+            for txn in transactions:
+                posted_date = date.fromisoformat(txn["date_posted"])
+                transacted_date = date.fromisoformat(txn["date_transacted"])
+                self.assertEqual((posted_date - transacted_date).days, 1)
+                self.assertLess(posted_date.weekday(), 5)
+                self.assertLessEqual(posted_date, END)
+                self.assertLessEqual(abs(txn["amount"]), 5000)
+
+        # Payroll comes in, rent goes out
+        payroll = [txn for txn in checking["transactions"] if "DIRECT DEP" in txn["description"]]
+        rent = [txn for txn in checking["transactions"] if "Merchant name: Rent" in txn["description"]]
+        self.assertTrue(payroll and all(txn["amount"] < 0 for txn in payroll))
+        self.assertTrue(rent and all(txn["amount"] > 0 for txn in rent))
+        self.assertLessEqual(len({txn["date_posted"][8:] for txn in rent}), 3, "Rent should recur on the same day")
+
+    def test_business_descriptions(self):
+        data = generate_override_accounts(subtypes=["checking"], business=True, num_transactions=100, seed=3, end=END)
+        gusto = [txn for txn in data["override_accounts"][0]["transactions"] if txn["description"].startswith("GUSTO")]
+
+        self.assertTrue(gusto)
+        self.assertRegex(gusto[0]["description"], r"^GUSTO; GUSTO:[A-Z0-9]{10} Merchant name: GUSTO$")
+
+    def test_business_amounts_follow_template_range(self):
+        data = generate_override_accounts(
+            subtypes=list(ACCOUNT_TYPES), business=True, num_transactions=2000, seed=4, end=END
+        )
+
+        for account in data["override_accounts"]:
+            amounts = [abs(txn["amount"]) for txn in account["transactions"]]
+            self.assertGreaterEqual(min(amounts), 9, account["subtype"])
+            self.assertLessEqual(max(amounts), 15000, account["subtype"])
+
+    def test_unknown_subtype(self):
+        with self.assertRaises(ValueError):
+            generate_override_accounts(subtypes=["brokerage"])
+
+
+class TestGenerateMockDataTool(unittest.TestCase):
+    """Test cases for handle_generate_mock_data."""
+
+    async def async_test_writes_output_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            arguments = {"num_of_transactions": 30, "accounts": ["checking", "savings"], "seed": 5,
+                         "output_path": "users/mock_data.json"}
+            result = await handle_generate_mock_data(arguments, output_dir=Path(tmp))
+
+            path = Path(tmp).resolve() / "users" / "mock_data.json"
+            self.assertIn(f"Wrote 2 accounts with 60 transactions to {path}", result[0].text)
+            data = json.loads(path.read_text())
+            self.assertEqual(len(data["override_accounts"]), 2)
+
+            with self.assertRaisesRegex(ToolError, "already exists"):
+                await handle_generate_mock_data({**arguments, "seed": 6}, output_dir=Path(tmp))
+            self.assertEqual(json.loads(path.read_text()), data)
+
+            replaced = await handle_generate_mock_data({**arguments, "seed": 6, "overwrite": True}, output_dir=Path(tmp))
+            self.assertIn("Wrote 2 accounts", replaced[0].text)
+            self.assertNotEqual(json.loads(path.read_text()), data)
+
+    def test_writes_output_file(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_writes_output_file())
+
+    async def async_test_null_optionals_use_defaults(self):
+        result = await handle_generate_mock_data(
+            {"num_of_transactions": None, "months": None, "accounts": ["checking"], "seed": 2}
+        )
+
+        data = json.loads(result[0].text)
+        self.assertEqual(len(data["override_accounts"][0]["transactions"]), 50)
+
+    def test_null_optionals_use_defaults(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_null_optionals_use_defaults())
+
+    async def async_test_generation_does_not_block_event_loop(self):
+        gaps = []
+
+        async def tick():
+            while True:
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                gaps.append(time.perf_counter() - started)
+
+        ticker = asyncio.create_task(tick())
+        try:
+            await handle_generate_mock_data({"num_of_transactions": 10000, "seed": 1})
+        finally:
+            ticker.cancel()
+
+        self.assertLess(max(gaps), 0.25, "Other tasks should keep running while data is generated")
+
+    def test_generation_does_not_block_event_loop(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_generation_does_not_block_event_loop())
+
+    async def async_test_rejects_paths_outside_output_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp) / "out"
+            output_dir.mkdir()
+            (output_dir / "escape").symlink_to(tmp)
+
+            for output_path in (str(Path(tmp) / "mock_data.json"), "../mock_data.json", "~/mock_data.json",
+                                "escape/mock_data.json"):
+                with self.assertRaisesRegex(ToolError, "inside the output directory", msg=output_path):
+                    await handle_generate_mock_data(
+                        {"num_of_transactions": 1, "output_path": output_path}, output_dir=output_dir
+                    )
+            self.assertEqual(sorted(path.name for path in Path(tmp).iterdir()), ["out"])
+
+    def test_rejects_paths_outside_output_dir(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_rejects_paths_outside_output_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the async Plaid SDK wrapper.
+
+This module verifies that blocking Plaid SDK calls run off the event loop and
+overlap up to the configured pool size.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from mcp_server_plaid.clients.plaid_async import AsyncPlaidApi
+
+
+class BlockingPlaidApi:
+    """Stand-in for PlaidApi whose calls block like a slow HTTPS request."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.threads = set()
+
+    def auth_get(self, request):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"accounts": [], "request": request}
+
+
+class TestAsyncPlaidApi(unittest.TestCase):
+    """Test cases for the AsyncPlaidApi class."""
+
+    async def async_test_calls_overlap(self):
+        api = BlockingPlaidApi(delay=0.2)
+        client = AsyncPlaidApi(api, max_workers=4)
+        try:
+            start = time.perf_counter()
+            responses = await asyncio.gather(*(client.auth_get(i) for i in range(4)))
+            elapsed = time.perf_counter() - start
+        finally:
+            client.shutdown()
+
+        self.assertEqual([r["request"] for r in responses], [0, 1, 2, 3])
+        self.assertLess(elapsed, 0.6, "Calls should run concurrently on the pool")
+        self.assertTrue(all(name.startswith("plaid-api") for name in api.threads))
+
+    def test_calls_overlap(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_calls_overlap())
+
+    async def async_test_event_loop_not_blocked(self):
+        client = AsyncPlaidApi(BlockingPlaidApi(delay=0.3), max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await client.call("auth_get", "request")
+        finally:
+            ticker_task.cancel()
+            client.shutdown()
+
+        self.assertGreater(ticks, 5, "The event loop should keep running during the call")
+
+    def test_event_loop_not_blocked(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_event_loop_not_blocked())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Tests for the httpx based Plaid client.
+
+This module runs PlaidHttpClient and the Plaid tool handlers against an
+in-memory httpx transport, so no network access is needed.
+"""
+
+import asyncio
+import json
+import unittest
+
+import httpx
+import plaid
+from plaid.model.auth_get_request import AuthGetRequest
+
+from mcp_server_plaid.clients.plaid_http import PlaidHttpClient
+from mcp_server_plaid.tools.pfm.tool_simulate_webhook import handle_simulate_webhook
+from mcp_server_plaid.tools.registry import ToolError
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import handle_get_sandbox_access_token
+
+
+class FakePlaid:
+    """In-memory stand-in for the Plaid sandbox API."""
+
+    def __init__(self):
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append((request.url.path, dict(request.headers), body))
+        path = request.url.path
+        if path == "/sandbox/public_token/create":
+            return httpx.Response(200, json={"public_token": "public-sandbox-1"})
+        if path == "/item/public_token/exchange":
+            return httpx.Response(200, json={"access_token": "access-sandbox-1", "item_id": "item-1"})
+        if path == "/auth/get":
+            return httpx.Response(200, json={
+                "accounts": [{
+                    "account_id": "acc-1",
+                    "mask": "0000",
+                    "subtype": "checking",
+                    "balances": {"available": 100, "current": 110},
+                }],
+                "numbers": {"ach": [{"account_id": "acc-1", "account": "1111", "routing": "011"}], "eft": []},
+            })
+        if path == "/sandbox/item/fire_webhook":
+            if body["access_token"] == "bad":
+                return httpx.Response(400, json={"error_code": "INVALID_ACCESS_TOKEN"})
+            return httpx.Response(200, json={"webhook_fired": True, "status_code": 200})
+        return httpx.Response(404)
+
+    def client(self) -> PlaidHttpClient:
+        return PlaidHttpClient(
+            "client-id", "secret", transport=httpx.MockTransport(self.handle), http2=False
+        )
+
+
+class TestPlaidHttpClient(unittest.TestCase):
+    """Test cases for the PlaidHttpClient class."""
+
+    def setUp(self):
+        self.fake = FakePlaid()
+
+    async def async_test_serializes_request_models(self):
+        client = self.fake.client()
+        try:
+            response = await client.auth_get(AuthGetRequest(access_token="access-sandbox-1"))
+        finally:
+            await client.aclose()
+
+        path, headers, body = self.fake.requests[0]
+        self.assertEqual(path, "/auth/get")
+        self.assertEqual(body, {"access_token": "access-sandbox-1"})
+        self.assertEqual(headers["plaid-client-id"], "client-id")
+        self.assertEqual(headers["plaid-version"], "2020-09-14")
+        self.assertEqual(response["accounts"][0]["mask"], "0000")
+
+    def test_serializes_request_models(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_serializes_request_models())
+
+    async def async_test_error_raises_api_exception(self):
+        client = self.fake.client()
+        try:
+            with self.assertRaises(plaid.ApiException) as cm:
+                await client.post("/sandbox/item/fire_webhook", {"access_token": "bad"})
+        finally:
+            await client.aclose()
+
+        self.assertEqual(cm.exception.status, 400)
+        self.assertIn("INVALID_ACCESS_TOKEN", cm.exception.body)
+
+    def test_error_raises_api_exception(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_error_raises_api_exception())
+
+    async def async_test_tool_handlers(self):
+        client = self.fake.client()
+        try:
+            token_result = await handle_get_sandbox_access_token(
+                {"initial_products": "auth,transfer"}, plaid_client=client
+            )
+            with self.assertRaisesRegex(ToolError, "Status code: 400"):
+                await handle_simulate_webhook(
+                    {"access_token": "bad", "webhook_code": "DEFAULT_UPDATE"}, plaid_client=client
+                )
+        finally:
+            await client.aclose()
+
+        self.assertIn("Access Token: access-sandbox-1", token_result[0].text)
+        self.assertIn("acc-1", token_result[0].text)
+        create_body = self.fake.requests[0][2]
+        self.assertEqual(create_body["initial_products"], ["auth", "transfer"])
+
+    def test_tool_handlers(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_tool_handlers())
+
+    async def async_test_account_fields_projection(self):
+        client = self.fake.client()
+        try:
+            default = await handle_get_sandbox_access_token({"initial_products": "transfer"}, plaid_client=client)
+            projected = await handle_get_sandbox_access_token(
+                {"initial_products": "transfer", "account_fields": ["account_id", "balances", "numbers"]},
+                plaid_client=client,
+            )
+        finally:
+            await client.aclose()
+
+        self.assertEqual(
+            default[0].text,
+            "Access Token: access-sandbox-1\nItem ID: item-1\nAccounts: 1 (acc-1), details in the attached JSON",
+        )
+        self.assertEqual(default[1].resource.mimeType, "application/json")
+        self.assertEqual(str(default[1].resource.uri), "plaid://sandbox/items/item-1/accounts")
+        self.assertEqual(json.loads(default[1].resource.text), [
+            {"account_id": "acc-1", "mask": "0000", "subtype": "checking"}
+        ])
+        self.assertEqual(json.loads(projected[1].resource.text), [{
+            "account_id": "acc-1",
+            "balances": {"available": 100, "current": 110},
+            "numbers": {"ach": {"account": "1111", "routing": "011"}},
+        }])
+
+    def test_account_fields_projection(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_account_fields_projection())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests for per-call CPU profiling.
+
+This module contains tests for selecting calls to profile and writing their
+profiles.
+"""
+
+import asyncio
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcp_server_plaid.profiling import CallProfiler
+
+
+class TestCallProfiler(unittest.TestCase):
+    """Test cases for the CallProfiler class."""
+
+    def test_selects_every_nth_call_and_named_tools(self):
+        """Every nth call and every call of the named tools should be profiled."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = CallProfiler(Path(tmp), every=3, tools=["search_documentation"])
+            selected = [profiler.should_profile(name) for name in ["a", "b", "c", "search_documentation", "d", "e"]]
+
+        self.assertEqual(selected, [False, False, True, True, False, True])
+
+    def test_profiles_every_call_without_selection(self):
+        """Without a selection, every call should be profiled."""
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = CallProfiler(Path(tmp))
+            self.assertTrue(all(profiler.should_profile("any_tool") for _ in range(3)))
+
+    async def async_test_writes_profile_per_call(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = CallProfiler(Path(tmp) / "profiles", tools=["slow/tool"])
+            self.assertTrue(profiler.should_profile("slow/tool"))
+            with profiler.profile("slow/tool"):
+                # Another call selected while profiling is skipped
+                self.assertFalse(profiler.should_profile("slow/tool"))
+                sum(i * i for i in range(10000))
+                await asyncio.sleep(0.01)
+
+            files = list((Path(tmp) / "profiles").iterdir())
+            self.assertEqual(len(files), 1)
+            self.assertRegex(files[0].name, r"-slow_tool-\d+ms-\d+-1\.prof$")
+            self.assertGreater(pstats.Stats(str(files[0])).total_calls, 0)
+
+    def test_writes_profile_per_call(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_writes_profile_per_call())
+
+
+if __name__ == "__main__":
+    unittest.main()
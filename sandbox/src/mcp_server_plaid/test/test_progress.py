@@ -0,0 +1,72 @@
+"""
+Tests for progress notifications.
+
+This module contains tests for ProgressReporter and for streaming
+search_documentation answers as progress notifications.
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from mcp_server_plaid.tools.progress import ProgressReporter
+from mcp_server_plaid.tools.tool_search_documentation import handle_search_documentation
+
+
+class FakeSession:
+    """MCP session stand-in recording sent notifications."""
+
+    def __init__(self):
+        self.notifications = []
+
+    async def send_notification(self, notification):
+        self.notifications.append(notification.root.params)
+
+
+class StreamingBillClient:
+    """AskBill client stand-in that streams a fixed answer."""
+
+    async def ask_question(self, question, timeout=60.0, on_chunk=None):
+        if on_chunk is not None:
+            await on_chunk("sources", [{"url": "https://plaid.com/docs", "title": "Docs"}])
+            await on_chunk("answer", "Use ")
+            await on_chunk("answer", "/transactions/sync.")
+        return {"answer": "Use /transactions/sync.", "sources": [{"url": "https://plaid.com/docs", "title": "Docs"}]}
+
+
+class TestProgressReporter(unittest.TestCase):
+    """Test cases for the ProgressReporter class."""
+
+    def test_from_request_context(self):
+        session = FakeSession()
+        with_token = SimpleNamespace(
+            request_context=SimpleNamespace(meta=SimpleNamespace(progressToken="tok"), session=session)
+        )
+        without_token = SimpleNamespace(request_context=SimpleNamespace(meta=None, session=session))
+
+        reporter = ProgressReporter.from_request_context(with_token)
+        self.assertEqual(reporter.progress_token, "tok")
+        self.assertIsNone(ProgressReporter.from_request_context(without_token))
+
+    async def async_test_streams_answer_chunks(self):
+        session = FakeSession()
+        result = await handle_search_documentation(
+            {"question": "How do I get transactions?"},
+            bill_client=StreamingBillClient(),
+            progress=ProgressReporter(session, "tok"),
+        )
+
+        self.assertEqual([params.progress for params in session.notifications], [1, 2, 3])
+        self.assertEqual(
+            [params.message for params in session.notifications],
+            ["## Sources\n- [Docs](<https://plaid.com/docs>)", "Use ", "/transactions/sync."],
+        )
+        self.assertTrue(result[0].text.startswith("Use /transactions/sync."))
+
+    def test_streams_answer_chunks(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_streams_answer_chunks())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ This module contains tests for the ToolRegistry class and related functions in r
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import mcp.types as types
 
@@ -46,6 +46,21 @@ class TestToolRegistry(unittest.TestCase):
                          "Handler should be retrievable")
         self.assertIn(mock_tool, self.registry.get_tools(), "Tool should be in the list of registered tools")
 
+    def test_register_tool_concurrency_limit(self):
+        """Test that a declared concurrency limit is kept with the tool."""
+        mock_tool = types.Tool(
+            name="limited_tool",
+            description="A limited tool",
+            inputSchema={"type": "object", "properties": {}}
+        )
+        self.registry.register(mock_tool, MagicMock(), max_concurrency=2)
+        self.assertEqual(self.registry.get_concurrency_limit("limited_tool"), 2,
+                         "Concurrency limit should be retrievable")
+
+        self.registry.register(mock_tool, MagicMock())
+        self.assertIsNone(self.registry.get_concurrency_limit("limited_tool"),
+                          "Re-registering without a limit should clear it")
+
     def test_register_duplicate_tool(self):
         """Test registering a tool with the same name twice."""
         # Create two mock tools with the same name
@@ -80,6 +95,29 @@ class TestToolRegistry(unittest.TestCase):
         self.assertIsNone(self.registry.get_handler("nonexistent_tool"),
                           "Should return None for nonexistent tool handlers")
 
+    def test_register_lazy_tool(self):
+        """Test that a lazily registered tool resolves its handler on first use."""
+        mock_tool = types.Tool(
+            name="lazy_tool",
+            description="A lazy tool",
+            inputSchema={"type": "object", "properties": {}}
+        )
+        mock_module = MagicMock()
+        mock_module.handle_lazy_tool = MagicMock()
+
+        self.registry.register_lazy(mock_tool, "some.tool_module", "handle_lazy_tool")
+        self.assertTrue(self.registry.has_tool("lazy_tool"), "Lazy tool should be registered")
+        self.assertIn(mock_tool, self.registry.get_tools(), "Lazy tool should be listed")
+
+        with patch("mcp_server_plaid.tools.registry.importlib.import_module",
+                   return_value=mock_module) as mock_import_module:
+            handler = self.registry.get_handler("lazy_tool")
+            self.registry.get_handler("lazy_tool")
+
+        mock_import_module.assert_called_once_with("some.tool_module")
+        self.assertIs(handler, mock_module.handle_lazy_tool,
+                      "Handler should be looked up in the imported module")
+
     def test_reset_registry(self):
         """Test resetting the registry."""
         # Register a tool
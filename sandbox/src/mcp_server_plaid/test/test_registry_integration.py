@@ -5,8 +5,13 @@ This module contains integration tests that verify the registry works correctly
 with actual tool modules.
 """
 
+import json
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 import mcp.types as types
 
@@ -21,6 +26,15 @@ class TestRegistryIntegration(unittest.TestCase):
         # Reset the registry before each test
         self.registry = get_registry()
         self.registry.reset()
+        # Start each test without a manifest from an earlier test
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        env_patch = patch.dict(os.environ, {"PLAID_MCP_CACHE_DIR": self.tmp_dir.name})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+    def tearDown(self):
+        """Clean up the temporary cache directory."""
+        self.tmp_dir.cleanup()
 
     def test_register_all_tools_integration(self):
         """Test that register_all_tools correctly registers tools from actual modules."""
@@ -106,5 +120,70 @@ class TestRegistryIntegration(unittest.TestCase):
                           "Should register fewer tools when only 'root' category is enabled")
 
 
+class TestToolManifest(unittest.TestCase):
+    """Integration tests for manifest-based tool discovery."""
+
+    def setUp(self):
+        """Set up a fresh registry and a temporary manifest location."""
+        self.registry = get_registry()
+        self.registry.reset()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.tmp_dir.name) / "tool_manifest.json"
+
+    def tearDown(self):
+        """Clean up the temporary manifest."""
+        self.tmp_dir.cleanup()
+
+    def test_manifest_serves_tools_without_import(self):
+        """Tools from an up-to-date manifest should be listed before their module is imported."""
+        register_all_tools("", manifest_path=self.manifest_path)
+        self.assertTrue(self.manifest_path.exists(), "The manifest should be written")
+        imported_tools = {tool.name: tool for tool in self.registry.get_tools()}
+
+        self.registry.reset()
+        with patch("mcp_server_plaid.tools.registry.importlib.import_module") as mock_import_module:
+            register_all_tools("", manifest_path=self.manifest_path)
+            self.assertEqual(mock_import_module.call_count, 0,
+                             "No tool module should be imported at discovery time")
+
+        manifest_tools = {tool.name: tool for tool in self.registry.get_tools()}
+        self.assertEqual(manifest_tools, imported_tools,
+                         "Manifest tools should match the imported definitions")
+
+        # Handlers are resolved on first use
+        for name in manifest_tools:
+            self.assertIsNotNone(self.registry.get_handler(name),
+                                 f"Should resolve the handler for {name}")
+
+    def test_changed_module_is_reimported(self):
+        """A manifest entry with a stale fingerprint should not be used."""
+        register_all_tools("", manifest_path=self.manifest_path)
+        manifest = json.loads(self.manifest_path.read_text())
+        for entry in manifest["modules"].values():
+            entry["fingerprint"] = "stale"
+        self.manifest_path.write_text(json.dumps(manifest))
+
+        self.registry.reset()
+        register_all_tools("", manifest_path=self.manifest_path)
+        self.assertEqual(self.registry._lazy_handlers, {},
+                         "Every stale module should be imported eagerly")
+        self.assertEqual(len(self.registry.get_tools()), len(self.registry._handlers),
+                         "Every tool should have its handler loaded")
+
+    def test_changed_environment_is_reimported(self):
+        """A manifest written with other helper modules or package versions should not be used."""
+        register_all_tools("", manifest_path=self.manifest_path)
+        manifest = json.loads(self.manifest_path.read_text())
+        manifest["environment"] = "plaid-python upgraded"
+        self.manifest_path.write_text(json.dumps(manifest))
+
+        self.registry.reset()
+        register_all_tools("", manifest_path=self.manifest_path)
+        self.assertEqual(self.registry._lazy_handlers, {},
+                         "Every module should be imported eagerly")
+        self.assertNotEqual(json.loads(self.manifest_path.read_text())["environment"], "plaid-python upgraded",
+                            "The manifest should be rewritten for the current environment")
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Tests for the batch sandbox item tool.
+
+This module contains tests for handle_get_sandbox_access_token_batch.
+"""
+
+import asyncio
+import json
+import unittest
+
+import plaid
+
+from mcp_server_plaid.test.fakes import FakePlaidClient
+from mcp_server_plaid.tools.registry import ToolError
+from mcp_server_plaid.tools.tool_get_sandbox_access_token_batch import (
+    GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL,
+    MAX_BATCH_ITEMS,
+    handle_get_sandbox_access_token_batch,
+)
+from mcp_server_plaid.tools.validation import compile_schema
+
+
+def invalid_product_error(request):
+    """Fail public token requests for products Plaid doesn't know, the way the API does."""
+    if "not_a_product" not in [str(product) for product in request.initial_products]:
+        return None
+    error = plaid.ApiException(status=400, reason="Bad Request")
+    error.body = json.dumps({
+        "error_code": "INVALID_FIELD",
+        "error_message": "initial_products contains an invalid product",
+    })
+    return error
+
+
+def slow_plaid_client():
+    """Plaid client stand-in whose item creation takes long enough to overlap."""
+    return FakePlaidClient(
+        delay=0.01,
+        accounts=[{"account_id": "acc-1"}, {"account_id": "acc-2"}],
+        error=invalid_product_error,
+    )
+
+
+class TestSandboxBatch(unittest.TestCase):
+    """Test cases for the get_sandbox_access_token_batch tool."""
+
+    async def async_test_creates_items_concurrently(self):
+        client = slow_plaid_client()
+        result = await handle_get_sandbox_access_token_batch(
+            {
+                "items": [
+                    {"initial_products": "transactions", "count": 6},
+                    {"initial_products": "auth,transfer"},
+                    {"initial_products": "not_a_product"},
+                ],
+                "max_concurrency": 3,
+            },
+            plaid_client=client,
+        )
+        text = result[0].text
+
+        self.assertTrue(text.startswith("Created 7 of 8 sandbox items."))
+        self.assertEqual(client.max_in_flight, 3, "Fan-out should be bounded by max_concurrency")
+        self.assertIn("| 7 | auth,transfer | access-7 | item-7 | acc-1, acc-2 |  |", text)
+        self.assertIn("not_a_product", text.splitlines()[-1])
+        self.assertIn("INVALID_FIELD: initial_products contains an invalid product", text.splitlines()[-1])
+
+    def test_creates_items_concurrently(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_creates_items_concurrently())
+
+    async def async_test_rejects_oversized_batch(self):
+        with self.assertRaisesRegex(ToolError, r"Too many items requested \(500\)"):
+            await handle_get_sandbox_access_token_batch(
+                {"items": [{"initial_products": "transactions", "count": 500}]},
+                plaid_client=slow_plaid_client(),
+            )
+
+        # Huge counts are rejected before the specs are expanded
+        with self.assertRaisesRegex(ToolError, rf"Too many items requested \({10 ** 12 + 1}\)"):
+            await handle_get_sandbox_access_token_batch(
+                {"items": [{"initial_products": "transactions", "count": 10 ** 12}, {"initial_products": "auth"}]},
+                plaid_client=slow_plaid_client(),
+            )
+
+    def test_schema_bounds_batch_size(self):
+        validate = compile_schema(GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL.inputSchema)
+        self.assertEqual(
+            [path for path, _ in validate({"items": [{"initial_products": "transactions", "count": 300000000}]})],
+            ["items[0].count"],
+        )
+        self.assertEqual(
+            [path for path, _ in validate({"items": [{"initial_products": "auth"}] * (MAX_BATCH_ITEMS + 1)})],
+            ["items"],
+        )
+
+    def test_rejects_oversized_batch(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_rejects_oversized_batch())
+
+
+if __name__ == "__main__":
+    unittest.main()
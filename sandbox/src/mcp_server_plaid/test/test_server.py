@@ -5,20 +5,36 @@ This module contains tests for the server initialization and functionality.
 """
 
 import asyncio
+import contextlib
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
 import mcp.types as types
 from mcp.server import Server, NotificationOptions
 
+from mcp_server_plaid.clients.item_store import DATABASE_FILENAME
 from mcp_server_plaid.server import serve
 
 
 class TestServer(unittest.TestCase):
     """Test cases for the server module."""
 
+    def setUp(self):
+        """Give each test its own cache directory for the stores the server opens."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        env_patch = patch.dict(os.environ, {"PLAID_MCP_CACHE_DIR": self.tmp_dir.name})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
+    def tearDown(self):
+        """Clean up the temporary cache directory."""
+        self.tmp_dir.cleanup()
+
     @patch('mcp_server_plaid.server.AskBillClient')
-    @patch('mcp_server_plaid.server.plaid_api.PlaidApi')
+    @patch('plaid.api.plaid_api.PlaidApi')
     @patch('mcp_server_plaid.server.register_all_tools')
     async def async_test_serve_initialization(self, mock_register_all_tools, mock_plaid_api, mock_bill_client):
         """Test that the serve function initializes the server correctly."""
@@ -46,6 +62,9 @@ class TestServer(unittest.TestCase):
         
         # Verify the registry was initialized with the correct parameters
         mock_register_all_tools.assert_called_once_with("")
+
+        # Created items are recorded in the cache directory, never elsewhere
+        self.assertTrue((Path(self.tmp_dir.name) / DATABASE_FILENAME).exists())
         
         # Don't test too many implementation details that could change
         # Just verify the server can be initialized without errors
@@ -54,7 +73,26 @@ class TestServer(unittest.TestCase):
         """Run the async test."""
         asyncio.run(self.async_test_serve_initialization())
         
-    @patch('mcp_server_plaid.server.plaid_api.PlaidApi')
+    @patch('mcp_server_plaid.server.AskBillClient')
+    @patch('mcp_server_plaid.server.PlaidHttpClient')
+    @patch('mcp_server_plaid.server.register_all_tools')
+    async def async_test_serve_closes_clients(self, mock_register_all_tools, mock_http_client, mock_bill_client):
+        """Test that the upstream clients are closed with the resources stack."""
+        mock_http_client.return_value.aclose = AsyncMock()
+        mock_bill_client.return_value.close = AsyncMock()
+
+        async with contextlib.AsyncExitStack() as resources:
+            await serve("test_client_id", "test_secret", "", resources=resources)
+            mock_http_client.return_value.aclose.assert_not_called()
+
+        mock_http_client.return_value.aclose.assert_awaited_once()
+        mock_bill_client.return_value.close.assert_awaited_once()
+
+    def test_serve_closes_clients(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_serve_closes_clients())
+
+    @patch('plaid.api.plaid_api.PlaidApi')
     @patch('mcp_server_plaid.server.register_all_tools')
     @patch('mcp_server_plaid.server.Server')
     async def async_test_serve_unknown_tool(self, mock_server_class, mock_register_all_tools, mock_plaid_api):
@@ -92,7 +130,7 @@ class TestServer(unittest.TestCase):
         """Run the async test."""
         asyncio.run(self.async_test_serve_unknown_tool())
         
-    @patch('mcp_server_plaid.server.plaid_api.PlaidApi')
+    @patch('plaid.api.plaid_api.PlaidApi')
     @patch('mcp_server_plaid.server.register_all_tools')
     @patch('mcp_server_plaid.server.Server')
     async def async_test_serve_no_handler(self, mock_server_class, mock_register_all_tools, mock_plaid_api):
@@ -0,0 +1,127 @@
+"""
+Tests for the simulate_webhook tool.
+
+This module contains tests for single and bulk webhook firing.
+"""
+
+import asyncio
+import unittest
+
+import plaid
+
+from mcp_server_plaid.tools.pfm.tool_lookup_webhooks import handle_lookup_webhooks
+from mcp_server_plaid.tools.pfm.tool_simulate_webhook import handle_simulate_webhook
+from mcp_server_plaid.tools.pfm.webhook_catalog import get_catalog, validate_webhook
+from mcp_server_plaid.tools.registry import ToolError
+
+
+class FakeWebhookClient:
+    """Async Plaid client stand-in recording fired webhooks."""
+
+    def __init__(self):
+        self.fired = []
+
+    async def sandbox_item_fire_webhook(self, request):
+        await asyncio.sleep(0)
+        if request.access_token == "access-revoked":
+            raise plaid.ApiException(status=400, reason="ITEM_LOGIN_REQUIRED")
+        self.fired.append((request.access_token, request.webhook_code))
+        return {"webhook_fired": True, "status_code": 200}
+
+
+class TestSimulateWebhook(unittest.TestCase):
+    """Test cases for handle_simulate_webhook."""
+
+    async def async_test_single_webhook(self):
+        client = FakeWebhookClient()
+        result = await handle_simulate_webhook(
+            {"access_token": "access-1", "webhook_code": "DEFAULT_UPDATE", "webhook_type": "TRANSACTIONS"},
+            plaid_client=client,
+        )
+        self.assertEqual(result[0].text, "Webhook fired: True, Status code: 200")
+
+    def test_single_webhook(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_single_webhook())
+
+    async def async_test_bulk_webhooks(self):
+        client = FakeWebhookClient()
+        result = await handle_simulate_webhook(
+            {
+                "access_token": "access-default",
+                "webhooks": [
+                    {"access_token": "access-1", "webhook_type": "TRANSACTIONS", "webhook_code": "DEFAULT_UPDATE"},
+                    {"webhook_type": "TRANSACTIONS", "webhook_code": "SYNC_UPDATES_AVAILABLE"},
+                    {"access_token": "access-revoked", "webhook_code": "NEW_ACCOUNTS_AVAILABLE"},
+                ],
+                "rate_per_second": 1000,
+            },
+            plaid_client=client,
+        )
+        lines = result[0].text.splitlines()
+
+        self.assertEqual(lines[0], "Fired 2 of 3 webhooks.")
+        self.assertIn(("access-default", "SYNC_UPDATES_AVAILABLE"), client.fired)
+        self.assertIn("| 3 | ...-revoked |  | NEW_ACCOUNTS_AVAILABLE | False | 400 |", lines[-1])
+        self.assertIn("ITEM_LOGIN_REQUIRED", lines[-1])
+
+    def test_bulk_webhooks(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_bulk_webhooks())
+
+    async def async_test_missing_arguments(self):
+        with self.assertRaisesRegex(ToolError, "is required"):
+            await handle_simulate_webhook({"access_token": "access-1"}, plaid_client=FakeWebhookClient())
+
+    def test_missing_arguments(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_missing_arguments())
+
+    async def async_test_invalid_webhooks_fail_locally(self):
+        client = FakeWebhookClient()
+        with self.assertRaisesRegex(ToolError, "is fired with webhook_type TRANSACTIONS, not ITEM"):
+            await handle_simulate_webhook(
+                {"access_token": "access-1", "webhook_code": "SYNC_UPDATES_AVAILABLE", "webhook_type": "ITEM"},
+                plaid_client=client,
+            )
+        # A bulk call where every webhook failed is an error too
+        with self.assertRaisesRegex(ToolError, r"Did you mean SYNC_UPDATES_AVAILABLE\?"):
+            await handle_simulate_webhook(
+                {"access_token": "access-1", "webhooks": [{"webhook_code": "SYNC_UPDATE_AVAILABLE"}]},
+                plaid_client=client,
+            )
+
+        self.assertEqual(client.fired, [])
+
+    def test_invalid_webhooks_fail_locally(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_invalid_webhooks_fail_locally())
+
+
+class TestWebhookCatalog(unittest.TestCase):
+    """Test cases for the webhook catalog and the lookup_webhooks tool."""
+
+    def test_catalog_follows_sdk(self):
+        catalog = get_catalog()
+        self.assertIn("SYNC_UPDATES_AVAILABLE", catalog)
+        self.assertEqual(catalog["PRODUCT_READY"].webhook_types, ("ASSETS",))
+        self.assertIsNone(validate_webhook("default_update", "transactions"))
+        self.assertIsNone(validate_webhook("DEFAULT_UPDATE"))
+        self.assertIn("Unknown webhook_type", validate_webhook("DEFAULT_UPDATE", "NOPE"))
+
+    async def async_test_lookup(self):
+        result = await handle_lookup_webhooks({"query": "sync", "webhook_type": "transactions"})
+        lines = result[0].text.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[2].startswith("| SYNC_UPDATES_AVAILABLE | TRANSACTIONS |"))
+
+        everything = await handle_lookup_webhooks({})
+        self.assertEqual(len(everything[0].text.splitlines()), len(get_catalog()) + 2)
+
+    def test_lookup(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_lookup())
+
+
+if __name__ == "__main__":
+    unittest.main()
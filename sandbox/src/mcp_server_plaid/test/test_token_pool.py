@@ -0,0 +1,79 @@
+"""
+Tests for the pre-warmed sandbox item pool.
+
+This module contains tests for SandboxItemPool and its use by the
+get_sandbox_access_token tool.
+"""
+
+import asyncio
+import unittest
+
+from mcp_server_plaid.clients.token_pool import SandboxItemPool, parse_profiles
+from mcp_server_plaid.test.fakes import FakePlaidClient
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import handle_get_sandbox_access_token
+
+
+async def wait_until(condition, timeout=1.0):
+    """Poll until a condition holds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+class TestSandboxItemPool(unittest.TestCase):
+    """Test cases for the SandboxItemPool class."""
+
+    def test_parse_profiles(self):
+        """Profiles should be normalized and de-duplicated."""
+        self.assertEqual(
+            parse_profiles("transactions; transfer,auth ;auth,transfer;"),
+            ["transactions", "auth,transfer"],
+        )
+
+    async def async_test_take_and_refill(self):
+        client = FakePlaidClient()
+        pool = SandboxItemPool(client, ["auth,transfer"], size=2)
+        pool.start()
+        await wait_until(lambda: pool.available(["auth", "transfer"]) == 2)
+
+        item = pool.take(["transfer", "auth"])
+        self.assertEqual(item["access_token"], "access-1")
+        self.assertEqual(item["accounts"], [{"account_id": "acc-for-access-1"}])
+        self.assertIsNone(pool.take(["transactions"]), "Unpooled profiles should not be served")
+
+        await wait_until(lambda: pool.available(["auth", "transfer"]) == 2)
+        self.assertEqual(len(client.created), 3, "Taking an item should trigger one refill")
+        self.assertEqual(pool.stats()["hits"], 1)
+        await pool.close()
+
+    def test_take_and_refill(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_take_and_refill())
+
+    async def async_test_tool_uses_pool(self):
+        client = FakePlaidClient()
+        pool = SandboxItemPool(client, ["transactions"], size=1)
+        pool.start()
+        await wait_until(lambda: pool.available(["transactions"]) == 1)
+
+        pooled = await handle_get_sandbox_access_token(
+            {"initial_products": "transactions"}, plaid_client=client, token_pool=pool
+        )
+        with_webhook = await handle_get_sandbox_access_token(
+            {"initial_products": "transactions", "webhook": "https://example.com/hook"},
+            plaid_client=client, token_pool=pool,
+        )
+        await pool.close()
+
+        self.assertEqual(pooled[0].text, "Access Token: access-1\nItem ID: item-1")
+        self.assertNotIn("access-1", with_webhook[0].text)
+        webhook_request = next(r for r in client.created if r.options.get("webhook"))
+        self.assertEqual(webhook_request.options.webhook, "https://example.com/hook")
+
+    def test_tool_uses_pool(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_tool_uses_pool())
+
+
+if __name__ == "__main__":
+    unittest.main()
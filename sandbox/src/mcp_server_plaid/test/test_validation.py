@@ -0,0 +1,117 @@
+"""
+Tests for tool argument validation.
+
+This module contains tests for compiled input schema validators and for
+rejecting invalid calls before their handler runs.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+import mcp.types as types
+
+from mcp_server_plaid.server import serve
+from mcp_server_plaid.tools.registry import ToolRegistry
+from mcp_server_plaid.tools.tool_get_sandbox_access_token import GET_SANDBOX_ACCESS_TOKEN_TOOL
+from mcp_server_plaid.tools.tool_get_sandbox_access_token_batch import GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL
+from mcp_server_plaid.tools.validation import InvalidArgumentsError, compile_schema
+
+
+class TestCompileSchema(unittest.TestCase):
+    """Test cases for compile_schema."""
+
+    def setUp(self):
+        self.validate = compile_schema({
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "minLength": 1},
+                "count": {"type": "integer", "minimum": 1, "maximum": 10},
+                "mode": {"type": "string", "enum": ["fast", "slow"]},
+                "tags": {"type": "array", "maxItems": 2, "items": {"type": "string"}},
+                "ratio": {"type": "number", "exclusiveMinimum": 0},
+            },
+            "required": ["name"],
+        })
+
+    def test_valid_arguments(self):
+        self.assertEqual(self.validate({"name": "a", "count": 3, "mode": "fast", "tags": ["x"], "ratio": 0.5}), [])
+        # JSON numbers like 3.0 are integers, and optional nulls count as omitted
+        self.assertEqual(self.validate({"name": "a", "count": 3.0, "mode": None}), [])
+
+    def test_reports_every_error_with_its_path(self):
+        errors = self.validate({"count": 11, "mode": "medium", "tags": ["x", 2, "z"], "ratio": 0, "extra": True})
+
+        self.assertEqual(dict(errors), {
+            "name": "is required",
+            "count": "must be at most 10, got 11",
+            "mode": '"medium" is not one of "fast", "slow"',
+            "tags": "must have at most 2 items, got 3",
+            "tags[1]": "expected string, got 2",
+            "ratio": "must be greater than 0, got 0",
+        })
+
+    def test_booleans_are_not_numbers(self):
+        self.assertEqual(self.validate({"name": "a", "count": True}), [("count", "expected integer, got true")])
+
+    def test_products_pattern(self):
+        validate = compile_schema(GET_SANDBOX_ACCESS_TOKEN_TOOL.inputSchema)
+        self.assertEqual(validate({"initial_products": "auth, transfer"}), [])
+        [(path, message)] = validate({"initial_products": "auth,transactoins"})
+        self.assertEqual(path, "initial_products")
+        self.assertIn("does not match", message)
+
+        validate_batch = compile_schema(GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL.inputSchema)
+        self.assertEqual(
+            [path for path, _ in validate_batch({"items": [{"initial_products": "auth"}, {"count": 2}]})],
+            ["items[1].initial_products"],
+        )
+
+
+class TestCallValidation(unittest.TestCase):
+    """Test cases for validation in the call_tool handler."""
+
+    def setUp(self):
+        self.registry = ToolRegistry()
+        self.registry.reset()
+
+    def tearDown(self):
+        self.registry.reset()
+
+    async def async_test_invalid_call_never_reaches_handler(self):
+        handler = AsyncMock(return_value=[types.TextContent(type="text", text="ok")])
+        self.registry.register(
+            types.Tool(
+                name="validated_tool",
+                description="Validated",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"access_token": {"type": "string"}},
+                    "required": ["access_token"],
+                },
+            ),
+            handler,
+        )
+        with self.assertRaises(InvalidArgumentsError) as raised:
+            self.registry.validate_arguments("validated_tool", {})
+        self.assertEqual(raised.exception.errors, [("access_token", "is required")])
+
+        server = await serve("test_client_id", "test_secret", "")
+        call_tool = server.request_handlers[types.CallToolRequest]
+        result = await call_tool(types.CallToolRequest(
+            method="tools/call", params=types.CallToolRequestParams(name="validated_tool", arguments={})
+        ))
+
+        self.assertTrue(result.root.isError)
+        self.assertEqual(
+            result.root.content[0].text, "Invalid arguments for tool validated_tool: access_token: is required"
+        )
+        handler.assert_not_called()
+
+    def test_invalid_call_never_reaches_handler(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_invalid_call_never_reaches_handler())
+
+
+if __name__ == "__main__":
+    unittest.main()
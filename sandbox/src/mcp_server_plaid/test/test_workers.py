@@ -0,0 +1,171 @@
+"""
+Tests for the pre-fork worker mode.
+
+This module runs a worker pool in a child process and connects to it with the
+MCP SSE client, so that session affinity and worker recycling can be tested
+end to end.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import socket
+import time
+import unittest
+
+import httpx
+import mcp.types as types
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.server import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from sse_starlette.sse import AppStatus
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Mount
+
+from mcp_server_plaid.workers import MessageRouter, WorkerPool
+
+
+async def make_server(resources):
+    """Create an MCP server with a tool reporting the worker's process ID."""
+    server = Server("test")
+
+    @server.list_tools()
+    async def list_tools():
+        return [types.Tool(name="pid", description="Worker process ID", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        await asyncio.sleep(0.01)
+        return [types.TextContent(type="text", text=str(os.getpid()))]
+
+    options = InitializationOptions(
+        server_name="test",
+        server_version="0",
+        capabilities=server.get_capabilities(NotificationOptions(), {}),
+    )
+    return server, options
+
+
+def free_port() -> int:
+    """Find a free local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def call_pid(url: str, calls: int) -> list:
+    """Open a session and call the pid tool several times."""
+    async with sse_client(f"{url}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            return [(await session.call_tool("pid", {})).content[0].text for _ in range(calls)]
+
+
+class TestMessageRouter(unittest.TestCase):
+    """Test cases for the MessageRouter class."""
+
+    async def async_test_routes_by_port(self):
+        local_calls = []
+
+        async def local_app(scope, receive, send):
+            local_calls.append(scope["path"])
+            await Response("local", status_code=202)(scope, receive, send)
+
+        def forward(request):
+            return httpx.Response(202, text=f"forwarded to {request.url.port} {request.url.query.decode()}")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(forward)) as peer_client:
+            router = MessageRouter(9001, local_app, lambda: {9001, 9002}, peer_client)
+            app = Starlette(routes=[Mount("/messages/", app=router)])
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test") as client:
+                local = await client.post("/messages/9001/?session_id=a", content=b"{}")
+                forwarded = await client.post("/messages/9002/?session_id=b", content=b"{}")
+                unknown = await client.post("/messages/9003/?session_id=c", content=b"{}")
+
+        self.assertEqual((local.status_code, local.text), (202, "local"))
+        self.assertEqual(local_calls, ["/messages/9001/"])
+        self.assertEqual(forwarded.text, "forwarded to 9002 session_id=b")
+        self.assertEqual(unknown.status_code, 404)
+
+    def test_routes_by_port(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_routes_by_port())
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for the WorkerPool class."""
+
+    def setUp(self):
+        # Workers inherit sse-starlette's process-wide event, which earlier tests bound to their loop
+        AppStatus.should_exit_event = None
+
+    def start_pool(self, **kwargs) -> str:
+        port = free_port()
+        pool = WorkerPool(make_server, host="127.0.0.1", port=port, **kwargs)
+        process = multiprocessing.get_context("fork").Process(target=pool.run)
+        process.start()
+        self.addCleanup(process.join, 15)
+        self.addCleanup(process.terminate)
+
+        url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(f"{url}/healthz").status_code == 200:
+                    return url
+            except httpx.HTTPError:
+                time.sleep(0.05)
+        self.fail("Worker pool did not start")
+
+    async def async_test_sessions_stay_on_their_worker(self):
+        url = self.start_pool(workers=2)
+        # Let both workers come up before opening sessions
+        await asyncio.sleep(0.5)
+        results = await asyncio.gather(*(call_pid(url, 5) for _ in range(12)))
+
+        # Messages posted to the other worker are forwarded to the session's owner
+        for pids in results:
+            self.assertEqual(len(set(pids)), 1, "Every call of a session should run on one worker")
+
+    def test_sessions_stay_on_their_worker(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_sessions_stay_on_their_worker())
+
+    async def async_test_workers_are_recycled(self):
+        url = self.start_pool(workers=1, max_calls=3)
+        first = await call_pid(url, 4)
+        # The recycled worker finishes the open session, and the replacement takes new ones
+        self.assertEqual(len(set(first)), 1)
+        await asyncio.sleep(0.5)
+        second = await call_pid(url, 1)
+
+        self.assertNotEqual(first[0], second[0])
+
+    def test_workers_are_recycled(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_workers_are_recycled())
+
+    async def async_test_draining_worker_keeps_open_sessions(self):
+        url = self.start_pool(workers=1, max_calls=1, drain_timeout=0)
+        async with sse_client(f"{url}/sse") as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                draining_pid = (await session.call_tool("pid", {})).content[0].text
+                await asyncio.sleep(0.5)
+                # New sessions go to the replacement while the open one keeps its worker
+                [new_pid] = await call_pid(url, 1)
+                await asyncio.sleep(1.0)
+                still_open = (await session.call_tool("pid", {})).content[0].text
+
+        self.assertNotEqual(new_pid, draining_pid)
+        self.assertEqual(still_open, draining_pid)
+
+    def test_draining_worker_keeps_open_sessions(self):
+        """Run the async test."""
+        asyncio.run(self.async_test_draining_worker_keeps_open_sessions())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,6 @@ Tools module for Plaid MCP server.
 This module provides a registry for MCP tools and their implementations.
 """
 
-from mcp_server_plaid.tools.registry import ToolRegistry, register_all_tools
+from mcp_server_plaid.tools.registry import ToolError, ToolRegistry, register_all_tools
 
-__all__ = ["ToolRegistry", "register_all_tools"]
+__all__ = ["ToolError", "ToolRegistry", "register_all_tools"]
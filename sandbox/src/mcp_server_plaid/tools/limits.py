@@ -0,0 +1,165 @@
+"""
+Concurrency and rate limits for tool calls.
+
+This module bounds how many calls to a tool may run at once, with a bounded
+queue of waiting calls. Calls that cannot get a slot quickly enough fail fast
+with ToolBusyError instead of piling up until the client times out. It also
+provides a rate limiter for tools that fan out many upstream requests.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Optional
+
+
+class ToolBusyError(RuntimeError):
+    """Raised when a tool call cannot be admitted because the tool is at capacity."""
+
+
+class ConcurrencyLimiter:
+    """Admission control for calls to a single tool."""
+
+    def __init__(
+            self,
+            name: str,
+            max_concurrency: int,
+            max_queue: int = 16,
+            max_wait: float = 5.0,
+            subject: Optional[str] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: The tool name, used in error messages
+            max_concurrency: Maximum number of calls running at once
+            max_queue: Maximum number of calls waiting for a slot
+            max_wait: Maximum time in seconds a call waits for a slot
+            subject: What is busy, for error messages; defaults to "Tool <name>"
+        """
+        self.name = name
+        self.subject = subject or f"Tool {name}"
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+
+    def _busy(self, reason: str) -> ToolBusyError:
+        return ToolBusyError(
+            f"{self.subject} is busy ({reason}; {self.in_flight} running, "
+            f"{self.waiting} waiting). Please retry shortly."
+        )
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot.
+
+        Raises:
+            ToolBusyError: If the wait queue is full or no slot frees up within max_wait
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise self._busy("wait queue is full")
+            self.waiting += 1
+            try:
+                async with asyncio.timeout(self.max_wait):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                raise self._busy(f"no slot within {self.max_wait:g}s") from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Release a slot taken with acquire."""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> Optional[bool]:
+        self.release()
+        return None
+
+
+class SessionLimiters:
+    """Per-session concurrency limiters, dropped together with their session."""
+
+    def __init__(self, max_concurrency: int, max_queue: int = 16, max_wait: float = 5.0):
+        """
+        Initialize the limiters.
+
+        Args:
+            max_concurrency: Maximum number of calls a session may run at once (0 disables the limit)
+            max_queue: Maximum number of calls a session may have waiting for a slot
+            max_wait: Maximum time in seconds a call waits for a slot
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._limiters: "weakref.WeakKeyDictionary[Any, ConcurrencyLimiter]" = weakref.WeakKeyDictionary()
+
+    def get(self, session: Any) -> Optional[ConcurrencyLimiter]:
+        """
+        Get the limiter for a session.
+
+        Args:
+            session: The MCP session making the call, or None when unknown
+
+        Returns:
+            The session's limiter, or None if sessions are not limited
+        """
+        if self.max_concurrency <= 0 or session is None:
+            return None
+        limiter = self._limiters.get(session)
+        if limiter is None:
+            limiter = ConcurrencyLimiter(
+                "session",
+                self.max_concurrency,
+                max_queue=self.max_queue,
+                max_wait=self.max_wait,
+                subject="This session",
+            )
+            self._limiters[session] = limiter
+        return limiter
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+
+class RateLimiter:
+    """Token bucket limiting how often an operation may start."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Average number of operations allowed per second
+            burst: Number of operations that may start back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until an operation may start."""
+        # Waiters queue on the lock, so they are admitted in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,411 @@
+"""
+Deterministic generator for Plaid sandbox custom user data.
+
+This module produces ``override_accounts`` payloads following the same rules
+as the get_mock_data_prompt template: account types and subtypes, recurring
+weekly, bi-weekly, monthly and quarterly patterns, realistic amount ranges,
+description formats, and date_transacted one day before date_posted.
+
+Amounts follow Plaid's sign convention: positive when money moves out of the
+account, negative when money moves in.
+
+Transactions are generated per account in batches (all occurrences of a
+recurring stream, then all discretionary transactions at once) from a single
+seeded ``random.Random``, so the same seed always yields the same dataset.
+"""
+
+import random
+import string
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+OUT = 1  # money leaves the account
+IN = -1  # money enters the account
+
+ACH_ROUTING = "021000021"
+CURRENCY = "USD"
+
+ACCOUNT_TYPES = {
+    "checking": "depository",
+    "savings": "depository",
+    "credit card": "credit",
+    "mortgage": "loan",
+    "401k": "investment",
+}
+
+CADENCE_DAYS = {"weekly": 7, "biweekly": 14}
+CADENCE_MONTHS = {"monthly": 1, "quarterly": 3}
+
+
+class Recurring(NamedTuple):
+    """A transaction that repeats on a schedule."""
+
+    merchant: str
+    txn_type: str
+    cadence: str  # weekly, biweekly, monthly or quarterly
+    low: float
+    high: float
+    direction: int
+    # Whether each occurrence gets a new amount in the range, or repeats one amount
+    varies: bool = False
+
+
+class Discretionary(NamedTuple):
+    """A transaction drawn at random dates."""
+
+    merchant: str
+    txn_type: str
+    low: float
+    high: float
+    direction: int
+    weight: float = 1.0
+
+
+PERSONAL_PATTERNS: Dict[str, Tuple[List[Recurring], List[Discretionary]]] = {
+    "checking": (
+        [
+            Recurring("Payroll", "DIRECT DEP", "biweekly", 2000, 4000, IN),
+            Recurring("Rent", "ACH DEBIT", "monthly", 1500, 3000, OUT),
+            Recurring("Netflix", "DEBIT CRD AUTOPAY", "monthly", 15, 23, OUT),
+            Recurring("Spotify", "DEBIT CRD AUTOPAY", "monthly", 10, 12, OUT),
+            Recurring("Electric Company", "ACH DEBIT", "monthly", 100, 200, OUT, varies=True),
+            Recurring("Internet Provider", "ACH DEBIT", "monthly", 50, 100, OUT),
+            Recurring("Trader Joe's", "DEBIT CRD", "weekly", 100, 300, OUT, varies=True),
+        ],
+        [
+            Discretionary("DoorDash", "DEBIT CRD", 20, 100, OUT, 3),
+            Discretionary("Uber Eats", "DEBIT CRD", 20, 100, OUT, 2),
+            Discretionary("Local Restaurant", "DEBIT CRD", 20, 100, OUT, 3),
+            Discretionary("Uber", "DEBIT CRD", 15, 50, OUT, 2),
+            Discretionary("Lyft", "DEBIT CRD", 15, 50, OUT, 1),
+            Discretionary("Public Transit", "DEBIT CRD", 3, 10, OUT, 1),
+            Discretionary("Whole Foods", "DEBIT CRD", 20, 150, OUT, 2),
+            Discretionary("Safeway", "DEBIT CRD", 20, 150, OUT, 1),
+            Discretionary("Amazon", "DEBIT CRD", 10, 250, OUT, 2),
+            Discretionary("Target", "DEBIT CRD", 10, 200, OUT, 2),
+            Discretionary("Disney+", "DEBIT CRD", 8, 14, OUT, 0.3),
+            Discretionary("Water Company", "ACH DEBIT", 30, 80, OUT, 0.3),
+            Discretionary("Refund", "POS CREDIT", 10, 150, IN, 0.3),
+            Discretionary("Account Transfer", "ONLINE TRANSFER", 100, 1000, IN, 0.3),
+        ],
+    ),
+    "savings": (
+        [
+            Recurring("Account Transfer", "ONLINE TRANSFER FROM CHK", "monthly", 200, 1000, IN),
+            Recurring("Interest", "INTEREST PAYMENT", "monthly", 1, 20, IN, varies=True),
+        ],
+        [
+            Discretionary("Account Transfer", "ONLINE TRANSFER TO CHK", 100, 2000, OUT),
+        ],
+    ),
+    "credit card": (
+        [
+            Recurring("Credit Card Payment", "AUTOPAY PAYMENT", "monthly", 500, 3000, IN, varies=True),
+        ],
+        [
+            Discretionary("Local Restaurant", "PURCHASE", 20, 100, OUT, 3),
+            Discretionary("DoorDash", "PURCHASE", 20, 100, OUT, 2),
+            Discretionary("Amazon", "PURCHASE", 10, 400, OUT, 3),
+            Discretionary("Target", "PURCHASE", 10, 250, OUT, 2),
+            Discretionary("Uber", "PURCHASE", 15, 50, OUT, 2),
+            Discretionary("Lyft", "PURCHASE", 15, 50, OUT, 1),
+            Discretionary("Refund", "RETURN CREDIT", 10, 150, IN, 0.2),
+        ],
+    ),
+    "mortgage": (
+        [Recurring("Mortgage Payment", "LOAN PAYMENT", "monthly", 1500, 3000, IN)],
+        [Discretionary("Principal Prepayment", "LOAN PAYMENT", 200, 2000, IN)],
+    ),
+    "401k": (
+        [
+            Recurring("Payroll Contribution", "CONTRIBUTION", "biweekly", 200, 800, IN),
+            Recurring("Dividend", "DIVIDEND", "quarterly", 20, 200, IN, varies=True),
+        ],
+        [Discretionary("Account Fee", "FEE", 5, 25, OUT)],
+    ),
+}
+
+BUSINESS_PATTERNS: Dict[str, Tuple[List[Recurring], List[Discretionary]]] = {
+    "checking": (
+        [
+            Recurring("AWS", "AMAZON WEB SERVICES", "monthly", 800, 6000, OUT),
+            Recurring("Twilio", "TWILIO", "monthly", 700, 1500, OUT),
+            Recurring("Typeform", "TYPEFORM", "monthly", 10, 50, OUT),
+            Recurring("Hubspot", "HUBSPOT", "monthly", 50, 100, OUT),
+            Recurring("GUSTO", "GUSTO", "biweekly", 2000, 5000, OUT),
+            Recurring("United Healthcare", "UNITED HEALTHCARE", "monthly", 5000, 7500, OUT),
+            Recurring("Hiscox", "HISCOX", "monthly", 200, 250, OUT),
+            Recurring("ATT", "ATT", "monthly", 300, 450, OUT, varies=True),
+            Recurring("Comcast", "COMCAST", "monthly", 100, 250, OUT),
+            Recurring("SBA Loan", "SBA LOAN PAYMENT", "monthly", 2500, 5000, OUT),
+            Recurring("IRS", "USATAXPYMT", "quarterly", 3000, 15000, OUT, varies=True),
+            Recurring("LinkedIn", "LINKEDIN", "quarterly", 200, 600, OUT),
+            Recurring("Stripe", "STRIPE TRANSFER", "weekly", 3000, 15000, IN, varies=True),
+        ],
+        [
+            Discretionary("Amazon", "AMAZON MKTPL", 9, 500, OUT, 3),
+            Discretionary("Staples", "STAPLES", 9, 300, OUT, 2),
+            Discretionary("American Airlines", "AMERICAN AIRLINES", 200, 500, OUT, 1),
+            Discretionary("Accounting Services", "ACCOUNTING SVCS", 500, 2500, OUT, 0.5),
+            Discretionary("Legal Services", "LEGAL SVCS", 500, 5000, OUT, 0.3),
+            Discretionary("Account Transfer", "ACCOUNT TRANSFER", 3000, 10000, OUT, 0.5),
+            Discretionary("Customer Payment", "ACH CREDIT", 500, 15000, IN, 2),
+        ],
+    ),
+    "savings": (
+        [
+            Recurring("Account Transfer", "ACCOUNT TRANSFER", "monthly", 3000, 10000, IN),
+            Recurring("Interest", "INTEREST PAYMENT", "monthly", 10, 100, IN, varies=True),
+        ],
+        [Discretionary("Account Transfer", "ACCOUNT TRANSFER", 3000, 10000, OUT)],
+    ),
+    "credit card": (
+        [Recurring("Credit Card Payment", "AUTOPAY PAYMENT", "monthly", 2000, 10000, IN, varies=True)],
+        [
+            Discretionary("AWS", "AMAZON WEB SERVICES", 50, 800, OUT, 2),
+            Discretionary("American Airlines", "AMERICAN AIRLINES", 200, 500, OUT, 2),
+            Discretionary("Staples", "STAPLES", 9, 300, OUT, 2),
+            Discretionary("Amazon", "AMAZON MKTPL", 9, 500, OUT, 3),
+            Discretionary("Local Restaurant", "RESTAURANT", 20, 300, OUT, 2),
+        ],
+    ),
+    "mortgage": (
+        [Recurring("Mortgage Payment", "LOAN PAYMENT", "monthly", 3000, 8000, IN)],
+        [Discretionary("Principal Prepayment", "LOAN PAYMENT", 1000, 5000, IN)],
+    ),
+    "401k": (
+        [Recurring("Payroll Contribution", "CONTRIBUTION", "biweekly", 500, 2000, IN)],
+        [Discretionary("Account Fee", "FEE", 9, 50, OUT)],
+    ),
+}
+
+FIRST_NAMES = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn", "Drew"]
+LAST_NAMES = ["Rivera", "Chen", "Patel", "Okafor", "Nguyen", "Larsen", "Moreau", "Silva", "Kowalski", "Haddad"]
+BUSINESS_NAMES = ["Blue Heron Labs LLC", "Northwind Analytics Inc", "Maple & Pine Studio LLC", "Copperline Logistics Inc"]
+ADDRESSES = [
+    {"city": "San Francisco", "region": "CA", "postal_code": "94107", "street": "2992 Cameron Road"},
+    {"city": "Austin", "region": "TX", "postal_code": "78701", "street": "418 Willow Creek Drive"},
+    {"city": "Denver", "region": "CO", "postal_code": "80202", "street": "77 Larimer Street"},
+    {"city": "Brooklyn", "region": "NY", "postal_code": "11201", "street": "156 Atlantic Avenue"},
+]
+BANK_NAMES = {
+    "checking": "Plaid Checking",
+    "savings": "Plaid Saving",
+    "credit card": "Plaid Credit Card",
+    "mortgage": "Plaid Mortgage",
+    "401k": "Plaid 401k",
+}
+
+_ALPHANUMERIC = string.ascii_uppercase + string.digits
+
+
+def _add_months(day: date, months: int) -> date:
+    """Shift a date by whole months, clamping the day to 28."""
+    month_index = day.month - 1 + months
+    return date(day.year + month_index // 12, month_index % 12 + 1, min(day.day, 28))
+
+
+def _posting_date(day: date, end: date) -> date:
+    """Move weekend postings to a business day, without posting in the future."""
+    weekday = day.weekday()
+    if weekday >= 5:
+        monday = day + timedelta(days=7 - weekday)
+        return monday if monday <= end else day - timedelta(days=weekday - 4)
+    return day
+
+
+def _recurring_dates(rng: random.Random, stream: Recurring, start: date, end: date) -> List[date]:
+    """List every occurrence of a recurring stream within the window."""
+    if stream.cadence in CADENCE_DAYS:
+        step = CADENCE_DAYS[stream.cadence]
+        first = start + timedelta(days=rng.randrange(step))
+        return [first + timedelta(days=offset) for offset in range(0, (end - first).days + 1, step)]
+
+    # Monthly and quarterly payments fall on the same day of the month
+    step = CADENCE_MONTHS[stream.cadence]
+    day = date(start.year, start.month, rng.randint(1, 28))
+    day = _add_months(day, rng.randrange(step))
+    dates = []
+    while day <= end:
+        if day >= start:
+            dates.append(day)
+        day = _add_months(day, step)
+    return dates
+
+
+def _describe(
+        rng: random.Random, business: bool, merchant: str, txn_type: str, count: int
+) -> List[str]:
+    """Build transaction descriptions in the template's personal or business format."""
+    # Draw the characters of every reference in one call, then slice them apart
+    if business:
+        chars = "".join(rng.choices(_ALPHANUMERIC, k=10 * count))
+        prefix = f"{txn_type}; {txn_type.split()[0]}:"
+        return [f"{prefix}{chars[i:i + 10]} Merchant name: {merchant}" for i in range(0, 10 * count, 10)]
+
+    vendor = merchant.upper().replace("'", "")
+    chars = "".join(rng.choices(string.ascii_uppercase, k=12 * count))
+    numeric_ids = [rng.randrange(10000, 99999) for _ in range(count)]
+    return [
+        f"{txn_type} {vendor} {numeric_id} {numeric_id:015d} {chars[12 * i:12 * i + 12]} Merchant name: {merchant}"
+        for i, numeric_id in enumerate(numeric_ids)
+    ]
+
+
+def generate_transactions(
+        rng: random.Random,
+        subtype: str,
+        num_transactions: int,
+        end: date,
+        months: int = 6,
+        business: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Generate the transactions of one account, newest first.
+
+    Recurring streams are laid out first; if they exceed num_transactions only
+    the most recent ones are kept. The remainder is filled with discretionary
+    transactions at random dates.
+
+    Args:
+        rng: Seeded random generator
+        subtype: Account subtype, one of ACCOUNT_TYPES
+        num_transactions: Number of transactions to generate
+        end: Date of the most recent transaction
+        months: Number of months of history
+        business: Whether to use business rather than personal patterns
+
+    Returns:
+        The transactions in override_accounts format
+    """
+    recurring, discretionary = (BUSINESS_PATTERNS if business else PERSONAL_PATTERNS)[subtype]
+    start = _add_months(end, -months)
+    span_days = (end - start).days + 1
+
+    # (date, amount, merchant, txn_type) rows
+    rows: List[Tuple[date, float, str, str]] = []
+    for stream in recurring:
+        dates = _recurring_dates(rng, stream, start, end)
+        if stream.varies:
+            amounts = [rng.uniform(stream.low, stream.high) for _ in dates]
+        else:
+            # Similar amounts each period: a small wobble around one base amount
+            base = rng.uniform(stream.low, stream.high)
+            amounts = [base * (1 + rng.uniform(-0.02, 0.02)) for _ in dates] if base > 100 else [base] * len(dates)
+        rows.extend(
+            (day, stream.direction * amount, stream.merchant, stream.txn_type)
+            for day, amount in zip(dates, amounts)
+        )
+
+    rows.sort(key=lambda row: row[0], reverse=True)
+    rows = rows[:num_transactions]
+
+    remaining = num_transactions - len(rows)
+    if remaining > 0:
+        streams = rng.choices(discretionary, weights=[d.weight for d in discretionary], k=remaining)
+        offsets = [rng.randrange(span_days) for _ in range(remaining)]
+        fractions = [rng.random() for _ in range(remaining)]
+        rows.extend(
+            (
+                start + timedelta(days=offset),
+                stream.direction * (stream.low + fraction * (stream.high - stream.low)),
+                stream.merchant,
+                stream.txn_type,
+            )
+            for stream, offset, fraction in zip(streams, offsets, fractions)
+        )
+
+    # Describe rows per merchant in batches, then restore chronological order
+    by_merchant: Dict[Tuple[str, str], List[int]] = {}
+    for index, (_, _, merchant, txn_type) in enumerate(rows):
+        by_merchant.setdefault((merchant, txn_type), []).append(index)
+    descriptions: List[str] = [""] * len(rows)
+    for (merchant, txn_type), indexes in by_merchant.items():
+        for index, description in zip(indexes, _describe(rng, business, merchant, txn_type, len(indexes))):
+            descriptions[index] = description
+
+    # Many rows share a date, so format each date once
+    dates: Dict[date, Tuple[str, str]] = {}
+    for day in {row[0] for row in rows}:
+        posted = _posting_date(day, end)
+        dates[day] = ((posted - timedelta(days=1)).isoformat(), posted.isoformat())
+
+    transactions = []
+    for (day, amount, _, _), description in zip(rows, descriptions):
+        transacted, posted = dates[day]
+        transactions.append({
+            "date_transacted": transacted,
+            "date_posted": posted,
+            "amount": round(amount, 2),
+            "description": description,
+            "currency": CURRENCY,
+        })
+    transactions.sort(key=lambda txn: txn["date_posted"], reverse=True)
+    return transactions
+
+
+def generate_override_accounts(
+        subtypes: Sequence[str] = ("checking", "savings", "credit card"),
+        num_transactions: int = 50,
+        business: bool = False,
+        months: int = 6,
+        seed: Optional[int] = None,
+        end: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    Generate a complete custom user configuration.
+
+    Args:
+        subtypes: Account subtypes to create, each one of ACCOUNT_TYPES
+        num_transactions: Number of transactions per account
+        business: Whether the accounts belong to a business rather than a person
+        months: Number of months of transaction history (3 to 6)
+        seed: Seed for reproducible output
+        end: Date of the most recent transactions, defaults to today
+
+    Returns:
+        A dictionary with an ``override_accounts`` list
+
+    Raises:
+        ValueError: If an account subtype is not supported
+    """
+    unknown = [subtype for subtype in subtypes if subtype not in ACCOUNT_TYPES]
+    if unknown:
+        raise ValueError(
+            f"Unsupported account subtypes: {', '.join(unknown)}. "
+            f"Supported: {', '.join(ACCOUNT_TYPES)}"
+        )
+
+    rng = random.Random(seed)
+    end = end or date.today()
+    months = min(6, max(3, months))
+
+    # Keep the identity consistent across all accounts
+    name = rng.choice(BUSINESS_NAMES) if business else f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    address = rng.choice(ADDRESSES)
+    identity = {
+        "names": [name],
+        "addresses": [{"primary": True, "data": {"country": "US", **address}}],
+    }
+
+    accounts = []
+    for subtype in subtypes:
+        accounts.append({
+            "type": ACCOUNT_TYPES[subtype],
+            "subtype": subtype,
+            "starting_balance": round(rng.uniform(1000, 50000 if business else 15000), 2),
+            "meta": {
+                "name": BANK_NAMES[subtype],
+                "official_name": f"{'Business' if business else 'Personal'} {BANK_NAMES[subtype]}",
+            },
+            "numbers": {
+                "account": str(rng.randrange(10 ** 9, 10 ** 12)),
+                "ach_routing": ACH_ROUTING,
+            },
+            "transactions": generate_transactions(
+                rng, subtype, num_transactions, end, months=months, business=business
+            ),
+            "identity": identity,
+        })
+
+    return {"override_accounts": accounts}
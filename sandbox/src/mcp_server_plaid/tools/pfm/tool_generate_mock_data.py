@@ -0,0 +1,175 @@
+"""
+Mock data generation tool for the Plaid MCP server.
+
+This module generates custom sandbox user data locally, instead of returning a
+prompt for the model to fill in transaction by transaction.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import mcp.types as types
+
+from mcp_server_plaid.clients.datasets import DatasetStore
+from mcp_server_plaid.storage import get_cache_dir
+from mcp_server_plaid.tools.pfm.mock_data import ACCOUNT_TYPES, generate_override_accounts
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+MAX_TRANSACTIONS_PER_ACCOUNT = 10000
+# Directory in the cache directory files are written to, unless --output-dir is set
+OUTPUT_DIRNAME = "mock_data"
+
+# Tool definition
+GENERATE_MOCK_DATA_TOOL = types.Tool(
+    name="generate_mock_data",
+    description="""Generate customized mock financial data (Plaid sandbox custom user `override_accounts` JSON) directly,
+    following the same rules as `get_mock_data_prompt`: recurring weekly, bi-weekly, monthly and quarterly patterns,
+    realistic amounts and descriptions, and Plaid's sign convention (positive amounts when money leaves the account).
+    Prefer this tool over `get_mock_data_prompt` unless the user asks for a bespoke story; it is much faster and scales
+    to thousands of transactions per account. Pass the same seed to get the same data again.
+    The result can be used as `customized_account_data` for `get_sandbox_access_token`. When written to a file, the
+    data is also registered as a dataset and its handle can be passed as `customized_account_data` instead.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "num_of_transactions": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": MAX_TRANSACTIONS_PER_ACCOUNT,
+                "description": f"Number of transactions per account (1 to {MAX_TRANSACTIONS_PER_ACCOUNT})",
+                "default": 50,
+            },
+            "accounts": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(ACCOUNT_TYPES)},
+                "description": "Account subtypes to create",
+                "default": ["checking", "savings", "credit card"],
+            },
+            "account_holder": {
+                "type": "string",
+                "enum": ["personal", "business"],
+                "description": "Whether the accounts belong to a person or a business",
+                "default": "personal",
+            },
+            "months": {
+                "type": "integer",
+                "description": "Months of transaction history, from 3 to 6",
+                "default": 6,
+            },
+            "seed": {
+                "type": "integer",
+                "description": "Seed for reproducible data; omit for a random dataset",
+            },
+            "output_path": {
+                "type": "string",
+                "description": """Optional file to write the JSON to, e.g. mock_data.json, relative to the server's
+                output directory. When set, only a summary with the file's full path is returned, which keeps large
+                datasets out of the conversation.""",
+            },
+            "overwrite": {
+                "type": "boolean",
+                "description": "Replace output_path if it already exists",
+                "default": False,
+            },
+        },
+        "required": [],
+    },
+)
+
+
+def resolve_output_path(output_path: str, output_dir: Path) -> Path:
+    """
+    Resolve a requested output file inside the output directory.
+
+    Args:
+        output_path: The file requested by the caller
+        output_dir: Directory files may be written to
+
+    Returns:
+        The file's absolute path
+
+    Raises:
+        ValueError: If the path is absolute or leaves the output directory
+    """
+    requested = Path(output_path)
+    if requested.is_absolute() or output_path.startswith("~") or ".." in requested.parts:
+        raise ValueError(
+            f"output_path must be a relative path inside the output directory {output_dir}, "
+            f"without '..', e.g. mock_data.json."
+        )
+    root = output_dir.resolve()
+    path = (root / requested).resolve()
+    # Symlinks inside the output directory must not lead out of it
+    if path == root or not path.is_relative_to(root):
+        raise ValueError(f"output_path must name a file inside the output directory {output_dir}.")
+    return path
+
+
+def _generate(arguments: Dict[str, Any], num_of_transactions: int) -> Tuple[Dict[str, Any], str]:
+    """Generate the data and its minified JSON."""
+    data = generate_override_accounts(
+        subtypes=arguments.get("accounts") or ["checking", "savings", "credit card"],
+        num_transactions=num_of_transactions,
+        business=arguments.get("account_holder") == "business",
+        months=int(arguments.get("months") or 6),
+        seed=arguments.get("seed"),
+    )
+    return data, json.dumps(data, separators=(",", ":"))
+
+
+async def handle_generate_mock_data(
+        arguments: Dict[str, Any],
+        *,
+        dataset_store: Optional[DatasetStore] = None,
+        output_dir: Optional[Path] = None,
+        **_,
+) -> List[types.TextContent]:
+    """
+    Handle requests to generate mock data.
+
+    Args:
+        arguments: Dictionary of arguments from the tool call
+        dataset_store: Store the data is registered in when written to a file
+        output_dir: Directory files are written to, defaults to mock_data in the cache directory
+
+    Returns:
+        List containing the generated JSON, or a summary when written to a file
+    """
+    num_of_transactions = int(arguments.get("num_of_transactions") or 50)
+    if not 1 <= num_of_transactions <= MAX_TRANSACTIONS_PER_ACCOUNT:
+        raise ToolError(f"num_of_transactions must be between 1 and {MAX_TRANSACTIONS_PER_ACCOUNT}.")
+
+    try:
+        # Large datasets take most of a second to build, which would stall every other session
+        data, payload = await asyncio.to_thread(_generate, arguments, num_of_transactions)
+    except ValueError as e:
+        raise ToolError(str(e)) from None
+
+    output_path = arguments.get("output_path")
+    if not output_path:
+        return [types.TextContent(type="text", text=payload)]
+
+    try:
+        path = resolve_output_path(output_path, output_dir or get_cache_dir() / OUTPUT_DIRNAME)
+    except ValueError as e:
+        raise ToolError(str(e)) from None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with path.open("w" if arguments.get("overwrite") else "x", encoding="utf-8") as f:
+            f.write(payload)
+    except FileExistsError:
+        raise ToolError(f"{path} already exists. Pick another output_path, or set overwrite to replace it.") from None
+    total = sum(len(account["transactions"]) for account in data["override_accounts"])
+    text = (
+        f"Wrote {len(data['override_accounts'])} accounts with {total} transactions "
+        f"to {path} ({len(payload)} bytes)."
+    )
+    if dataset_store is not None:
+        text += f" Dataset handle: {await asyncio.to_thread(dataset_store.register, payload)}"
+    return [types.TextContent(type="text", text=text)]
+
+
+# Register the tool with the registry
+registry.register(GENERATE_MOCK_DATA_TOOL, handle_generate_mock_data)
@@ -0,0 +1,63 @@
+"""
+Webhook lookup tool for the Plaid MCP server.
+
+This module implements a local lookup of the webhook codes and types the
+sandbox can fire, so agents don't need a documentation search before
+simulating a webhook.
+"""
+
+from typing import Any, Dict, List
+
+import mcp.types as types
+
+from mcp_server_plaid.tools.pfm.webhook_catalog import find_webhooks, webhook_types
+from mcp_server_plaid.tools.registry import registry
+
+# Tool definition
+LOOKUP_WEBHOOKS_TOOL = types.Tool(
+    name="lookup_webhooks",
+    description="""Look up the webhook_code and webhook_type pairs that `simulate_webhook` can fire in the sandbox,
+    with what each webhook signals. This lookup is instant and works offline; use it to pick the webhook_code and
+    webhook_type for `simulate_webhook` instead of searching the documentation.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "optional keywords, e.g. 'sync' or 'new accounts'; omit to list every webhook",
+                "default": "",
+            },
+            "webhook_type": {
+                "type": "string",
+                "description": "optional webhook type to filter by, e.g. 'TRANSACTIONS' or 'ITEM'",
+                "default": "",
+            },
+        },
+    },
+)
+
+
+# Tool handler
+async def handle_lookup_webhooks(
+        arguments: Dict[str, Any], **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    results = find_webhooks(arguments.get("query") or "", arguments.get("webhook_type") or "")
+    if not results:
+        return [
+            types.TextContent(
+                type="text",
+                text=f"No matching webhooks. Webhook types: {', '.join(webhook_types())}. "
+                     "Call lookup_webhooks without arguments to list every webhook.",
+            )
+        ]
+
+    lines = ["| webhook_code | webhook_type | description |", "|---|---|---|"]
+    for event in results:
+        lines.append(
+            f"| {event.webhook_code} | {' or '.join(event.webhook_types) or 'any'} | {event.description} |"
+        )
+    return [types.TextContent(type="text", text="\n".join(lines))]
+
+
+# Register the tool with the registry
+registry.register(LOOKUP_WEBHOOKS_TOOL, handle_lookup_webhooks)
@@ -4,15 +4,23 @@ Webhook simulation tools for the Plaid MCP server.
 This module implements tools related to simulating webhooks in the Plaid sandbox environment.
 """
 
+import asyncio
 from typing import Any, Dict, List
 
 import mcp.types as types
 import plaid
-from plaid.api import plaid_api
 from plaid.model.sandbox_item_fire_webhook_request import SandboxItemFireWebhookRequest
 from plaid.model.webhook_type import WebhookType
 
-from mcp_server_plaid.tools.registry import registry
+from mcp_server_plaid.clients.plaid_async import PlaidClient
+from mcp_server_plaid.tools.limits import RateLimiter
+from mcp_server_plaid.tools.pfm.webhook_catalog import validate_webhook
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+# Bounds for bulk mode, which keep a single call from flooding the sandbox
+MAX_BULK_WEBHOOKS = 200
+MAX_BULK_CONCURRENCY = 10
+DEFAULT_BULK_RATE = 10.0
 
 # Tool definition
 SIMULATE_WEBHOOK_TOOL = types.Tool(
@@ -20,8 +28,10 @@ SIMULATE_WEBHOOK_TOOL = types.Tool(
     description="""Simulate a Plaid webhook event in the sandbox environment to test your application's webhook handling. 
     This tool triggers specific webhook events like transaction updates, account status changes, or transfer notifications. 
     Specify the access_token for the item and the webhook_code representing the event type you want to trigger. 
+    To fire many webhooks at once, for example every relevant webhook_code across several items, pass them in
+    `webhooks` instead; they are fired concurrently under a rate limit and the results are returned as a table.
     <important>
-    - Unless user specifies the webhook_code and webhook_type, you MUST use the tool `search_documentation` to find the right
+    - Unless user specifies the webhook_code and webhook_type, you MUST use the tool `lookup_webhooks` to find the right
       webhook_code and webhook_type.
     </important>""",
     inputSchema={
@@ -36,75 +46,181 @@ SIMULATE_WEBHOOK_TOOL = types.Tool(
             "webhook_code": {
                 "type": "string",
                 "description": """The specific webhook event code to simulate (e.g., 'DEFAULT_UPDATE', 'SYNC_UPDATES_AVAILABLE', 
-                'TRANSACTIONS_REMOVED'). Common codes include 'DEFAULT_UPDATE' for new transactions, 'HISTORICAL_UPDATE' for 
-                initial transaction fetch, and 'USER_PERMISSION_REVOKED' for revoked access. You can use the 'ask_bill' tool to 
-                find appropriate values.""",
+                'NEW_ACCOUNTS_AVAILABLE'). Common codes include 'SYNC_UPDATES_AVAILABLE' for new transactions, 
+                'NEW_ACCOUNTS_AVAILABLE' for accounts the user has not shared yet, and 'PENDING_DISCONNECT' for expiring
+                access. Use the 'lookup_webhooks' tool to list every code the sandbox can fire.""",
             },
             "webhook_type": {
                 "type": "string",
                 "description": """The category of webhook to fire (e.g., 'TRANSACTIONS', 'ITEM', 'AUTH'). Must be compatible 
-                with the webhook_code. For example, 'DEFAULT_UPDATE' requires 'TRANSACTIONS' type. You can use the 'ask_bill' tool 
-                to find appropriate values.""",
+                with the webhook_code. For example, 'SYNC_UPDATES_AVAILABLE' requires 'TRANSACTIONS' type. You can use the
+                'lookup_webhooks' tool to find appropriate values.""",
                 "default": "",
             },
+            "webhooks": {
+                "type": "array",
+                "maxItems": MAX_BULK_WEBHOOKS,
+                "description": f"""Bulk mode: a list of webhooks to fire (at most {MAX_BULK_WEBHOOKS}). Entries
+                without an access_token use the top-level access_token.""",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "access_token": {"type": "string"},
+                        "webhook_type": {"type": "string"},
+                        "webhook_code": {"type": "string"},
+                    },
+                    "required": ["webhook_code"],
+                },
+            },
+            "rate_per_second": {
+                "type": "number",
+                "description": "Bulk mode: maximum number of webhooks fired per second",
+                "default": DEFAULT_BULK_RATE,
+            },
         },
-        "required": ["access_token", "webhook_code"],
+        "required": [],
     },
 )
 
 
-# Tool handler
-async def handle_simulate_webhook(
-        arguments: Dict[str, Any], *, plaid_client: plaid_api.PlaidApi, **_
-) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """Handle the simulate_webhook tool request.
-
-    Args:
-        arguments: The tool arguments containing access_token, webhook_code, and optional webhook_type
-        plaid_client: The Plaid API client
+async def _fire_webhook(
+        plaid_client: PlaidClient, access_token: str, webhook_code: str, webhook_type: str = ""
+) -> Dict[str, Any]:
+    """
+    Fire one sandbox webhook.
 
     Returns:
-        A list of content elements with the webhook simulation result
+        Dictionary with webhook_fired and status_code on success, or error
+        (and status_code when Plaid returned one) on failure
     """
-    access_token = arguments["access_token"]
-    webhook_code = arguments["webhook_code"]
-    webhook_type = arguments.get("webhook_type", "")
-
     try:
         # Build the webhook request
         webhook_request = SandboxItemFireWebhookRequest(
             access_token=access_token,
-            webhook_code=webhook_code,
+            webhook_code=webhook_code.upper(),
         )
 
         # Only set webhook_type if provided
         if webhook_type:
-            webhook_request.webhook_type = WebhookType(webhook_type)
+            webhook_request.webhook_type = WebhookType(webhook_type.upper())
 
         # Fire the webhook
-        response = plaid_client.sandbox_item_fire_webhook(webhook_request)
+        response = await plaid_client.sandbox_item_fire_webhook(webhook_request)
 
         # Extract response data
-        webhook_fired = response.get("webhook_fired", False)
-        status_code = response.get("status_code")
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Webhook fired: {webhook_fired}, Status code: {status_code}",
-            )
-        ]
+        return {
+            "webhook_fired": response.get("webhook_fired", False),
+            "status_code": response.get("status_code"),
+        }
     except plaid.ApiException as e:
         # Enhanced error handling with more details
-        error_msg = f"Error simulating webhook: {str(e)}"
-        status_code = getattr(e, "status", None)
-        if status_code:
-            error_msg += f" (Status code: {status_code})"
-        return [types.TextContent(type="text", text=error_msg)]
+        return {
+            "error": f"Error simulating webhook: {str(e)}",
+            "status_code": getattr(e, "status", None),
+        }
     except Exception as e:
         # Catch any other unexpected errors
-        return [types.TextContent(type="text", text=f"Unexpected error: {str(e)}")]
+        return {"error": f"Unexpected error: {str(e)}"}
+
+
+async def _fire_webhooks_bulk(
+        arguments: Dict[str, Any], plaid_client: PlaidClient
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Fire a list of webhooks concurrently under a rate limit."""
+    default_token = arguments.get("access_token", "")
+    entries = arguments["webhooks"]
+    if len(entries) > MAX_BULK_WEBHOOKS:
+        raise ToolError(f"Too many webhooks requested ({len(entries)}); at most {MAX_BULK_WEBHOOKS} per call.")
+
+    rate = float(arguments.get("rate_per_second") or DEFAULT_BULK_RATE)
+    rate_limiter = RateLimiter(rate=max(rate, 0.1), burst=MAX_BULK_CONCURRENCY)
+    semaphore = asyncio.Semaphore(MAX_BULK_CONCURRENCY)
+
+    async def fire(entry: Dict[str, Any]) -> Dict[str, Any]:
+        access_token = entry.get("access_token") or default_token
+        if not access_token or not entry.get("webhook_code"):
+            return {"error": "access_token and webhook_code are required"}
+        # Invalid entries fail here, without waiting for a rate limit slot
+        invalid = validate_webhook(entry["webhook_code"], entry.get("webhook_type", ""))
+        if invalid:
+            return {"error": invalid}
+        async with semaphore:
+            await rate_limiter.acquire()
+            return await _fire_webhook(
+                plaid_client, access_token, entry["webhook_code"], entry.get("webhook_type", "")
+            )
+
+    results = await asyncio.gather(*(fire(entry) for entry in entries))
+
+    lines = [
+        "| # | access_token | webhook_type | webhook_code | fired | status | error |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for number, (entry, result) in enumerate(zip(entries, results), start=1):
+        access_token = entry.get("access_token") or default_token
+        cells = [
+            number,
+            f"...{access_token[-8:]}" if access_token else "",
+            entry.get("webhook_type", ""),
+            entry.get("webhook_code", ""),
+            result.get("webhook_fired", False),
+            result.get("status_code") or "",
+            str(result.get("error", "")).replace("\n", " ").replace("|", "\\|"),
+        ]
+        lines.append("| " + " | ".join(str(cell) for cell in cells) + " |")
+
+    fired = sum(1 for result in results if result.get("webhook_fired"))
+    summary = f"Fired {fired} of {len(results)} webhooks."
+    text = summary + "\n\n" + "\n".join(lines)
+    if not any("webhook_fired" in result for result in results):
+        raise ToolError(text)
+    return [types.TextContent(type="text", text=text)]
+
+
+# Tool handler
+async def handle_simulate_webhook(
+        arguments: Dict[str, Any], *, plaid_client: PlaidClient, **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Handle the simulate_webhook tool request.
+
+    Args:
+        arguments: The tool arguments containing access_token, webhook_code, and optional webhook_type,
+            or a list of webhooks for bulk mode
+        plaid_client: The async Plaid API client
+
+    Returns:
+        A list of content elements with the webhook simulation result
+
+    Raises:
+        ToolError: If the arguments are invalid or no webhook could be fired
+    """
+    if arguments.get("webhooks"):
+        return await _fire_webhooks_bulk(arguments, plaid_client)
+
+    access_token = arguments.get("access_token")
+    webhook_code = arguments.get("webhook_code")
+    webhook_type = arguments.get("webhook_type", "")
+    if not access_token or not webhook_code:
+        raise ToolError("Either access_token and webhook_code, or a list of webhooks, is required.")
+
+    invalid = validate_webhook(webhook_code, webhook_type)
+    if invalid:
+        raise ToolError(invalid)
+
+    result = await _fire_webhook(plaid_client, access_token, webhook_code, webhook_type)
+    if "error" in result:
+        error_msg = result["error"]
+        if result.get("status_code"):
+            error_msg += f" (Status code: {result['status_code']})"
+        raise ToolError(error_msg)
+
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Webhook fired: {result['webhook_fired']}, Status code: {result['status_code']}",
+        )
+    ]
 
 
 # Register the tool with the registry
-registry.register(SIMULATE_WEBHOOK_TOOL, handle_simulate_webhook)
+registry.register(SIMULATE_WEBHOOK_TOOL, handle_simulate_webhook, max_concurrency=8)
@@ -0,0 +1,146 @@
+"""
+Catalog of the webhooks the Plaid sandbox can fire.
+
+This module lists the webhook codes accepted by /sandbox/item/fire_webhook and
+the webhook types each of them is fired with, so agents can pick a valid pair
+and invalid pairs are rejected locally instead of after a Plaid round trip.
+
+The codes and types come from the plaid-python models, so the catalog follows
+the installed SDK. Which types go with which code is not part of the SDK and
+is curated below; codes the curation does not cover are accepted with any
+type and left for Plaid to check.
+"""
+
+import difflib
+import functools
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from plaid.model.sandbox_item_fire_webhook_request import SandboxItemFireWebhookRequest
+from plaid.model.webhook_type import WebhookType
+
+# webhook_code -> (webhook types it is fired with, what it signals)
+CURATED_WEBHOOKS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    "DEFAULT_UPDATE": (
+        ("TRANSACTIONS", "AUTH", "HOLDINGS", "INVESTMENTS_TRANSACTIONS", "LIABILITIES"),
+        "New data is available for the product, e.g. new transactions, holdings or liabilities",
+    ),
+    "SYNC_UPDATES_AVAILABLE": (
+        ("TRANSACTIONS",),
+        "New transaction updates are ready to fetch with /transactions/sync",
+    ),
+    "RECURRING_TRANSACTIONS_UPDATE": (
+        ("TRANSACTIONS",),
+        "Recurring transaction streams were updated; refetch /transactions/recurring/get",
+    ),
+    "SMS_MICRODEPOSITS_VERIFICATION": (
+        ("AUTH",),
+        "The user verified, or failed to verify, text message-based microdeposits",
+    ),
+    "NEW_ACCOUNTS_AVAILABLE": (
+        ("ITEM",),
+        "The institution has accounts the user has not shared yet; send them through update mode",
+    ),
+    "PENDING_DISCONNECT": (
+        ("ITEM",),
+        "The Item will soon stop working, e.g. because consent is expiring",
+    ),
+    "LOGIN_REPAIRED": (
+        ("ITEM",),
+        "An Item in an error state is healthy again without going through update mode",
+    ),
+    "ERROR": (
+        ("ITEM", "ASSETS"),
+        "The Item entered an error state, or an Asset Report failed to generate",
+    ),
+    "PRODUCT_READY": (
+        ("ASSETS",),
+        "An Asset Report finished generating and can be retrieved",
+    ),
+}
+
+
+class WebhookEvent(NamedTuple):
+    """A webhook code the sandbox can fire."""
+
+    webhook_code: str
+    # Types the code is fired with, empty when not known
+    webhook_types: Tuple[str, ...]
+    description: str
+
+
+@functools.lru_cache(maxsize=1)
+def webhook_types() -> Tuple[str, ...]:
+    """Get the webhook types accepted by the installed SDK."""
+    return tuple(sorted(WebhookType.allowed_values[("value",)].values()))
+
+
+@functools.lru_cache(maxsize=1)
+def get_catalog() -> Dict[str, WebhookEvent]:
+    """
+    Get the webhooks the sandbox can fire, keyed by webhook code.
+
+    Returns:
+        The SDK's webhook codes, with their curated types and descriptions
+    """
+    known_types = set(webhook_types())
+    catalog = {}
+    for code in sorted(SandboxItemFireWebhookRequest.allowed_values[("webhook_code",)].values()):
+        types, description = CURATED_WEBHOOKS.get(code, ((), "Fire it without a webhook_type, or check the docs"))
+        catalog[code] = WebhookEvent(code, tuple(t for t in types if t in known_types), description)
+    return catalog
+
+
+def validate_webhook(webhook_code: str, webhook_type: str = "") -> Optional[str]:
+    """
+    Check a webhook code and type against the catalog.
+
+    Args:
+        webhook_code: The webhook code to fire
+        webhook_type: The webhook type, or empty to let Plaid pick it
+
+    Returns:
+        An error message, or None if the webhook can be fired
+    """
+    catalog = get_catalog()
+    event = catalog.get(webhook_code.upper())
+    if event is None:
+        close = difflib.get_close_matches(webhook_code.upper(), catalog, n=1)
+        hint = f" Did you mean {close[0]}?" if close else ""
+        return (
+            f"Unknown webhook_code {webhook_code}.{hint} The sandbox can fire: {', '.join(catalog)}. "
+            "Use the lookup_webhooks tool to find the right one."
+        )
+
+    if not webhook_type:
+        return None
+    if webhook_type.upper() not in webhook_types():
+        return f"Unknown webhook_type {webhook_type}. Valid types: {', '.join(webhook_types())}."
+    if event.webhook_types and webhook_type.upper() not in event.webhook_types:
+        return (
+            f"webhook_code {event.webhook_code} is fired with webhook_type "
+            f"{' or '.join(event.webhook_types)}, not {webhook_type}."
+        )
+    return None
+
+
+def find_webhooks(query: str = "", webhook_type: str = "") -> List[WebhookEvent]:
+    """
+    Search the catalog.
+
+    Args:
+        query: Words that must all appear in the code or description, ignoring case
+        webhook_type: Only return codes fired with this type
+
+    Returns:
+        The matching webhooks, in code order
+    """
+    words = query.lower().replace("_", " ").split()
+    webhook_type = webhook_type.upper()
+    results = []
+    for event in get_catalog().values():
+        if webhook_type and event.webhook_types and webhook_type not in event.webhook_types:
+            continue
+        text = f"{event.webhook_code.replace('_', ' ')} {event.description}".lower()
+        if all(word in text for word in words):
+            results.append(event)
+    return results
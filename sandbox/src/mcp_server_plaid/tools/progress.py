@@ -0,0 +1,78 @@
+"""
+Progress notifications for tool calls.
+
+This module lets long-running tools push partial results to the client while
+the call is still running, as MCP progress notifications tied to the progress
+token the client attached to the request. Clients that did not ask for
+progress get no notifications, and the tool result is unaffected either way.
+"""
+
+import logging
+from typing import Any, Optional
+
+import mcp.types as types
+
+logger = logging.getLogger("plaid-mcp-server.progress")
+
+
+class ProgressReporter:
+    """Sends progress notifications for a single tool call."""
+
+    def __init__(self, session: Any, progress_token: str | int):
+        """
+        Initialize the reporter.
+
+        Args:
+            session: The MCP server session the call arrived on
+            progress_token: The progress token from the request metadata
+        """
+        self.session = session
+        self.progress_token = progress_token
+        self.progress = 0.0
+
+    @classmethod
+    def from_request_context(cls, server: Any) -> Optional["ProgressReporter"]:
+        """
+        Create a reporter for the request being handled, if the client asked for progress.
+
+        Args:
+            server: The MCP server handling the request
+
+        Returns:
+            A reporter, or None outside a request or when no progress token was sent
+        """
+        try:
+            context = server.request_context
+        except LookupError:
+            return None
+        meta = getattr(context, "meta", None)
+        token = getattr(meta, "progressToken", None)
+        if not isinstance(token, (str, int)):
+            return None
+        return cls(context.session, token)
+
+    async def report(self, message: str, total: Optional[float] = None) -> None:
+        """
+        Send the next progress notification.
+
+        Progress advances by one per notification. A failure to deliver a
+        notification is logged and otherwise ignored, so it never fails the call.
+
+        Args:
+            message: Human-readable partial result
+            total: Expected final progress value, if known
+        """
+        self.progress += 1
+        notification = types.ProgressNotification(
+            method="notifications/progress",
+            params=types.ProgressNotificationParams(
+                progressToken=self.progress_token,
+                progress=self.progress,
+                total=total,
+                message=message,
+            ),
+        )
+        try:
+            await self.session.send_notification(types.ServerNotification(notification))
+        except Exception as e:
+            logger.debug(f"Dropping progress notification: {e}")
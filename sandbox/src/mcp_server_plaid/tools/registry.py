@@ -5,16 +5,35 @@ This module provides a registry system for MCP tools, allowing them to be
 registered from various modules and retrieved for use by the MCP server.
 """
 
+import hashlib
 import importlib
+import importlib.metadata
+import json
 import logging
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Set
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple
 
 import mcp.types as types
 
+from mcp_server_plaid.storage import get_cache_dir
+from mcp_server_plaid.tools.validation import InvalidArgumentsError, compile_schema
+
 logger = logging.getLogger("plaid-mcp-server.tools")
 
+MANIFEST_VERSION = 3
+MANIFEST_FILENAME = "tool_manifest.json"
+
+
+class ToolError(Exception):
+    """
+    Raised by a tool handler when the call failed.
+
+    The message is returned to the client as an error result (``isError``),
+    and the call is counted in ``mcp_tool_errors_total``.
+    """
+
 
 class ToolHandler(Protocol):
     """Protocol for tool handler functions."""
@@ -31,6 +50,9 @@ class ToolHandler(Protocol):
 
         Returns:
             A list of MCP content objects as the tool's response
+
+        Raises:
+            ToolError: If the call failed, e.g. Plaid rejected the request
         """
         ...
 
@@ -61,23 +83,85 @@ class ToolRegistry:
         if not getattr(self, "_initialized", False):
             self._tools: Dict[str, types.Tool] = {}
             self._handlers: Dict[str, ToolHandler] = {}
+            self._concurrency_limits: Dict[str, int] = {}
+            # Argument validators compiled from the tools' input schemas
+            self._validators: Dict[str, Callable[[Any], List[Tuple[str, str]]]] = {}
+            # Tools known from the manifest whose module has not been imported yet
+            self._lazy_handlers: Dict[str, Dict[str, str]] = {}
             self._initialized = True
 
-    def register(self, tool: types.Tool, handler: ToolHandler) -> None:
+    def register(
+            self, tool: types.Tool, handler: ToolHandler, max_concurrency: Optional[int] = None
+    ) -> None:
         """
         Register a tool and its handler.
 
         Args:
             tool: The tool definition
             handler: The function that handles calls to this tool
+            max_concurrency: Maximum number of calls to this tool running at once,
+                or None for no limit
         """
-        if tool.name in self._tools:
+        if self._lazy_handlers.pop(tool.name, None) is None and tool.name in self._tools:
             logger.warning(f"Tool {tool.name} already registered, overwriting")
 
         self._tools[tool.name] = tool
         self._handlers[tool.name] = handler
+        self._set_concurrency_limit(tool.name, max_concurrency)
+        self._validators[tool.name] = compile_schema(tool.inputSchema)
         logger.info(f"Registered tool: {tool.name}")
 
+    def _set_concurrency_limit(self, name: str, max_concurrency: Optional[int]) -> None:
+        if max_concurrency is None:
+            self._concurrency_limits.pop(name, None)
+        else:
+            self._concurrency_limits[name] = max_concurrency
+
+    def register_lazy(
+            self,
+            tool: types.Tool,
+            module_name: str,
+            handler_name: str,
+            max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Register a tool whose handler is imported on first use.
+
+        The tool definition is served immediately, while the module defining
+        the handler is only imported the first time the handler is requested.
+
+        Args:
+            tool: The tool definition
+            module_name: Import path of the module defining the handler
+            handler_name: Name of the handler function in that module
+            max_concurrency: Maximum number of calls to this tool running at once,
+                or None for no limit
+        """
+        self._tools[tool.name] = tool
+        self._handlers.pop(tool.name, None)
+        self._set_concurrency_limit(tool.name, max_concurrency)
+        # The schema comes from the manifest, so calls are validated before the module is imported
+        self._validators[tool.name] = compile_schema(tool.inputSchema)
+        self._lazy_handlers[tool.name] = {"module": module_name, "handler": handler_name}
+        logger.info(f"Registered tool from manifest: {tool.name}")
+
+    def _load_lazy_handler(self, name: str) -> Optional[ToolHandler]:
+        """Import the module of a lazily registered tool and return its handler."""
+        entry = self._lazy_handlers.get(name)
+        if entry is None:
+            return None
+
+        module = importlib.import_module(entry["module"])
+        logger.info(f"Imported tool module on first use: {entry['module']}")
+        if name not in self._handlers:
+            # The module was imported before, so it did not register itself again
+            handler = getattr(module, entry["handler"], None)
+            if handler is None:
+                return None
+            self._handlers[name] = handler
+        self._lazy_handlers.pop(name, None)
+        return self._handlers[name]
+
     def get_tools(self) -> List[types.Tool]:
         """
         Get all registered tools.
@@ -97,7 +181,40 @@ class ToolRegistry:
         Returns:
             The handler function, or None if the tool is not registered
         """
-        return self._handlers.get(name)
+        handler = self._handlers.get(name)
+        if handler is None and name in self._lazy_handlers:
+            handler = self._load_lazy_handler(name)
+        return handler
+
+    def get_concurrency_limit(self, name: str) -> Optional[int]:
+        """
+        Get the concurrency limit declared for a tool.
+
+        Args:
+            name: The name of the tool
+
+        Returns:
+            The maximum number of concurrent calls, or None if unlimited
+        """
+        return self._concurrency_limits.get(name)
+
+    def validate_arguments(self, name: str, arguments: Dict[str, Any]) -> None:
+        """
+        Check a tool's arguments against its input schema.
+
+        Args:
+            name: The name of the tool
+            arguments: The arguments passed to the tool
+
+        Raises:
+            InvalidArgumentsError: If the arguments do not match the schema
+        """
+        validator = self._validators.get(name)
+        if validator is None:
+            return
+        errors = validator(arguments)
+        if errors:
+            raise InvalidArgumentsError(name, errors)
 
     def has_tool(self, name: str) -> bool:
         """
@@ -119,6 +236,9 @@ class ToolRegistry:
         """
         self._tools = {}
         self._handlers = {}
+        self._concurrency_limits = {}
+        self._validators = {}
+        self._lazy_handlers = {}
         logger.info("Registry has been reset")
 
 
@@ -154,6 +274,25 @@ def get_enabled_categories(enabled_categories_str: str) -> Set[str]:
     return parsed_categories
 
 
+def get_tool_category(tool_path: Path) -> str:
+    """
+    Get the category of a tool from its path.
+
+    For tools directly in the tools directory, the category is "root".
+    For tools in subdirectories, the category is the directory name.
+
+    Args:
+        tool_path: Path to the tool file
+
+    Returns:
+        The tool's category name
+    """
+    parts = tool_path.relative_to(Path(__file__).parent).parts
+    if len(parts) <= 1:  # Tool is in the root tools directory
+        return "root"
+    return parts[0]  # Tool is in a subdirectory
+
+
 def is_tool_enabled(tool_path: Path, enabled_categories: Set[str]) -> bool:
     """
     Determine if a tool should be enabled based on its path and enabled categories.
@@ -169,28 +308,154 @@ def is_tool_enabled(tool_path: Path, enabled_categories: Set[str]) -> bool:
     if not enabled_categories:
         return True
 
-    # Get the tool's category from its path
-    # For tools directly in the tools directory, the category is "root"
-    # For tools in subdirectories, the category is the directory name
-    parts = tool_path.relative_to(Path(__file__).parent).parts
-    if len(parts) <= 1:  # Tool is in the root tools directory
-        category = "root"
-    else:
-        category = parts[0]  # Tool is in a subdirectory
+    return get_tool_category(tool_path).lower() in enabled_categories
+
+
+def _file_fingerprint(path: Path) -> str:
+    """Fingerprint a tool file by modification time and size."""
+    try:
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    except (OSError, TypeError):
+        return ""
+
+
+def _distribution_version(name: str) -> str:
+    """Get the installed version of a distribution, or an empty string."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def environment_fingerprint(package_dir: Path) -> str:
+    """
+    Fingerprint everything tool schemas are built from besides the tool files.
+
+    Tool modules build their schemas at import time from helper modules, such
+    as the products pattern and the webhook catalog, and from plaid-python's
+    allowed values. A change to any of these invalidates the whole manifest.
+
+    Args:
+        package_dir: The mcp_server_plaid package directory
+
+    Returns:
+        A digest of the package, plaid-python and mcp versions and of every
+        non-tool module's fingerprint
+    """
+    import plaid
+
+    parts = [
+        f"mcp-server-plaid={_distribution_version('mcp-server-plaid')}",
+        f"plaid-python={plaid.__version__}",
+        f"mcp={_distribution_version('mcp')}",
+    ]
+    for path in sorted(package_dir.rglob("*.py")):
+        relative = path.relative_to(package_dir)
+        if path.name.startswith("tool_") or relative.parts[0] == "test":
+            continue
+        parts.append(f"{relative.as_posix()}={_file_fingerprint(path)}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_manifest(manifest_path: Path, environment: str = "") -> Dict[str, Any]:
+    """
+    Load the persisted tool manifest.
+
+    Args:
+        manifest_path: Path to the manifest file
+        environment: The current environment_fingerprint
 
-    return category.lower() in enabled_categories
+    Returns:
+        Mapping of module name to its manifest entry, empty if the manifest is
+        missing, unreadable, from another manifest version or written in
+        another environment
+    """
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION or data.get("environment") != environment:
+        return {}
+    return data.get("modules", {})
 
 
-def register_all_tools(enabled_categories: str) -> ToolRegistry:
+def save_manifest(manifest_path: Path, modules: Dict[str, Any], environment: str = "") -> None:
+    """
+    Persist the tool manifest.
+
+    Args:
+        manifest_path: Path to the manifest file
+        modules: Mapping of module name to its manifest entry
+        environment: The environment_fingerprint the entries were built in
+    """
+    data = {"version": MANIFEST_VERSION, "environment": environment, "modules": modules}
+    try:
+        tmp_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(manifest_path)
+    except OSError as e:
+        logger.warning(f"Unable to write tool manifest {manifest_path}: {e}")
+
+
+def _module_tool_names(registry_instance: ToolRegistry, module_name: str) -> List[str]:
+    """Get the names of registered tools whose handler is defined in a module."""
+    return [
+        name for name, handler in registry_instance._handlers.items()
+        if getattr(handler, "__module__", None) == module_name
+    ]
+
+
+def _import_tool_module(registry_instance: ToolRegistry, module_name: str) -> None:
+    """Import a tool module so that it registers its tools."""
+    already_imported = module_name in sys.modules
+    module = importlib.import_module(module_name)
+    if already_imported and not _module_tool_names(registry_instance, module_name):
+        # The registry was reset since the module was first imported, so run
+        # the module's registration code again
+        importlib.reload(module)
+
+
+def _manifest_entry(
+        registry_instance: ToolRegistry, module_name: str, category: str, fingerprint: str
+) -> Optional[Dict[str, Any]]:
+    """Describe the tools a freshly imported module registered."""
+    tools = [
+        {
+            "tool": registry_instance._tools[name].model_dump(mode="json", exclude_none=True),
+            "handler": registry_instance._handlers[name].__name__,
+            "max_concurrency": registry_instance.get_concurrency_limit(name),
+        }
+        for name in _module_tool_names(registry_instance, module_name)
+    ]
+    if not tools:
+        return None
+    return {"fingerprint": fingerprint, "category": category, "tools": tools}
+
+
+def register_all_tools(
+        enabled_categories: str,
+        use_manifest: bool = True,
+        manifest_path: Optional[Path] = None,
+) -> ToolRegistry:
     """
     Register all available tools from the tools directory.
 
-    This function discovers and imports all tool modules in the tools
-    directory and its subdirectories, which will register their tools with the registry.
+    This function discovers all tool modules in the tools directory and its
+    subdirectories. Tools of modules that are unchanged since the last run are
+    registered from the persisted manifest, and their module is only imported
+    on the first call. The manifest is only used when the helper modules and
+    the package, plaid-python and mcp versions are unchanged as well. Other modules are imported, which registers their tools
+    with the registry, and the manifest is updated.
 
     If the PLAID_TOOLS_TO_ENABLE environment variable is set, only tools in the
     specified categories will be registered.
 
+    Args:
+        enabled_categories: Comma-separated list of enabled categories
+        use_manifest: Whether to serve unchanged tools from the manifest
+        manifest_path: Path to the manifest, defaults to the cache directory
+
     Returns:
         The registry with all tools registered
     """
@@ -210,6 +475,14 @@ def register_all_tools(enabled_categories: str) -> ToolRegistry:
     else:
         logger.info("All tool categories enabled")
 
+    manifest: Dict[str, Any] = {}
+    environment = ""
+    if use_manifest:
+        manifest_path = manifest_path or get_cache_dir() / MANIFEST_FILENAME
+        environment = environment_fingerprint(tools_dir.parent)
+        manifest = load_manifest(manifest_path, environment)
+    manifest_changed = False
+
     # Find all Python files in the tools directory and subdirectories that start with tool_
     for tool_file in tools_dir.glob("**/tool_*.py"):
         # Skip __init__.py and registry.py
@@ -225,11 +498,35 @@ def register_all_tools(enabled_categories: str) -> ToolRegistry:
         module_path = tool_file.relative_to(Path(__file__).parents[2])  # src directory
         module_name = str(module_path.with_suffix("")).replace(os.sep, ".")
 
+        fingerprint = _file_fingerprint(tool_file)
+        entry = manifest.get(module_name)
+        if use_manifest and fingerprint and entry and entry.get("fingerprint") == fingerprint:
+            for tool_entry in entry["tools"]:
+                registry_instance.register_lazy(
+                    types.Tool(**tool_entry["tool"]),
+                    module_name,
+                    tool_entry["handler"],
+                    max_concurrency=tool_entry.get("max_concurrency"),
+                )
+            continue
+
         try:
-            importlib.import_module(module_name)
+            _import_tool_module(registry_instance, module_name)
             logger.info(f"Imported tool module: {module_name}")
         except Exception as e:
             logger.error(f"Error importing tool module {module_name}: {e}")
+            continue
+
+        if use_manifest and fingerprint:
+            new_entry = _manifest_entry(
+                registry_instance, module_name, get_tool_category(tool_file), fingerprint
+            )
+            if new_entry is not None:
+                manifest[module_name] = new_entry
+                manifest_changed = True
+
+    if manifest_changed:
+        save_manifest(manifest_path, manifest, environment)
 
     return registry_instance
 
@@ -4,18 +4,25 @@ Documentation-related tools for the Plaid MCP server.
 This module implements tools related to Plaid documentation and Q&A.
 """
 
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, List, Optional
 
 import mcp.types as types
 import plaid
-from plaid.api import plaid_api
-from plaid.model.auth_get_request import AuthGetRequest
-from plaid.model.item_public_token_exchange_request import ItemPublicTokenExchangeRequest
-from plaid.model.products import Products
-from plaid.model.sandbox_public_token_create_request import SandboxPublicTokenCreateRequest
-from plaid.model.sandbox_public_token_create_request_options import SandboxPublicTokenCreateRequestOptions
 
-from mcp_server_plaid.tools.registry import registry
+from mcp_server_plaid.clients.datasets import DatasetStore, identify_dataset
+from mcp_server_plaid.clients.item_store import ItemStore
+from mcp_server_plaid.clients.plaid_async import PlaidClient
+from mcp_server_plaid.clients.sandbox import (
+    ACCOUNT_FIELDS,
+    DEFAULT_ACCOUNT_FIELDS,
+    create_sandbox_item,
+    parse_products,
+    products_pattern,
+    project_accounts,
+)
+from mcp_server_plaid.clients.token_pool import SandboxItemPool
+from mcp_server_plaid.tools.registry import ToolError, registry
 
 # Tool definition
 GET_SANDBOX_ACCESS_TOKEN_TOOL = types.Tool(
@@ -35,6 +42,7 @@ GET_SANDBOX_ACCESS_TOKEN_TOOL = types.Tool(
         "properties": {
             "initial_products": {
                 "type": "string",
+                "pattern": products_pattern(),
                 "description": """The plaid products to use for the access token, separated by commas. 
                 You should not pass `balance` in this array. The Balance product is fetched on demand 
                 so it doesn't require initialization through Link. Instead, you initialize with the 
@@ -51,9 +59,17 @@ GET_SANDBOX_ACCESS_TOKEN_TOOL = types.Tool(
                 "description": """The customized test used account data to be associated with the access token. User can 
                 use the tool `get_mock_data_prompt` to generate the mock data with the format we accept. You should always
                 ask the user if they want to use customized account data for the test. If they want to, use this tool to 
-                generate the mock data and pass the generated data to this tool. """,
+                generate the mock data and pass the generated data to this tool. If the data was registered with 
+                `register_dataset`, pass its handle (e.g. ds_3f2a9c0e1b7d4a65) instead of the JSON.""",
                 "default": "",
             },
+            "account_fields": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(ACCOUNT_FIELDS)},
+                "description": """For items with the transfer product, the account fields to return as JSON, e.g. 
+                add "balances" or "numbers" (account and routing numbers) when you need them. This is optional.""",
+                "default": list(DEFAULT_ACCOUNT_FIELDS),
+            },
         },
         "required": ["initial_products"],
     },
@@ -62,67 +78,68 @@ GET_SANDBOX_ACCESS_TOKEN_TOOL = types.Tool(
 
 # Tool handler
 async def handle_get_sandbox_access_token(
-        arguments: Dict[str, Any], *, plaid_client: plaid_api.PlaidApi, **_
+        arguments: Dict[str, Any],
+        *,
+        plaid_client: PlaidClient,
+        token_pool: Optional[SandboxItemPool] = None,
+        dataset_store: Optional[DatasetStore] = None,
+        item_store: Optional[ItemStore] = None,
+        **_,
 ) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    try:
-        # Create options with conditional assignments
-        options_kwargs = {}
+    webhook = arguments.get("webhook") or ""
+    customized_account_data = arguments.get("customized_account_data") or ""
+    products = parse_products(arguments["initial_products"])
 
-        # Only add webhook if it was provided and not empty
-        if arguments.get("webhook"):
-            options_kwargs["webhook"] = arguments.get("webhook")
+    dataset = identify_dataset(customized_account_data) if item_store is not None else None
+    if dataset_store is not None:
+        try:
+            customized_account_data = dataset_store.resolve(customized_account_data)
+        except ValueError as e:
+            raise ToolError(str(e)) from None
 
-        # Add username/password override only if customized data is provided
-        if arguments.get("customized_account_data"):
-            options_kwargs["override_username"] = "user_custom"
-            options_kwargs["override_password"] = arguments.get(
-                "customized_account_data"
+    try:
+        item = None
+        # Plain items can be served from the pre-warmed pool
+        if token_pool is not None and not webhook and not customized_account_data:
+            item = token_pool.take(products)
+
+        if item is None:
+            item = await create_sandbox_item(
+                plaid_client,
+                products,
+                webhook=webhook,
+                customized_account_data=customized_account_data,
             )
+        if item_store is not None:
+            item_store.record(item, products, webhook=webhook, dataset=dataset)
 
-        options = SandboxPublicTokenCreateRequestOptions(**options_kwargs)
-
-        # Convert comma-separated products to list of Products
-        product_list = [
-            Products(p.strip()) for p in arguments["initial_products"].split(",")
-        ]
-
-        pt_request = SandboxPublicTokenCreateRequest(
-            institution_id="ins_109508",
-            initial_products=product_list,
-            options=options,
-        )
-
-        # Get public token
-        pt_response = plaid_client.sandbox_public_token_create(pt_request)
+        text = f"Access Token: {item['access_token']}\nItem ID: {item['item_id']}"
+        if item["accounts"] is None:
+            return [types.TextContent(type="text", text=text)]
 
-        # Exchange for access token
-        exchange_request = ItemPublicTokenExchangeRequest(
-            public_token=pt_response["public_token"]
+        accounts = project_accounts(
+            item["accounts"],
+            item.get("numbers"),
+            arguments.get("account_fields") or DEFAULT_ACCOUNT_FIELDS,
         )
-        exchange_response = plaid_client.item_public_token_exchange(exchange_request)
-
-        text = f"Access Token: {exchange_response['access_token']}\nItem ID: {exchange_response['item_id']}"
-
-        if "transfer" in arguments.get("initial_products"):
-            # Call auth_get_request to get the accounts
-            auth_request = AuthGetRequest(
-                access_token=exchange_response["access_token"]
-            )
-            auth_response = plaid_client.auth_get(auth_request)
-
-            # Get the accounts
-            accounts = auth_response["accounts"]
-            text += f"\nAccounts: {accounts}"
-
-        # Return formatted response
-        return [types.TextContent(type="text", text=text)]
+        account_ids = ", ".join(account["account_id"] for account in item["accounts"])
+        text += f"\nAccounts: {len(accounts)} ({account_ids}), details in the attached JSON"
+        return [
+            types.TextContent(type="text", text=text),
+            types.EmbeddedResource(
+                type="resource",
+                resource=types.TextResourceContents(
+                    uri=f"plaid://sandbox/items/{item['item_id']}/accounts",
+                    mimeType="application/json",
+                    text=json.dumps(accounts, separators=(",", ":")),
+                ),
+            ),
+        ]
     except plaid.ApiException as e:
         error_code = getattr(e, "code", "unknown")
         error_message = getattr(e, "body", str(e))
-        return [
-            types.TextContent(type="text", text=f"Error {error_code}: {error_message}")
-        ]
+        raise ToolError(f"Error {error_code}: {error_message}") from None
 
 
 # Register the tool with the registry
-registry.register(GET_SANDBOX_ACCESS_TOKEN_TOOL, handle_get_sandbox_access_token)
+registry.register(GET_SANDBOX_ACCESS_TOKEN_TOOL, handle_get_sandbox_access_token, max_concurrency=4)
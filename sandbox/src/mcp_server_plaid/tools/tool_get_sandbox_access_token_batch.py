@@ -0,0 +1,206 @@
+"""
+Batch sandbox item tools for the Plaid MCP server.
+
+This module implements creating many sandbox items in one tool call, for
+setting up multi-user test scenarios.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import mcp.types as types
+import plaid
+
+from mcp_server_plaid.clients.datasets import DatasetStore, identify_dataset
+from mcp_server_plaid.clients.item_store import ItemStore
+from mcp_server_plaid.clients.plaid_async import PlaidClient
+from mcp_server_plaid.clients.sandbox import create_sandbox_item, parse_products, products_pattern
+from mcp_server_plaid.clients.token_pool import SandboxItemPool
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+# Upper bounds that keep a single call from flooding the sandbox
+MAX_BATCH_ITEMS = 100
+MAX_FAN_OUT = 20
+DEFAULT_FAN_OUT = 5
+
+# Tool definition
+GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL = types.Tool(
+    name="get_sandbox_access_token_batch",
+    description=f"""Create several Plaid sandbox items at once and get their access tokens, for example to
+    set up a multi-user test scenario. Items are created concurrently and the result is a compact table of
+    access tokens, item IDs and per-item errors. Use this instead of calling `get_sandbox_access_token`
+    repeatedly. At most {MAX_BATCH_ITEMS} items can be created per call.
+    <important>
+    BEFORE you call this tool:
+    - You MUST ask the user if they would like to provide the webhook url to listen to events update.
+    - You MUST ask the user if they would like to provide the customized account data to be associated with the items.
+      If they do, you MUST use the tool `get_mock_data_prompt` to generate the mock data with the format we accept.
+    </important>
+    """,
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "description": "The items to create",
+                "maxItems": MAX_BATCH_ITEMS,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "initial_products": {
+                            "type": "string",
+                            "pattern": products_pattern(),
+                            "description": """The plaid products to use for the item, separated by commas.
+                            You should not pass `balance` in this list.""",
+                        },
+                        "webhook": {
+                            "type": "string",
+                            "description": "The webhook to use for the item. This is optional.",
+                            "default": "",
+                        },
+                        "customized_account_data": {
+                            "type": "string",
+                            "description": """The customized account data to be associated with the item,
+                            generated with the format from `get_mock_data_prompt`, or the handle of data registered
+                            with `register_dataset`. This is optional.""",
+                            "default": "",
+                        },
+                        "count": {
+                            "type": "integer",
+                            "minimum": 1,
+                            "maximum": MAX_BATCH_ITEMS,
+                            "description": "Number of identical items to create from this spec",
+                            "default": 1,
+                        },
+                    },
+                    "required": ["initial_products"],
+                },
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": f"Maximum number of items created at the same time (1-{MAX_FAN_OUT})",
+                "default": DEFAULT_FAN_OUT,
+            },
+        },
+        "required": ["items"],
+    },
+)
+
+
+def _describe_error(error: Exception) -> str:
+    """Summarize an item creation error in one line."""
+    if isinstance(error, plaid.ApiException):
+        try:
+            body = json.loads(error.body or "")
+            return f"{body.get('error_code', error.status)}: {body.get('error_message', '')}".strip()
+        except (TypeError, ValueError):
+            return f"{error.status}: {error.reason}"
+    return str(error).replace("\n", " ")
+
+
+def _table_cell(value: Any) -> str:
+    """Render a value in a markdown table cell."""
+    return str(value or "").replace("|", "\\|")
+
+
+# Tool handler
+async def handle_get_sandbox_access_token_batch(
+        arguments: Dict[str, Any],
+        *,
+        plaid_client: PlaidClient,
+        token_pool: Optional[SandboxItemPool] = None,
+        dataset_store: Optional[DatasetStore] = None,
+        item_store: Optional[ItemStore] = None,
+        **_,
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    items = arguments.get("items") or []
+    counts = [max(1, int(spec.get("count") or 1)) for spec in items]
+    # Checked before expanding the specs, so huge counts cost nothing
+    total = sum(counts)
+    if not total:
+        raise ToolError("No items to create.")
+    if total > MAX_BATCH_ITEMS:
+        raise ToolError(f"Too many items requested ({total}); at most {MAX_BATCH_ITEMS} can be created per call.")
+
+    # Expand item specs by their count
+    specs: List[Dict[str, Any]] = []
+    for spec, count in zip(items, counts):
+        specs.extend([spec] * count)
+
+    # Identify each distinct dataset once, for recording the items
+    datasets: Dict[str, Optional[str]] = {}
+    if item_store is not None:
+        for spec in specs:
+            value = spec.get("customized_account_data") or ""
+            if value not in datasets:
+                datasets[value] = identify_dataset(value)
+
+    fan_out = min(MAX_FAN_OUT, max(1, int(arguments.get("max_concurrency") or DEFAULT_FAN_OUT)))
+    semaphore = asyncio.Semaphore(fan_out)
+
+    async def create(spec: Dict[str, Any]) -> Dict[str, Any]:
+        webhook = spec.get("webhook") or ""
+        customized_account_data = spec.get("customized_account_data") or ""
+        dataset = datasets.get(customized_account_data)
+        try:
+            products = parse_products(spec["initial_products"])
+            if dataset_store is not None:
+                customized_account_data = dataset_store.resolve(customized_account_data)
+            item = None
+            # Plain items can be served from the pre-warmed pool
+            if token_pool is not None and not webhook and not customized_account_data:
+                item = token_pool.take(products)
+            if item is None:
+                async with semaphore:
+                    item = await create_sandbox_item(
+                        plaid_client,
+                        products,
+                        webhook=webhook,
+                        customized_account_data=customized_account_data,
+                    )
+        except Exception as e:
+            return {"error": _describe_error(e)}
+        if item_store is not None:
+            item_store.record(item, products, webhook=webhook, dataset=dataset)
+        return item
+
+    results = await asyncio.gather(*(create(spec) for spec in specs))
+
+    with_accounts = any(result.get("accounts") for result in results)
+    header = ["#", "products", "access_token", "item_id"]
+    if with_accounts:
+        header.append("account_ids")
+    header.append("error")
+
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "---|" * len(header),
+    ]
+    for number, (spec, result) in enumerate(zip(specs, results), start=1):
+        row = [
+            number,
+            spec.get("initial_products", ""),
+            result.get("access_token"),
+            result.get("item_id"),
+        ]
+        if with_accounts:
+            row.append(", ".join(
+                account["account_id"] for account in result.get("accounts") or []
+            ))
+        row.append(result.get("error"))
+        lines.append("| " + " | ".join(_table_cell(cell) for cell in row) + " |")
+
+    failed = sum(1 for result in results if "error" in result)
+    summary = f"Created {len(results) - failed} of {len(results)} sandbox items."
+    text = summary + "\n\n" + "\n".join(lines)
+    # Partly failed batches still hand out the created items
+    if failed == len(results):
+        raise ToolError(text)
+    return [types.TextContent(type="text", text=text)]
+
+
+# Register the tool with the registry
+registry.register(
+    GET_SANDBOX_ACCESS_TOKEN_BATCH_TOOL, handle_get_sandbox_access_token_batch, max_concurrency=2
+)
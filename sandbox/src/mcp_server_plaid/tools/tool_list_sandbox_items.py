@@ -0,0 +1,101 @@
+"""
+Sandbox item lookup tool for the Plaid MCP server.
+
+This module implements listing the sandbox items the server created earlier,
+so agents can reuse an existing access token instead of creating an item.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import mcp.types as types
+
+from mcp_server_plaid.clients.item_store import ItemStore
+from mcp_server_plaid.clients.sandbox import parse_products, products_pattern
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+MAX_LISTED_ITEMS = 100
+
+# Tool definition
+LIST_SANDBOX_ITEMS_TOOL = types.Tool(
+    name="list_sandbox_items",
+    description="""List the sandbox items this server created earlier, newest first, with their access tokens,
+    products, webhook, dataset handle and account ids. This is a local lookup with no Plaid round trip: check it for
+    an item with the products and dataset you need before calling `get_sandbox_access_token`, and reuse its access
+    token. If Plaid rejects a reused token, create a new item.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "products": {
+                "type": "string",
+                "pattern": products_pattern(),
+                "description": "Only items created with exactly these products, separated by commas, in any order",
+            },
+            "dataset": {
+                "type": "string",
+                "description": """Only items created with this customized account data handle (see
+                `register_dataset`), or "none" for items created without customized account data""",
+            },
+            "webhook": {
+                "type": "string",
+                "description": "Only items created with this webhook URL",
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": MAX_LISTED_ITEMS,
+                "description": "Maximum number of items to list",
+                "default": 10,
+            },
+        },
+    },
+)
+
+
+def _table_cell(value: Any) -> str:
+    """Render a value in a markdown table cell."""
+    return str(value or "").replace("|", "\\|")
+
+
+# Tool handler
+async def handle_list_sandbox_items(
+        arguments: Dict[str, Any], *, item_store: Optional[ItemStore] = None, **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    if item_store is None:
+        raise ToolError("The sandbox item registry is not available.")
+
+    dataset = arguments.get("dataset")
+    items = item_store.find(
+        products=parse_products(arguments.get("products") or ""),
+        dataset="" if dataset == "none" else dataset,
+        webhook=arguments.get("webhook"),
+        limit=int(arguments.get("limit") or 10),
+    )
+    if not items:
+        return [
+            types.TextContent(
+                type="text",
+                text="No recorded sandbox items match. Create one with get_sandbox_access_token.",
+            )
+        ]
+
+    lines = [
+        "| created | products | access_token | item_id | dataset | webhook | account_ids |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for item in items:
+        row = [
+            time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(item["created_at"])),
+            item["products"],
+            item["access_token"],
+            item["item_id"],
+            item["dataset"],
+            item["webhook"],
+            ", ".join(account["account_id"] for account in item["accounts"] or []),
+        ]
+        lines.append("| " + " | ".join(_table_cell(cell) for cell in row) + " |")
+    return [types.TextContent(type="text", text="\n".join(lines))]
+
+
+# Register the tool with the registry
+registry.register(LIST_SANDBOX_ITEMS_TOOL, handle_list_sandbox_items)
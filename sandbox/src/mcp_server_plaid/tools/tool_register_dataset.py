@@ -0,0 +1,65 @@
+"""
+Dataset registration tool for the Plaid MCP server.
+
+This module implements registering customized account data once, so the
+sandbox item tools can refer to it by a short handle.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import mcp.types as types
+
+from mcp_server_plaid.clients.datasets import DatasetStore
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+# Tool definition
+REGISTER_DATASET_TOOL = types.Tool(
+    name="register_dataset",
+    description="""Register customized account data (the custom user JSON from `get_mock_data_prompt` or
+    `generate_mock_data`) once and get a short handle such as `ds_3f2a9c0e1b7d4a65`. Pass the handle as
+    `customized_account_data` to `get_sandbox_access_token` or `get_sandbox_access_token_batch` instead of the
+    full JSON, which keeps the payload out of every call. Registering the same data again returns the same handle.
+    Provide either `path` (e.g. mock_data.json) or `data`.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "A JSON file holding the data, e.g. mock_data.json",
+            },
+            "data": {
+                "type": "string",
+                "description": "The stringified custom user JSON, when it is not in a file",
+            },
+        },
+    },
+)
+
+
+# Tool handler
+async def handle_register_dataset(
+        arguments: Dict[str, Any], *, dataset_store: DatasetStore, **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    path = arguments.get("path")
+    data = arguments.get("data")
+    if bool(path) == bool(data):
+        raise ToolError("Provide either path or data, not both.")
+
+    try:
+        handle = dataset_store.register_file(Path(path)) if path else dataset_store.register(data)
+    except ValueError as e:
+        raise ToolError(str(e)) from None
+
+    size = len(dataset_store.get(handle))
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Dataset handle: {handle} ({size} bytes minified). "
+                 "Pass it as customized_account_data instead of the JSON.",
+        )
+    ]
+
+
+# Register the tool with the registry
+registry.register(REGISTER_DATASET_TOOL, handle_register_dataset)
@@ -4,13 +4,18 @@ Documentation-related tools for the Plaid MCP server.
 This module implements tools related to Plaid documentation and Q&A.
 """
 
-from typing import Any, Dict, List
+import logging
+from typing import Any, Dict, List, Optional
 
 import mcp.types as types
 
-from mcp_server_plaid.clients.bill import AskBillClient
+from mcp_server_plaid.clients.bill import TYPE_SOURCES, AskBillClient
+from mcp_server_plaid.clients.cache import TTLCache, normalize_question
+from mcp_server_plaid.tools.progress import ProgressReporter
 from mcp_server_plaid.tools.registry import registry
 
+logger = logging.getLogger("plaid-mcp-server.tools.search_documentation")
+
 # Tool definition
 SEARCH_DOCUMENTATION_TOOL = types.Tool(
     name="search_documentation",
@@ -58,17 +63,59 @@ def _format_sources(sources: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+def _render_answer(answer: str, formatted_sources: str) -> str:
+    """Append the formatted sources section to an answer, if there are any."""
+    if formatted_sources:
+        return f"{answer.rstrip()}\n\n## Sources\n{formatted_sources}"
+    return answer
+
+
 # Tool handler
 async def handle_search_documentation(
-        arguments: Dict[str, Any], *, bill_client: AskBillClient, **_
+        arguments: Dict[str, Any],
+        *,
+        bill_client: AskBillClient,
+        answer_cache: Optional[TTLCache] = None,
+        progress: Optional[ProgressReporter] = None,
+        **_,
 ) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    response = await bill_client.ask_question(question=arguments["question"])
+    question = arguments["question"]
+    cache_key = normalize_question(question)
+
+    if answer_cache is not None:
+        cached = answer_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Answer cache hit ({answer_cache.stats()})")
+            return [
+                types.TextContent(
+                    type="text",
+                    text=_render_answer(cached["answer"], cached["formatted_sources"]),
+                )
+            ]
+        logger.debug(f"Answer cache miss ({answer_cache.stats()})")
+
+    on_chunk = None
+    if progress is not None:
+        # Stream answer pieces and sources to the client as they arrive; the
+        # final result still carries the complete answer
+        async def on_chunk(response_type: str, payload: Any) -> None:
+            if response_type == TYPE_SOURCES:
+                await progress.report(f"## Sources\n{_format_sources(payload)}")
+            else:
+                await progress.report(payload)
+
+    response = await bill_client.ask_question(question=question, on_chunk=on_chunk)
     answer = str(response["answer"])
     sources = response.get("sources") or []
     formatted_sources = _format_sources(sources)
-    if formatted_sources:
-        answer = f"{answer.rstrip()}\n\n## Sources\n{formatted_sources}"
-    return [types.TextContent(type="text", text=answer)]
+
+    # Only complete answers are worth replaying
+    if answer_cache is not None and answer.strip() and not response.get("timed_out"):
+        answer_cache.set(
+            cache_key, {"answer": answer, "formatted_sources": formatted_sources}
+        )
+
+    return [types.TextContent(type="text", text=_render_answer(answer, formatted_sources))]
 
 
-registry.register(SEARCH_DOCUMENTATION_TOOL, handle_search_documentation)
+registry.register(SEARCH_DOCUMENTATION_TOOL, handle_search_documentation, max_concurrency=4)
@@ -0,0 +1,65 @@
+"""
+Offline guide search tool for the Plaid MCP server.
+
+This module implements a local search over the bundled Plaid integration guides
+that works without network access.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import mcp.types as types
+
+from mcp_server_plaid.clients.guides import GuideIndex
+from mcp_server_plaid.tools.registry import ToolError, registry
+
+# Tool definition
+SEARCH_INTEGRATION_GUIDES_TOOL = types.Tool(
+    name="search_integration_guides",
+    description="""Search the bundled Plaid sandbox integration guides (Transactions, Transfer and Signal)
+    locally. Returns the best matching guide sections ranked by relevance. This search is instant and works
+    offline, so prefer it for step-by-step integration questions covered by these guides, and fall back to
+    `search_documentation` for anything else.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "keywords or question in natural language",
+            },
+            "top_k": {
+                "type": "integer",
+                "description": "maximum number of guide sections to return",
+                "default": 3,
+            },
+        },
+        "required": ["query"],
+    },
+)
+
+
+# Tool handler
+async def handle_search_integration_guides(
+        arguments: Dict[str, Any], *, guide_index: Optional[GuideIndex] = None, **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    if guide_index is None or not len(guide_index):
+        raise ToolError("Integration guides are not available. Use `search_documentation` instead.")
+
+    top_k = max(1, int(arguments.get("top_k") or 3))
+    results = guide_index.search(arguments["query"], top_k=top_k)
+    if not results:
+        return [
+            types.TextContent(
+                type="text",
+                text="No matching guide sections found. Try `search_documentation` instead.",
+            )
+        ]
+
+    parts = [
+        f"## {result['path']}\n_Source: {result['source']} (score {result['score']:.2f})_\n\n{result['text']}"
+        for result in results
+    ]
+    return [types.TextContent(type="text", text="\n\n".join(parts))]
+
+
+# Register the tool with the registry
+registry.register(SEARCH_INTEGRATION_GUIDES_TOOL, handle_search_integration_guides)
@@ -0,0 +1,48 @@
+"""
+Server statistics tool for the Plaid MCP server.
+
+This module implements a tool reporting the server's own metrics: per-tool
+call counts, errors and latency percentiles, upstream Plaid and AskBill
+timings, and the state of caches, pools and limits.
+"""
+
+import json
+from typing import Any, Dict, List
+
+import mcp.types as types
+
+from mcp_server_plaid.metrics import metrics
+from mcp_server_plaid.tools.registry import registry
+
+# Tool definition
+SERVER_STATS_TOOL = types.Tool(
+    name="server_stats",
+    description="""Report this MCP server's runtime statistics: call counts, error counts, in-flight calls and
+    latency percentiles (in seconds) per tool and per upstream Plaid endpoint or AskBill, plus the state of the
+    documentation answer cache, the sandbox item pool and the concurrency limits. Use it to find out which tools
+    are slow or failing.""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "format": {
+                "type": "string",
+                "enum": ["json", "prometheus"],
+                "description": "json for a summary, prometheus for the full metrics in the Prometheus text format",
+                "default": "json",
+            },
+        },
+    },
+)
+
+
+# Tool handler
+async def handle_server_stats(
+        arguments: Dict[str, Any], **_
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    if arguments.get("format") == "prometheus":
+        return [types.TextContent(type="text", text=metrics.render_prometheus())]
+    return [types.TextContent(type="text", text=json.dumps(metrics.snapshot(), indent=2))]
+
+
+# Register the tool with the registry
+registry.register(SERVER_STATS_TOOL, handle_server_stats)
@@ -0,0 +1,200 @@
+"""
+Validation of tool arguments against the tools' input schemas.
+
+This module compiles a tool's ``inputSchema`` once into a tree of small check
+functions, so every call is validated without interpreting the schema again.
+It supports the JSON Schema keywords the tools use: ``type``, ``enum``,
+``const``, ``properties``, ``required``, ``additionalProperties``, ``items``,
+``minItems``/``maxItems``, ``minLength``/``maxLength``, ``pattern``,
+``minimum``/``maximum``, ``exclusiveMinimum``/``exclusiveMaximum`` and
+``anyOf``. Other keywords are ignored.
+
+Optional properties set to null are treated as omitted, as the handlers do.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+# (path, message) pairs describing what is wrong with the arguments
+Errors = List[Tuple[str, str]]
+# Checks a value at a path, appending any errors
+Check = Callable[[Any, str, Errors], None]
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+        or isinstance(value, float) and value.is_integer()
+    ),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+# Longest value quoted in error messages
+_MAX_QUOTED = 60
+
+
+class InvalidArgumentsError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema."""
+
+    def __init__(self, tool: str, errors: Errors):
+        self.tool = tool
+        self.errors = errors
+        details = "; ".join(f"{path or '(arguments)'}: {message}" for path, message in errors)
+        super().__init__(f"Invalid arguments for tool {tool}: {details}")
+
+
+def _quote(value: Any) -> str:
+    text = json.dumps(value, default=str)
+    return text if len(text) <= _MAX_QUOTED else text[:_MAX_QUOTED] + "..."
+
+
+def _join(path: str, key: Any) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """Compile a schema into a single check."""
+    checks: List[Check] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        matchers = [_TYPES[name] for name in names if name in _TYPES]
+        expected = " or ".join(names)
+        if matchers:
+            def check_type(value: Any, path: str, errors: Errors) -> None:
+                if not any(matcher(value) for matcher in matchers):
+                    errors.append((path, f"expected {expected}, got {_quote(value)}"))
+            checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        allowed_text = ", ".join(_quote(item) for item in allowed)
+
+        def check_enum(value: Any, path: str, errors: Errors) -> None:
+            if value not in allowed:
+                errors.append((path, f"{_quote(value)} is not one of {allowed_text}"))
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value: Any, path: str, errors: Errors) -> None:
+            if value != const:
+                errors.append((path, f"must be {_quote(const)}"))
+        checks.append(check_const)
+
+    for keyword, compare, describe in (
+            ("minimum", lambda value, bound: value >= bound, "at least"),
+            ("maximum", lambda value, bound: value <= bound, "at most"),
+            ("exclusiveMinimum", lambda value, bound: value > bound, "greater than"),
+            ("exclusiveMaximum", lambda value, bound: value < bound, "less than"),
+    ):
+        if keyword in schema:
+            def check_bound(value: Any, path: str, errors: Errors, bound=schema[keyword], compare=compare,
+                            describe=describe) -> None:
+                if _TYPES["number"](value) and not compare(value, bound):
+                    errors.append((path, f"must be {describe} {bound}, got {value}"))
+            checks.append(check_bound)
+
+    for keyword, compare, describe, kind, unit in (
+            ("minLength", lambda size, bound: size >= bound, "at least", str, "characters"),
+            ("maxLength", lambda size, bound: size <= bound, "at most", str, "characters"),
+            ("minItems", lambda size, bound: size >= bound, "at least", list, "items"),
+            ("maxItems", lambda size, bound: size <= bound, "at most", list, "items"),
+    ):
+        if keyword in schema:
+            def check_size(value: Any, path: str, errors: Errors, bound=schema[keyword], compare=compare,
+                           describe=describe, kind=kind, unit=unit) -> None:
+                if isinstance(value, kind) and not compare(len(value), bound):
+                    errors.append((path, f"must have {describe} {bound} {unit}, got {len(value)}"))
+            checks.append(check_size)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, errors: Errors) -> None:
+            if isinstance(value, str) and not pattern.search(value):
+                errors.append((path, f"{_quote(value)} does not match {pattern.pattern}"))
+        checks.append(check_pattern)
+
+    if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+        properties = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+        required = list(schema.get("required", []))
+        additional = schema.get("additionalProperties", True)
+        check_additional = _compile(additional) if isinstance(additional, dict) else None
+
+        def check_object(value: Any, path: str, errors: Errors) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if value.get(name) is None:
+                    errors.append((_join(path, name), "is required"))
+            for name, item in value.items():
+                check = properties.get(name)
+                if check is not None:
+                    if item is not None or name in required:
+                        check(item, _join(path, name), errors)
+                elif additional is False:
+                    errors.append((_join(path, name), "is not a known argument"))
+                elif check_additional is not None:
+                    check_additional(item, _join(path, name), errors)
+        checks.append(check_object)
+
+    if isinstance(schema.get("items"), dict):
+        check_item = _compile(schema["items"])
+
+        def check_items(value: Any, path: str, errors: Errors) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, _join(path, index), errors)
+        checks.append(check_items)
+
+    if "anyOf" in schema:
+        options = [_compile(sub) for sub in schema["anyOf"]]
+
+        def check_any_of(value: Any, path: str, errors: Errors) -> None:
+            attempts = []
+            for option in options:
+                option_errors: Errors = []
+                option(value, path, option_errors)
+                if not option_errors:
+                    return
+                attempts.append(option_errors)
+            # Report the alternative that came closest
+            errors.extend(min(attempts, key=len))
+        checks.append(check_any_of)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str, errors: Errors) -> None:
+        for check in checks:
+            check(value, path, errors)
+    return check_all
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], Errors]:
+    """
+    Compile an input schema into a validator.
+
+    Args:
+        schema: The tool's input schema
+
+    Returns:
+        A function returning the (path, message) errors for some arguments, empty if they are valid
+    """
+    check = _compile(schema)
+
+    def validate(arguments: Any) -> Errors:
+        errors: Errors = []
+        check(arguments, "", errors)
+        return errors
+
+    return validate
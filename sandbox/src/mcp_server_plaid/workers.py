@@ -0,0 +1,332 @@
+"""
+Pre-fork worker mode for the HTTP transport.
+
+This module runs several worker processes that accept MCP sessions from one
+listening socket, so JSON-RPC parsing, Plaid model (de)serialization and
+result formatting are spread over several cores.
+
+An MCP session over SSE is one long-lived GET stream plus many POSTed
+messages, and the kernel may hand each POST to any worker. Each worker
+therefore also listens on a private loopback port and announces a message
+endpoint containing that port (``/messages/<port>/``). A worker receiving a
+message for a session it does not own forwards it to the owner's private
+port, so every session stays on the worker that opened it.
+
+Workers can be recycled after a number of tool calls to bound memory growth.
+A recycling worker stops accepting new sessions, a replacement is forked
+straight away, and the old worker exits once its open sessions have closed or
+the drain timeout has passed. Sessions still open at the timeout are cut off,
+and their clients have to reconnect; a timeout of 0 waits for them however
+long they stay open.
+"""
+
+import asyncio
+import contextlib
+import ctypes
+import logging
+import os
+import re
+import signal
+import socket
+import time
+from multiprocessing import sharedctypes
+from typing import Awaitable, Callable, Optional, Set, Tuple
+
+import httpx
+import mcp.types as types
+import uvicorn
+from mcp.server import Server
+from mcp.server.models import InitializationOptions
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from mcp_server_plaid.http_server import MESSAGES_PATH, SSE_PATH, create_app, warn_if_exposed
+
+logger = logging.getLogger("plaid-mcp-server.workers")
+
+# Creates the MCP server inside a worker process, pushing the cleanup of its
+# clients to the given stack
+ServerFactory = Callable[[contextlib.AsyncExitStack], Awaitable[Tuple[Server, InitializationOptions]]]
+
+# How often the parent process checks on its workers
+SUPERVISE_INTERVAL = 0.2
+# Seconds to wait before replacing a worker that crashed right after starting
+CRASH_BACKOFF = 1.0
+# Seconds workers get to exit when the pool shuts down
+SHUTDOWN_TIMEOUT = 10.0
+
+_MESSAGE_PORT = re.compile(rf"{re.escape(MESSAGES_PATH)}(\d+)/$")
+
+
+class WorkerSlot(ctypes.Structure):
+    """State of one worker, shared between the parent and all workers."""
+
+    _fields_ = [
+        ("pid", ctypes.c_int),
+        # Private port the worker serves its sessions' messages on, 0 until bound
+        ("port", ctypes.c_int),
+        # Whether the worker stopped accepting new sessions
+        ("draining", ctypes.c_int),
+    ]
+
+
+class MessageRouter:
+    """ASGI app delivering posted messages to the worker that owns the session."""
+
+    def __init__(
+            self,
+            port: int,
+            local_app: ASGIApp,
+            peer_ports: Callable[[], Set[int]],
+            client: httpx.AsyncClient,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            port: This worker's private port
+            local_app: App handling messages of this worker's sessions
+            peer_ports: Returns the private ports of all running workers
+            client: HTTP client used to forward messages to other workers
+        """
+        self.port = port
+        self.local_app = local_app
+        self.peer_ports = peer_ports
+        self.client = client
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        match = _MESSAGE_PORT.match(scope["path"])
+        target = int(match.group(1)) if match else None
+        if target == self.port:
+            await self.local_app(scope, receive, send)
+            return
+
+        if target is None or target not in self.peer_ports():
+            response = Response("Could not find session", status_code=404)
+            await response(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        try:
+            forwarded = await self.client.post(
+                f"http://127.0.0.1:{target}{MESSAGES_PATH}{target}/",
+                params=request.query_params,
+                content=await request.body(),
+                headers={"content-type": request.headers.get("content-type", "application/json")},
+            )
+            response = Response(
+                forwarded.content,
+                status_code=forwarded.status_code,
+                media_type=forwarded.headers.get("content-type"),
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not forward message to worker on port {target}: {e}")
+            response = Response("Session worker unavailable", status_code=503)
+        await response(scope, receive, send)
+
+
+class WorkerPool:
+    """Runs MCP HTTP workers in forked processes sharing one listening socket."""
+
+    def __init__(
+            self,
+            make_server: ServerFactory,
+            workers: int = 2,
+            host: str = "127.0.0.1",
+            port: int = 8000,
+            max_sessions: int = 0,
+            max_calls: int = 0,
+            drain_timeout: float = 300.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            make_server: Creates the MCP server in each worker process
+            workers: Number of worker processes accepting sessions
+            host: Interface to listen on
+            port: Port to listen on
+            max_sessions: Maximum number of concurrent sessions per worker (0 means unlimited)
+            max_calls: Tool calls after which a worker is recycled (0 disables recycling)
+            drain_timeout: Maximum seconds a recycled worker waits for its sessions to close
+                (0 waits as long as they stay open)
+        """
+        self.make_server = make_server
+        self.workers = max(1, workers)
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.max_calls = max_calls
+        self.drain_timeout = drain_timeout
+
+        self._listener: Optional[socket.socket] = None
+        # Twice the worker count, so recycled workers can drain next to their replacements
+        self._slots = None
+        self._started_at: dict = {}
+        self._respawn_after = 0.0
+        self._stopping = False
+
+    def peer_ports(self) -> Set[int]:
+        """Get the private ports of all running workers."""
+        return {slot.port for slot in self._slots if slot.pid and slot.port}
+
+    def run(self) -> None:
+        """Bind the listening socket and supervise the workers until SIGTERM or SIGINT."""
+        warn_if_exposed(self.host)
+        # Bound before forking, so every worker accepts from the same socket
+        self._listener = socket.create_server((self.host, self.port), backlog=2048)
+        self._slots = sharedctypes.Array(WorkerSlot, self.workers * 2, lock=False)
+
+        def stop(signum, frame):
+            self._stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        port = self._listener.getsockname()[1]
+        logger.info(f"Serving MCP over HTTP at http://{self.host}:{port}{SSE_PATH} with {self.workers} workers")
+        try:
+            while not self._stopping:
+                self._reap()
+                self._spawn_missing()
+                time.sleep(SUPERVISE_INTERVAL)
+        finally:
+            self._shutdown()
+
+    def _spawn_missing(self) -> None:
+        """Fork workers until enough of them accept new sessions."""
+        if time.monotonic() < self._respawn_after:
+            return
+        accepting = sum(1 for slot in self._slots if slot.pid and not slot.draining)
+        for _ in range(self.workers - accepting):
+            free = next((i for i, slot in enumerate(self._slots) if not slot.pid), None)
+            if free is None:
+                return
+            self._spawn(free)
+
+    def _spawn(self, index: int) -> None:
+        """Fork a worker into a free slot."""
+        slot = self._slots[index]
+        slot.port = 0
+        slot.draining = 0
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                slot.pid = os.getpid()
+                asyncio.run(self._serve_worker(index))
+            except BaseException:
+                logger.exception("Worker failed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        slot.pid = pid
+        self._started_at[pid] = time.monotonic()
+        logger.info(f"Started worker {pid}")
+
+    def _reap(self) -> None:
+        """Free the slots of workers that exited."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            for slot in self._slots:
+                if slot.pid == pid:
+                    slot.pid = slot.port = slot.draining = 0
+            started_at = self._started_at.pop(pid, 0.0)
+            exit_code = os.waitstatus_to_exitcode(status)
+            if exit_code != 0 and not self._stopping:
+                logger.warning(f"Worker {pid} exited with code {exit_code}")
+                # Don't fork in a tight loop when workers crash on startup
+                if time.monotonic() - started_at < 5:
+                    self._respawn_after = time.monotonic() + CRASH_BACKOFF
+            else:
+                logger.info(f"Worker {pid} exited")
+
+    def _shutdown(self) -> None:
+        """Stop all workers, killing those that don't exit in time."""
+        pids = [slot.pid for slot in self._slots if slot.pid]
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        while any(slot.pid for slot in self._slots) and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.05)
+        for slot in self._slots:
+            if slot.pid:
+                logger.warning(f"Killing worker {slot.pid}")
+                try:
+                    os.kill(slot.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        self._listener.close()
+
+    async def _serve_worker(self, index: int) -> None:
+        """Serve MCP sessions in a worker process."""
+        slot = self._slots[index]
+        private = socket.create_server(("127.0.0.1", 0))
+        port = private.getsockname()[1]
+
+        async with contextlib.AsyncExitStack() as resources, httpx.AsyncClient(timeout=30.0) as client:
+            server, initialization_options = await self.make_server(resources)
+            app = create_app(
+                server,
+                initialization_options,
+                max_sessions=self.max_sessions,
+                messages_path=f"{MESSAGES_PATH}{port}/",
+                message_router=lambda local_app: MessageRouter(port, local_app, self.peer_ports, client),
+            )
+            config = uvicorn.Config(app, log_level="warning", lifespan="off", timeout_graceful_shutdown=5)
+            uvicorn_server = uvicorn.Server(config)
+            if self.max_calls:
+                self._recycle_after_calls(server, lambda: self._drain(uvicorn_server, app.state.sse_endpoint, slot))
+
+            slot.port = port
+            try:
+                # The shared socket comes first, so servers[0] is the one to stop when draining
+                await uvicorn_server.serve(sockets=[self._listener, private])
+            finally:
+                slot.port = 0
+
+    def _recycle_after_calls(self, server: Server, drain: Callable[[], Awaitable[None]]) -> None:
+        """Start draining the worker once it has handled max_calls tool calls."""
+        handler = server.request_handlers[types.CallToolRequest]
+        calls = 0
+
+        async def counting_handler(request: types.CallToolRequest):
+            nonlocal calls
+            calls += 1
+            if calls == self.max_calls:
+                asyncio.get_running_loop().create_task(drain())
+            return await handler(request)
+
+        server.request_handlers[types.CallToolRequest] = counting_handler
+
+    async def _drain(self, uvicorn_server: uvicorn.Server, sse_endpoint, slot: WorkerSlot) -> None:
+        """Stop accepting sessions, let the open ones finish, then exit."""
+        logger.info(f"Worker {os.getpid()} reached {self.max_calls} tool calls, recycling")
+        slot.draining = 1
+        uvicorn_server.servers[0].close()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.drain_timeout if self.drain_timeout else float("inf")
+        while sse_endpoint.active_sessions and loop.time() < deadline:
+            await asyncio.sleep(0.5)
+        if sse_endpoint.active_sessions:
+            logger.warning(
+                f"Worker {os.getpid()} closing {sse_endpoint.active_sessions} sessions still open after "
+                f"{self.drain_timeout:g}s"
+            )
+        uvicorn_server.should_exit = True